@@ -0,0 +1,238 @@
+# advisor.py
+"""
+Conseiller de choix de salle: estime la probabilité de victoire de chacune
+des 3 salles proposées dans la modale.
+
+Recherche Monte Carlo (MCTS à un niveau de décision, nœuds de hasard
+moyennés comme en expectimax):
+    - la racine répartit les simulations entre les options par UCB1
+    - une simulation pose la salle, applique son effet avec les vrais
+      tirages (poids de rareté du catalogue, apply_room_effect), puis joue
+      une politique rapide vers la sortie jusqu'à victoire ou plus de pas
+    - chaque état "on vient d'entrer dans une salle" (avant l'effet) est
+      identifié par son empreinte de Zobrist; la table de transposition
+      garde (victoires, visites) par empreinte et survit d'une recherche à
+      l'autre, donc un état déjà exploré n'est pas ré-estimé de zéro.
+
+La recherche tourne sur un thread de travail avec un budget de temps
+(ADVISOR_BUDGET_MS); la modale lit le dernier résultat avec advice().
+on_ready est appelé (sur le thread de travail) quand un résultat est publié.
+"""
+
+import copy
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+
+from player import Player
+from effects import apply_room_effect, can_enter, pay_entry
+from rooms_catalog import get_catalog, draw_room_choices
+from zobrist import state_hash
+
+ADVISOR_BUDGET_MS = 20
+MAX_ROLLOUT_ACTIONS = 200
+GREEDY = 0.8            # probabilité de se rapprocher de la sortie dans la politique de simulation
+UCB_C = 1.4
+TT_MAX_ENTRIES = 200_000
+
+
+@dataclass
+class Advice:
+    """Résultat d'une recherche: une estimation par option (None si l'option est impossible)."""
+    request_id: int
+    win_rates: list
+    visits: list
+    rollouts: int
+    elapsed_ms: float
+
+
+def enter_new_room(room, r: int, c: int, grid, player, inventory):
+    """Paiement, pose et déplacement (mêmes règles que la modale), sans l'effet."""
+    pay_entry(room, inventory)
+    grid.set_room(r, c, room)
+    player.move_to(r, c)
+
+
+class _Snapshot:
+    """Copie indépendante de la partie, modifiable par une simulation."""
+
+    __slots__ = ("grid", "inventory", "player")
+
+    def __init__(self, grid, player, inventory):
+        self.grid = copy.copy(grid)
+        self.grid.grid = [row[:] for row in grid.grid]
+        self.grid.discovered = [row[:] for row in grid.discovered]
+        self.inventory = replace(inventory)
+        self.player = Player(start_row=player.row, start_col=player.col, inventory=self.inventory)
+
+    def clone(self) -> "_Snapshot":
+        return _Snapshot(self.grid, self.player, self.inventory)
+
+    def hash(self) -> int:
+        return state_hash(self.grid, self.player, self.inventory)
+
+
+class RoomAdvisor:
+    """Thread de recherche; request() remplace la demande en cours."""
+
+    def __init__(self, budget_ms: float = ADVISOR_BUDGET_MS, seed: int | None = None, on_ready=None):
+        self.budget_ms = budget_ms
+        self.on_ready = on_ready
+        self.enabled = True  # False: request() n'analyse rien (bench.py, pas de thread en parallèle)
+        self.rng = random.Random(seed)
+        self.catalog = get_catalog()
+        self.table: dict[int, list] = {}  # empreinte -> [victoires, visites]
+        self._cond = threading.Condition()
+        self._request = None
+        self._request_id = 0
+        self._advice: Advice | None = None
+        self._active = False
+        self._thread = None
+
+    # --------------------
+    # API (thread principal)
+    # --------------------
+    def request(self, grid, player, inventory, options: list, target: tuple) -> int:
+        """Lance l'analyse des options pour la case target. Retourne l'id de la demande."""
+        if not self.enabled:
+            self.cancel()
+            return self._request_id
+        snapshot = _Snapshot(grid, player, inventory)
+        with self._cond:
+            self._request_id += 1
+            self._request = (self._request_id, snapshot, list(options), target)
+            self._active = True
+            self._cond.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="room-advisor", daemon=True)
+            self._thread.start()
+        return self._request_id
+
+    def cancel(self):
+        with self._cond:
+            self._request_id += 1
+            self._request = None
+            self._active = False
+
+    def pending(self) -> bool:
+        """True tant que la demande courante n'a pas de résultat."""
+        with self._cond:
+            return self._active and (self._advice is None or self._advice.request_id != self._request_id)
+
+    def advice(self) -> Advice | None:
+        """Dernier résultat pour la demande courante (None tant qu'il n'est pas prêt)."""
+        advice = self._advice
+        if advice is not None and advice.request_id == self._request_id:
+            return advice
+        return None
+
+    # --------------------
+    # Recherche (thread de travail)
+    # --------------------
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._request is None:
+                    self._cond.wait()
+                request, self._request = self._request, None
+            advice = self.search(*request)
+            with self._cond:
+                published = advice.request_id == self._request_id
+                if published:
+                    self._advice = advice
+            if published and self.on_ready is not None:
+                self.on_ready()
+
+    def search(self, request_id: int, snapshot: _Snapshot, options: list, target: tuple) -> Advice:
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0
+        if len(self.table) > TT_MAX_ENTRIES:
+            self.table.clear()
+
+        # Enfants de la racine: état juste après l'entrée dans chaque salle (nœud de hasard)
+        children = []
+        for room in options:
+            if not can_enter(room, snapshot.inventory):
+                children.append(None)
+                continue
+            child = snapshot.clone()
+            enter_new_room(room, target[0], target[1], child.grid, child.player, child.inventory)
+            children.append((child, room, child.hash()))
+
+        rollouts = 0
+        live = [i for i, child in enumerate(children) if child is not None]
+        while live and time.perf_counter() < deadline:
+            i = self._select(live, children)
+            child, room, key = children[i]
+            sim = child.clone()
+            path = [key]
+            won = self._rollout(sim, room, path)
+            for state_key in path:
+                entry = self.table.get(state_key)
+                if entry is None:
+                    self.table[state_key] = [won, 1]
+                else:
+                    entry[0] += won
+                    entry[1] += 1
+            rollouts += 1
+
+        win_rates, visits = [], []
+        for child in children:
+            entry = self.table.get(child[2]) if child is not None else None
+            visits.append(entry[1] if entry else 0)
+            win_rates.append(entry[0] / entry[1] if entry else None)
+        return Advice(request_id, win_rates, visits, rollouts, (time.perf_counter() - start) * 1000.0)
+
+    def _select(self, live: list, children: list) -> int:
+        """UCB1 sur les options jouables (statistiques lues dans la table)."""
+        stats = [self.table.get(children[i][2]) for i in live]
+        for i, entry in zip(live, stats):
+            if entry is None:
+                return i
+        total = sum(entry[1] for entry in stats)
+        log_total = math.log(total)
+        best, best_score = live[0], -1.0
+        for i, (wins, n) in zip(live, stats):
+            score = wins / n + UCB_C * math.sqrt(log_total / n)
+            if score > best_score:
+                best, best_score = i, score
+        return best
+
+    def _rollout(self, sim: _Snapshot, room, path: list) -> int:
+        """Joue la suite de la partie; 1 si la sortie est atteinte, 0 sinon."""
+        grid, player, inventory, rng = sim.grid, sim.player, sim.inventory, self.rng
+        exit_r, exit_c = grid.exit_pos
+        apply_room_effect(room, player, inventory, grid, rng)
+        for _ in range(MAX_ROLLOUT_ACTIONS):
+            if room.room_type == "exit":
+                return 1
+            if inventory.steps <= 0:
+                return 0
+            r, c = self._next_cell(player.row, player.col, exit_r, exit_c, grid.rows, grid.cols)
+            if grid.discovered[r][c]:
+                room = grid.grid[r][c]
+                player.move_to(r, c)
+            else:
+                choices = [option for option in draw_room_choices(self.catalog, rng)
+                           if can_enter(option, inventory)]
+                if not choices:
+                    continue
+                room = rng.choice(choices)
+                enter_new_room(room, r, c, grid, player, inventory)
+            path.append(sim.hash())
+            apply_room_effect(room, player, inventory, grid, rng)
+        return 0
+
+    def _next_cell(self, r: int, c: int, exit_r: int, exit_c: int, rows: int, cols: int) -> tuple:
+        rng = self.rng
+        if rng.random() < GREEDY:
+            if r != exit_r and (c == exit_c or rng.random() < 0.5):
+                return r + (1 if exit_r > r else -1), c
+            if c != exit_c:
+                return r, c + (1 if exit_c > c else -1)
+        while True:
+            dr, dc = rng.choice(((-1, 0), (1, 0), (0, -1), (0, 1)))
+            if 0 <= r + dr < rows and 0 <= c + dc < cols:
+                return r + dr, c + dc
@@ -0,0 +1,102 @@
+# app_context.py
+"""
+Ressources de l'application, créées une fois par processus et partagées par
+toutes les parties: fenêtre, horloge, minuteries, polices, images, audio.
+
+GameManager les reçoit au lieu de les recréer; une nouvelle partie ou un
+"R" ne fait que GameManager.reset() (Grid, Inventory, Player).
+"""
+
+import os
+
+import pygame
+
+from constants import WINDOW_WIDTH, WINDOW_HEIGHT, FONT_DIR
+from sound_managener import start_audio
+from asset_manifest import asset_exists, find_asset, open_asset
+from surface_cache import SurfaceCache
+from scheduler import Scheduler
+
+CAPTION = "Blue Prince - POO"
+
+
+class ImageStore:
+    """
+    Images chargées une fois par (chemin, taille); un fichier absent est mémorisé comme None
+    (et signalé une fois par le manifeste). Les chemins sont ceux de assets/: résolus par
+    asset_manifest.py, dans le paquet .bpak s'il existe.
+    Les images mises à l'échelle passent par le cache disque (surface_cache.py).
+    """
+
+    def __init__(self):
+        self._images: dict[tuple, pygame.Surface | None] = {}
+        self.disk_cache = SurfaceCache()
+
+    def load(self, path: str, size: tuple[int, int] | None = None) -> pygame.Surface | None:
+        key = (path, size)
+        if key not in self._images:
+            image = None
+            if find_asset(path) is not None:
+                if size is not None:
+                    image = self.disk_cache.load(path, size)
+                else:
+                    with open_asset(path) as f:
+                        image = pygame.image.load(f, os.path.basename(path)).convert_alpha()
+            self._images[key] = image
+        return self._images[key]
+
+    def has(self, path: str, size: tuple[int, int] | None = None) -> bool:
+        return (path, size) in self._images
+
+    def put(self, path: str, size: tuple[int, int] | None, image: pygame.Surface | None):
+        """Ajoute une image chargée ailleurs (preload.py); une image déjà présente est gardée."""
+        self._images.setdefault((path, size), image)
+
+    def clear(self):
+        self._images.clear()
+
+
+# Partagé par les Room (grid.py) et le panneau d'inventaire (ui.py)
+images = ImageStore()
+
+
+class AppContext:
+    """Fenêtre, minuteries, polices, images et audio de l'application."""
+
+    def __init__(self, width: int = WINDOW_WIDTH, height: int = WINDOW_HEIGHT):
+        # Not pygame.init(): it would open the audio device synchronously (see start_audio)
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_caption(CAPTION)
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != (width, height):
+            screen = pygame.display.set_mode((width, height))
+        self.screen = screen
+        self.clock = pygame.time.Clock()
+        # Avancé par la boucle principale (scenes.App.run)
+        self.scheduler = Scheduler()
+
+        font_path = os.path.join(FONT_DIR, "OpenSans-Regular.ttf")
+        if asset_exists(font_path):
+            # Font reads its file lazily: each one keeps its own view open
+            self.font = pygame.font.Font(open_asset(font_path), 16)
+            self.large_font = pygame.font.Font(open_asset(font_path), 20)
+        else:
+            self.font = pygame.font.SysFont("arial", 16)
+            self.large_font = pygame.font.SysFont("arial", 20, bold=True)
+
+        self.images = images
+        # Audio: brought up once per process on a background thread (music starts when ready)
+        start_audio()
+
+
+_context: AppContext | None = None
+
+
+def get_context(width: int | None = None, height: int | None = None) -> AppContext:
+    """Contexte du processus, créé au premier appel (ou recréé si la taille demandée change)."""
+    global _context
+    size = (width or WINDOW_WIDTH, height or WINDOW_HEIGHT)
+    if _context is None or _context.screen.get_size() != size:
+        _context = AppContext(*size)
+    return _context
@@ -0,0 +1,317 @@
+# asset_manifest.py
+"""
+Manifeste des assets: construit une fois au démarrage, puis consulté par
+simple recherche dans un dict (plus aucun os.path.exists au moment de
+l'utilisation).
+
+Chaque nom logique ("rooms/entry.png", chemin relatif à assets/) donne un
+AssetInfo: sa source (le paquet .bpak s'il la contient, sinon le fichier),
+sa taille, et des métadonnées lues dans l'en-tête sans décoder:
+    - images PNG / JPEG : dimensions (largeur, hauteur)
+    - audio WAV / OGG / MP3 : durée en secondes
+Un asset demandé mais absent est signalé une seule fois (find_asset).
+
+Ces métadonnées sont gardées d'un lancement à l'autre dans .cache/
+(MANIFEST_CACHE_PATH, variable BP_MANIFEST_CACHE), avec l'estampille de
+chaque source (mtime et taille du fichier, ou du paquet): au démarrage, le
+répertoire n'est plus que parcouru (stat), et seuls les assets nouveaux ou
+modifiés sont ouverts.
+
+Usage:
+    python asset_manifest.py      # liste des assets et de leurs métadonnées
+"""
+
+import json
+import os
+import struct
+import wave
+from dataclasses import dataclass
+
+from constants import ASSETS_DIR, ROOT_DIR
+from asset_pack import get_pack
+from log import get_logger
+
+PACK_SOURCE = "pack"
+IMAGE_FORMATS = ("png", "jpg", "jpeg", "bmp", "gif")
+AUDIO_FORMATS = ("wav", "ogg", "mp3")
+FONT_FORMATS = ("ttf", "otf")
+_TAIL_SIZE = 65536  # fin de fichier lue pour la dernière page Ogg
+MANIFEST_CACHE_PATH = os.environ.get("BP_MANIFEST_CACHE", os.path.join(ROOT_DIR, ".cache", "manifest.json"))
+MANIFEST_CACHE_VERSION = 1
+
+log = get_logger("assets")
+
+
+@dataclass
+class AssetInfo:
+    name: str                       # nom logique, "rooms/entry.png"
+    source: str                     # PACK_SOURCE ou chemin du fichier
+    fmt: str                        # extension, "png"
+    length: int                     # octets
+    size: tuple | None = None       # (largeur, hauteur) des images
+    duration: float | None = None   # secondes, pour l'audio
+
+    @property
+    def kind(self) -> str:
+        if self.fmt in IMAGE_FORMATS:
+            return "image"
+        if self.fmt in AUDIO_FORMATS:
+            return "audio"
+        if self.fmt in FONT_FORMATS:
+            return "font"
+        return "other"
+
+
+class AssetManifest:
+    """Tous les assets (paquet + fichiers de assets_dir), indexés par nom logique."""
+
+    def __init__(self, assets_dir: str = ASSETS_DIR, asset_pack=None, cache_path: str | None = None):
+        self.assets_dir = assets_dir
+        self.asset_pack = asset_pack
+        self.entries: dict[str, AssetInfo] = {}
+        self.missing: set = set()
+        self.rebuilt = 0  # assets dont l'en-tête a été relu (absents du cache ou modifiés)
+        self._by_path: dict = {}  # chemin demandé -> AssetInfo | None (relpath n'est calculé qu'une fois)
+        stamps: dict[str, list] = {}  # nom -> estampille de la source (listes: comparables au JSON)
+
+        if os.path.isdir(assets_dir):
+            for root, _, filenames in os.walk(assets_dir):
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    name = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+                    st = os.stat(path)
+                    self.entries[name] = AssetInfo(name, path, _format(name), st.st_size)
+                    stamps[name] = [st.st_mtime_ns, st.st_size]
+        if asset_pack is not None:
+            # Le paquet l'emporte sur les fichiers (même règle qu'avant le manifeste)
+            st = os.stat(asset_pack.path)
+            for name, (offset, length, fmt) in asset_pack.entries.items():
+                self.entries[name] = AssetInfo(name, PACK_SOURCE, fmt or _format(name), length)
+                stamps[name] = [PACK_SOURCE, st.st_mtime_ns, st.st_size, offset, length]
+
+        cached = _read_cache(cache_path) if cache_path else {}
+        for name, info in self.entries.items():
+            entry = cached.get(name)
+            if entry is not None and entry.get("stamp") == stamps[name]:
+                info.size = tuple(entry["size"]) if entry.get("size") else None
+                info.duration = entry.get("duration")
+                continue
+            self.rebuilt += 1
+            try:
+                with self.open(info) as f:
+                    if info.kind == "image":
+                        info.size = image_size(f, info.fmt)
+                    elif info.kind == "audio":
+                        info.duration = audio_duration(f, info.fmt, info.length)
+            except (OSError, EOFError, IndexError, wave.Error, struct.error):
+                pass  # métadonnées illisibles: l'asset reste utilisable
+        if cache_path and (self.rebuilt or cached.keys() != self.entries.keys()):
+            _write_cache(cache_path, {name: {"stamp": stamps[name], "size": info.size, "duration": info.duration}
+                                      for name, info in self.entries.items()})
+
+        # Index des répertoires pour list_assets
+        self._dirs: dict[str, list] = {}
+        for name in sorted(self.entries):
+            self._dirs.setdefault(name.rpartition("/")[0], []).append(name)
+
+    def name(self, path: str) -> str:
+        return os.path.relpath(path, self.assets_dir).replace(os.sep, "/")
+
+    def get(self, path: str) -> AssetInfo | None:
+        try:
+            return self._by_path[path]
+        except KeyError:
+            info = self._by_path[path] = self.entries.get(self.name(path))
+            return info
+
+    def find(self, path: str) -> AssetInfo | None:
+        """Comme get, mais un asset absent est signalé (une fois par nom)."""
+        info = self.get(path)
+        if info is None:
+            name = self.name(path)
+            if name not in self.missing:
+                self.missing.add(name)
+                log.warning("Missing asset: %s", name)
+        return info
+
+    def open(self, info: AssetInfo):
+        if info.source == PACK_SOURCE:
+            return self.asset_pack.open(info.name)
+        return open(info.source, "rb")
+
+    def listdir(self, directory: str) -> list:
+        """Chemins des assets directement sous directory."""
+        key = self.name(directory).rstrip("/")
+        return [os.path.join(self.assets_dir, *name.split("/")) for name in self._dirs.get("" if key == "." else key, [])]
+
+
+def _format(name: str) -> str:
+    return os.path.splitext(name)[1].lstrip(".").lower()
+
+
+def _read_cache(path: str) -> dict:
+    """Entrées du manifeste précédent ({} si absent, illisible ou d'une autre version)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log.warning("Manifest cache ignored (%s): %s", path, e)
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _write_cache(path: str, entries: dict):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_CACHE_VERSION, "entries": entries}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("Manifest cache write failed: %s", e)
+
+
+# --------------------
+# Métadonnées lues dans l'en-tête
+# --------------------
+def image_size(f, fmt: str) -> tuple | None:
+    head = f.read(32)
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return struct.unpack(">II", head[16:24])
+    if head[:2] == b"\xff\xd8":
+        return _jpeg_size(f)
+    return None
+
+
+def _jpeg_size(f) -> tuple | None:
+    f.seek(2)
+    while True:
+        marker = f.read(4)
+        if len(marker) < 4 or marker[0] != 0xFF:
+            return None
+        kind, length = marker[1], struct.unpack(">H", marker[2:])[0]
+        # SOF0..SOF15 sauf DHT (C4), JPG (C8) et DAC (CC)
+        if 0xC0 <= kind <= 0xCF and kind not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def audio_duration(f, fmt: str, length: int) -> float | None:
+    if fmt == "wav":
+        with wave.open(f) as w:
+            return w.getnframes() / w.getframerate()
+    if fmt == "ogg":
+        return _ogg_duration(f, length)
+    if fmt == "mp3":
+        return _mp3_duration(f, length)
+    return None
+
+
+def _ogg_duration(f, length: int) -> float | None:
+    """Position (granule) de la dernière page / fréquence de l'en-tête Vorbis."""
+    head = f.read(512)
+    i = head.find(b"\x01vorbis")
+    if i < 0:
+        return None
+    (rate,) = struct.unpack_from("<I", head, i + 12)
+    f.seek(max(0, length - _TAIL_SIZE))
+    tail = f.read()
+    j = tail.rfind(b"OggS")
+    if j < 0 or not rate:
+        return None
+    (granule,) = struct.unpack_from("<q", tail, j + 6)
+    return granule / rate
+
+
+_MP3_BITRATES = {  # kbit/s, par (MPEG-1 ?, index)
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_duration(f, length: int) -> float | None:
+    """Première trame MPEG layer III: en-tête Xing (VBR) si présent, sinon débit constant."""
+    head = f.read(10)
+    start = 0
+    if head[:3] == b"ID3":
+        size = head[6:10]
+        start = 10 + ((size[0] << 21) | (size[1] << 14) | (size[2] << 7) | size[3])
+    f.seek(start)
+    data = f.read(4096)
+    for i in range(len(data) - 4):
+        if data[i] != 0xFF or data[i + 1] & 0xE0 != 0xE0:
+            continue
+        version = (data[i + 1] >> 3) & 3
+        bitrate_index, rate_index = data[i + 2] >> 4, (data[i + 2] >> 2) & 3
+        if version == 1 or (data[i + 1] >> 1) & 3 != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            continue  # pas une trame layer III valide
+        rate = _MP3_RATES[version][rate_index]
+        samples = 1152 if version == 3 else 576
+        xing = next((k for k in (data.find(b"Xing", i), data.find(b"Info", i)) if 0 <= k < i + 64), -1)
+        if xing >= 0 and data[xing + 7] & 1:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+            return frames * samples / rate
+        bitrate = _MP3_BITRATES[version == 3][bitrate_index] * 1000
+        return (length - start - i) * 8 / bitrate
+    return None
+
+
+# --------------------
+# Accès aux assets
+# --------------------
+_manifest: AssetManifest | None = None
+
+
+def get_manifest() -> AssetManifest:
+    """Le manifeste du processus (construit au premier appel)."""
+    global _manifest
+    if _manifest is None:
+        _manifest = AssetManifest(ASSETS_DIR, get_pack(), MANIFEST_CACHE_PATH)
+    return _manifest
+
+
+def asset_exists(path: str) -> bool:
+    return get_manifest().get(path) is not None
+
+
+def find_asset(path: str) -> AssetInfo | None:
+    """AssetInfo de path; un asset absent est signalé une seule fois."""
+    return get_manifest().find(path)
+
+
+def open_asset(path: str):
+    """Fichier binaire de l'asset: vue sur le paquet, sinon le fichier lui-même."""
+    manifest = get_manifest()
+    info = manifest.get(path)
+    if info is None:
+        raise FileNotFoundError(path)
+    return manifest.open(info)
+
+
+def list_assets(directory: str) -> list:
+    """Chemins des fichiers directement sous directory (paquet et fichiers)."""
+    return get_manifest().listdir(directory)
+
+
+def main() -> int:
+    manifest = get_manifest()
+    for name, info in sorted(manifest.entries.items()):
+        meta = ""
+        if info.size:
+            meta = f"{info.size[0]}x{info.size[1]}"
+        elif info.duration is not None:
+            meta = f"{info.duration:.1f} s"
+        source = PACK_SOURCE if info.source == PACK_SOURCE else "file"
+        print(f"{name:48}{info.kind:>7}{source:>6}{info.length:>10}  {meta}")
+    print(f"{len(manifest.entries)} assets ({manifest.rebuilt} relus, le reste depuis {MANIFEST_CACHE_PATH})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
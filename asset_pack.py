@@ -0,0 +1,182 @@
+# asset_pack.py
+"""
+Paquet d'assets: tous les fichiers de assets/ dans un seul fichier .bpak.
+
+Format (little-endian):
+    en-tête  : b"BPAK" | version (u8) | nombre d'entrées (u32) | taille de l'index (u32)
+    index    : pour chaque entrée
+               longueur du nom (u16) | nom utf-8 ("rooms/entry.png")
+               | offset (u64) | longueur (u64) | format (u8 + ascii, ex. "png")
+    données  : contenus des fichiers, bout à bout
+
+Le paquet est ouvert une fois et projeté en mémoire (mmap); chaque asset est
+lu à travers une vue (AssetView) sur la projection, sans copie intermédiaire,
+ce qui suffit à pygame.image.load, pygame.font.Font et pygame.mixer.
+Sans paquet (développement), on lit les fichiers de assets/ directement.
+Le code du jeu passe par asset_manifest.py (open_asset, asset_exists).
+
+Usage:
+    python asset_pack.py pack [--assets assets] [-o assets.bpak]
+    python asset_pack.py list [assets.bpak]
+"""
+
+import io
+import mmap
+import os
+import struct
+
+from constants import ROOT_DIR, ASSETS_DIR
+
+MAGIC = b"BPAK"
+VERSION = 1
+PACK_PATH = os.environ.get("BP_ASSET_PACK", os.path.join(ROOT_DIR, "assets.bpak"))
+
+_HEADER = struct.Struct("<4sBII")
+_NAME_LEN = struct.Struct("<H")
+_SPAN = struct.Struct("<QQ")
+
+
+class AssetView(io.RawIOBase):
+    """Fichier en lecture seule sur une tranche de la projection mémoire."""
+
+    def __init__(self, buffer: memoryview, name: str):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = min(len(b), len(self._buffer) - self._pos)
+        if n <= 0:
+            return 0
+        b[:n] = self._buffer[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetPack:
+    """Index d'un fichier .bpak projeté en mémoire."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap)
+        magic, version, count, index_size = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: paquet d'assets invalide")
+
+        self.entries: dict[str, tuple[int, int, str]] = {}  # nom -> (offset, longueur, format)
+        pos = _HEADER.size
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(self._data, pos)
+            pos += _NAME_LEN.size
+            name = bytes(self._data[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            offset, length = _SPAN.unpack_from(self._data, pos)
+            pos += _SPAN.size
+            fmt_len = self._data[pos]
+            fmt = bytes(self._data[pos + 1:pos + 1 + fmt_len]).decode("ascii")
+            pos += 1 + fmt_len
+            self.entries[name] = (offset, length, fmt)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def view(self, name: str) -> memoryview:
+        offset, length, _ = self.entries[name]
+        return self._data[offset:offset + length]
+
+    def open(self, name: str) -> AssetView:
+        return AssetView(self.view(name), name)
+
+    def names(self, prefix: str = "") -> list:
+        return [name for name in self.entries if name.startswith(prefix)]
+
+
+def pack(assets_dir: str = ASSETS_DIR, output: str = PACK_PATH) -> int:
+    """Écrit tous les fichiers de assets_dir dans output. Retourne le nombre d'entrées."""
+    files = []
+    for root, _, filenames in os.walk(assets_dir):
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+            files.append((name, path))
+    files.sort()
+
+    index = []
+    for name, path in files:
+        fmt = os.path.splitext(name)[1].lstrip(".").lower().encode("ascii")
+        index.append((name.encode("utf-8"), os.path.getsize(path), fmt))
+    index_size = sum(_NAME_LEN.size + len(n) + _SPAN.size + 1 + len(fmt) for n, _, fmt in index)
+
+    with open(output, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, len(index), index_size))
+        offset = _HEADER.size + index_size
+        for name, size, fmt in index:
+            out.write(_NAME_LEN.pack(len(name)) + name + _SPAN.pack(offset, size) + bytes([len(fmt)]) + fmt)
+            offset += size
+        for _, path in files:
+            with open(path, "rb") as f:
+                out.write(f.read())
+    return len(index)
+
+
+# --------------------
+# Paquet du processus (lu à travers asset_manifest.py)
+# --------------------
+_pack: AssetPack | None = None
+_pack_checked = False
+
+
+def get_pack() -> AssetPack | None:
+    """Le paquet PACK_PATH s'il existe (un seul open + mmap par processus)."""
+    global _pack, _pack_checked
+    if not _pack_checked:
+        _pack_checked = True
+        if os.path.exists(PACK_PATH):
+            _pack = AssetPack(PACK_PATH)
+    return _pack
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Paquet d'assets Blue Prince (.bpak).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_pack = sub.add_parser("pack", help="regrouper assets/ dans un fichier .bpak")
+    p_pack.add_argument("--assets", default=ASSETS_DIR)
+    p_pack.add_argument("-o", "--output", default=PACK_PATH)
+    p_list = sub.add_parser("list", help="afficher l'index d'un paquet")
+    p_list.add_argument("path", nargs="?", default=PACK_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        count = pack(args.assets, args.output)
+        print(f"{count} fichiers -> {args.output} ({os.path.getsize(args.output)} octets)")
+    else:
+        asset_pack = AssetPack(args.path)
+        for name, (offset, length, fmt) in asset_pack.entries.items():
+            print(f"{name:48}{fmt:>6}{offset:>12}{length:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,270 @@
+# bench.py
+"""
+Benchmarks des chemins critiques, sans écran (driver SDL "dummy").
+
+Usage:
+    python bench.py                          # lance tout, compare à bench_baseline.json s'il existe
+    python bench.py draw_grid save_game      # seulement certains benchmarks
+    python bench.py --save-baseline          # enregistre les résultats comme référence
+    python bench.py --baseline other.json --fail-on-regression
+    python bench.py --replay replays/xxx.bprp   # ajoute une partie enregistrée (replay.py)
+
+Chaque benchmark est répété plusieurs fois; on affiche les opérations par
+seconde (moyenne et écart-type relatif) et le rapport avec la référence.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import pygame
+
+from game_manager import GameManager
+from inventory import Inventory
+from ui import draw_grid, draw_inventory
+from effects import apply_room_effect
+from save_manager import save_game, load_game
+from replay import Replay, play as play_replay
+from log import ERROR, set_default_level
+
+DEFAULT_BASELINE = "bench_baseline.json"
+REGRESSION_THRESHOLD = 0.10  # 10% plus lent que la référence
+
+SESSION_KEYS = [pygame.K_z, pygame.K_q, pygame.K_s, pygame.K_d, pygame.K_SPACE, pygame.K_RETURN]
+SESSION_LENGTH = 200
+
+
+class Benchmark:
+    """Un benchmark: setup() prépare un état, op(state) est l'opération mesurée."""
+
+    def __init__(self, name: str, op, setup=None):
+        self.name = name
+        self.op = op
+        self.setup = setup
+
+    def run(self, repeats: int = 5, min_time: float = 0.2) -> dict:
+        state = self.setup() if self.setup else None
+        # Calibrage: nombre d'itérations pour qu'une répétition dure ~min_time
+        number = 1
+        while True:
+            elapsed = self._time(state, number)
+            if elapsed >= min_time / 4 or number >= 1_000_000:
+                break
+            number *= 4
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+        rates = [number / self._time(state, number) for _ in range(repeats)]
+        mean = statistics.fmean(rates)
+        stdev = statistics.stdev(rates) if len(rates) > 1 else 0.0
+        return {"ops": mean, "stdev": stdev, "iterations": number, "repeats": repeats}
+
+    def _time(self, state, number: int) -> float:
+        op = self.op
+        start = time.perf_counter()
+        for _ in range(number):
+            op(state)
+        return time.perf_counter() - start
+
+
+# --------------------
+# Setup helpers
+# --------------------
+_game = None
+
+
+def _game_manager() -> GameManager:
+    """Un seul GameManager pour tous les benchmarks (fenêtre dummy)."""
+    global _game
+    if _game is None:
+        _game = GameManager()
+        # Pas de recherche du conseiller en parallèle: elle ajouterait du bruit aux mesures
+        _game.advisor.enabled = False
+    return _game
+
+
+def _fresh_game(gm: GameManager):
+    """Remet la partie à zéro sans recréer la fenêtre."""
+    gm.reset()
+    return gm
+
+
+def _explored_game(seed: int = 7):
+    """Partie avec quelques salles posées (état typique de mi-partie)."""
+    gm = _fresh_game(_game_manager())
+    rng = random.Random(seed)
+    random.seed(seed)
+    for r in range(gm.grid.rows):
+        for c in range(gm.grid.cols):
+            if gm.grid.get_room(r, c) is None and rng.random() < 0.6:
+                gm.open_door_modal(r, c)
+                gm.grid.set_room(r, c, gm.modal_options[0])
+    gm.in_modal = False
+    return gm
+
+
+def _modal_game():
+    gm = _explored_game()
+    gm.open_door_modal(0, 0)
+    return gm
+
+
+def _session_script(seed: int = 1234) -> list:
+    rng = random.Random(seed)
+    return [pygame.event.Event(pygame.KEYDOWN, key=rng.choice(SESSION_KEYS), mod=0)
+            for _ in range(SESSION_LENGTH)]
+
+
+def _run_session(state, render: bool):
+    gm, script = state
+    _fresh_game(gm)
+    random.seed(42)
+    for event in script:
+        gm.handle_events_from_main([event])
+        gm.update()
+        if render:
+            gm.draw()
+        if not gm.running:
+            _fresh_game(gm)
+
+
+def _save_setup():
+    gm = _explored_game()
+    path = os.path.join(tempfile.mkdtemp(prefix="bp_bench_"), "save.json")
+    save_game(gm.grid, gm.inventory, gm.player, path)
+    return gm, path
+
+
+# --------------------
+# Benchmarks
+# --------------------
+def _effect_setup():
+    gm = _explored_game()
+    gm.open_door_modal(0, 0)
+    rooms = [room for row in gm.grid.grid for room in row if room is not None] + gm.modal_options
+    inventory = Inventory(keys=1000, shovel=True)
+    return rooms, gm.player, inventory, gm.grid
+
+
+def _apply_effects(state):
+    rooms, player, inventory, grid = state
+    for room in rooms:
+        apply_room_effect(room, player, inventory, grid)
+
+
+BENCHMARKS = [
+    Benchmark("draw_grid", lambda gm: draw_grid(gm.screen, gm.grid, (gm.player.row, gm.player.col),
+                                                (gm.player.sel_row, gm.player.sel_col)),
+              _explored_game),
+    Benchmark("draw_inventory", lambda gm: draw_inventory(gm.screen, gm.inventory, gm.font), _explored_game),
+    Benchmark("draw_modal", lambda gm: gm._draw_modal(), _modal_game),
+    Benchmark("game_draw", lambda gm: gm.draw(), _explored_game),
+    Benchmark("open_door_modal", lambda gm: gm.open_door_modal(0, 0), _explored_game),
+    Benchmark("apply_room_effect", _apply_effects, _effect_setup),
+    Benchmark("save_game", lambda st: save_game(st[0].grid, st[0].inventory, st[0].player, st[1]), _save_setup),
+    Benchmark("load_game", lambda st: load_game(st[0].grid, st[0].inventory, st[0].player, st[1]), _save_setup),
+    Benchmark("restart", lambda gm: gm.reset(), _game_manager),
+    Benchmark("session_render", lambda st: _run_session(st, render=True),
+              lambda: (_game_manager(), _session_script())),
+    Benchmark("session_headless", lambda st: _run_session(st, render=False),
+              lambda: (_game_manager(), _session_script())),
+]
+
+
+def replay_benchmark(path: str) -> Benchmark:
+    """Rejoue une partie enregistrée sans affichage (charge de travail réaliste)."""
+    replay = Replay.load(path)
+
+    def op(gm):
+        _fresh_game(gm)
+        if not play_replay(replay, gm=gm):
+            raise RuntimeError(f"{path}: l'état final ne correspond pas à l'enregistrement")
+
+    return Benchmark(f"replay:{os.path.basename(path)}", op, _game_manager)
+
+
+# --------------------
+# Reporting
+# --------------------
+def _meta() -> dict:
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """Noms des benchmarks plus lents que la référence au-delà du seuil et du bruit."""
+    regressions = []
+    for name, res in results.items():
+        ref = baseline.get("results", {}).get(name)
+        if not ref:
+            continue
+        noise = 2 * max(res["stdev"], ref.get("stdev", 0.0))
+        if res["ops"] < ref["ops"] * (1 - threshold) and ref["ops"] - res["ops"] > noise:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks Blue Prince (headless).")
+    parser.add_argument("names", nargs="*", help="benchmarks à lancer (tous par défaut)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="durée visée par répétition (s)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--replay", action="append", default=[], metavar="FILE",
+                        help="ajoute une partie enregistrée (.bprp) comme benchmark")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if not args.names or b.name in args.names]
+    unknown = set(args.names) - {b.name for b in BENCHMARKS}
+    if unknown:
+        parser.error(f"benchmarks inconnus: {', '.join(sorted(unknown))}")
+    selected += [replay_benchmark(path) for path in args.replay]
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # Seules les erreurs du journal s'intercalent dans le rapport (BP_LOG l'emporte s'il est donné)
+    if "BP_LOG" not in os.environ:
+        set_default_level(ERROR)
+    results = {}
+    print(f"{'benchmark':28}{'ops/s':>14}{'± %':>8}{'vs base':>10}")
+    for bench in selected:
+        res = bench.run(repeats=args.repeats, min_time=args.min_time)
+        results[bench.name] = res
+        ref = baseline.get("results", {}).get(bench.name)
+        ratio = f"{res['ops'] / ref['ops']:.2f}x" if ref else "-"
+        rel = 100.0 * res["stdev"] / res["ops"] if res["ops"] else 0.0
+        print(f"{bench.name:28}{res['ops']:14.1f}{rel:8.1f}{ratio:>10}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"meta": _meta(), "results": results}, f, indent=2)
+        print(f"Référence enregistrée: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline)
+    if regressions:
+        print(f"Régressions (> {REGRESSION_THRESHOLD:.0%}): {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# compositor.py
+"""
+Compositeur de calques: garde en cache les parties statiques de l'écran.
+
+Chaque calque est une surface rendue une seule fois puis réutilisée tant que
+sa clé d'invalidation ne change pas:
+    - "grid": fond, salles posées et lignes (clé: Grid.version, unique par grille)
+    - "inventory": panneau d'inventaire (clé: valeurs de l'Inventory)
+    - "backdrop": voile semi-transparent derrière les modales (clé: taille, couleur)
+    - "modal": boîte de choix des salles (clé: options, sélection, conseils, inventaire)
+    - "message", "hint"...: textes (clé: le message)
+Une frame se réduit ainsi à quelques blits plus les cadres joueur/curseur.
+"""
+
+from dataclasses import astuple
+
+import pygame
+
+from constants import GRID_AREA_WIDTH, GRID_AREA_HEIGHT, PANEL_WIDTH, WINDOW_HEIGHT, WHITE
+from ui import draw_grid_cells, draw_inventory
+
+
+class LayerCompositor:
+    """Cache de surfaces par calque, invalidées par clé."""
+
+    def __init__(self):
+        self._surfaces: dict[str, pygame.Surface] = {}
+        self._keys: dict[str, object] = {}
+        self.rebuilds = 0  # nombre de re-rendus (utile pour le debug / les benchs)
+
+    def invalidate(self, name: str | None = None):
+        """Force le re-rendu d'un calque (ou de tous si name est None)."""
+        if name is None:
+            self._keys.clear()
+        else:
+            self._keys.pop(name, None)
+
+    def _layer(self, name: str, key, size: tuple[int, int], render, alpha: bool = False) -> pygame.Surface:
+        """Retourne la surface du calque, re-rendue seulement si la clé a changé."""
+        surf = self._surfaces.get(name)
+        if surf is None or surf.get_size() != size:
+            surf = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+            self._surfaces[name] = surf
+            self._keys.pop(name, None)
+        if self._keys.get(name, self) != key:
+            render(surf)
+            self._keys[name] = key
+            self.rebuilds += 1
+        return surf
+
+    # --------------------
+    # Calques du jeu
+    # --------------------
+    def grid_layer(self, grid) -> pygame.Surface:
+        return self._layer("grid", grid.version,
+                           (GRID_AREA_WIDTH, GRID_AREA_HEIGHT),
+                           lambda surf: draw_grid_cells(surf, grid))
+
+    def inventory_layer(self, inventory, font: pygame.font.Font) -> pygame.Surface:
+        return self._layer("inventory", (astuple(inventory), id(font)),
+                           (PANEL_WIDTH, WINDOW_HEIGHT),
+                           lambda surf: draw_inventory(surf, inventory, font, x0=0))
+
+    def backdrop(self, size: tuple[int, int], rgba: tuple[int, int, int, int]) -> pygame.Surface:
+        return self._layer("backdrop", rgba, size, lambda surf: surf.fill(rgba), alpha=True)
+
+    def modal_layer(self, key, size: tuple[int, int], render) -> pygame.Surface:
+        """Boîte de la modale, rendue par render(surf) seulement quand key change."""
+        return self._layer("modal", key, size, render)
+
+    def text(self, font: pygame.font.Font, message: str, color=WHITE, name: str = "message") -> pygame.Surface:
+        """Texte mis en cache tant que le message ne change pas (un cache par name)."""
+        key = (id(font), message, color)
+        if self._keys.get(name, self) != key:
+            self._surfaces[name] = font.render(message, True, color)
+            self._keys[name] = key
+            self.rebuilds += 1
+        return self._surfaces[name]
@@ -19,6 +19,8 @@ SFX_DIR = os.path.join(AUDIO_DIR, "effects")
 WINDOW_WIDTH = 1256
 WINDOW_HEIGHT = 600
 FPS = 30
+# Sans animation en cours, la boucle dort sur pygame.event.wait (timeout en ms)
+IDLE_WAIT_MS = 1000
 
 GRID_ROWS = 5
 GRID_COLS = 9
@@ -3,10 +3,37 @@ effects.py - Apply room effects when player enters.
 OBJECTS (food, tools) are INSIDE rooms, not rooms themselves.
 """
 
-def apply_room_effect(room, player, inventory, grid):
+import random
+
+
+# ---- ENTERING A NEW ROOM (same rules for the modal, env.py and advisor.py) ----
+
+def entry_requirement(room, inventory):
+    """What the player lacks to enter room: "key", "gems", or None if it can be entered."""
+    if room.effect_data.get("requires_key_to_enter", False) and inventory.keys <= 0:
+        return "key"
+    if inventory.gems < room.cost_gems:
+        return "gems"
+    return None
+
+
+def can_enter(room, inventory) -> bool:
+    return entry_requirement(room, inventory) is None
+
+
+def pay_entry(room, inventory):
+    """Key and gems of a room that can be entered (checked beforehand: nothing is paid on refusal)."""
+    if room.effect_data.get("requires_key_to_enter", False):
+        inventory.keys -= 1
+    if room.cost_gems > 0:
+        inventory.use_gems(room.cost_gems)
+
+
+def apply_room_effect(room, player, inventory, grid, rng=random):
     """
     Apply room effect when player enters.
     Rooms can contain objects that activate upon entry.
+    rng: source of randomness (the random module, or a random.Random for simulations).
     """
     if room is None:
         return "Salle vide."
@@ -17,7 +44,7 @@ def apply_room_effect(room, player, inventory, grid):
     # ---- LOCKED ROOM (requires key to enter - already consumed in modal) ----
     
     if t == "locked_room":
-        # Key already consumed in _handle_modal_key
+        # Key already consumed in GameManager._confirm_choice
         gold = effect_data.get("gold", 10)
         gems = effect_data.get("gems", 2)
         inventory.gold += gold
@@ -48,13 +75,12 @@ def apply_room_effect(room, player, inventory, grid):
     
     if t == "bedroom" and effect_data.get("has_food"):
         # Bedroom with food - randomly draw which food
-        import random
         food_options = [
             ("une pomme", 2),
             ("une banane", 3),
             ("un gâteau", 10),
         ]
-        food_name, steps = random.choice(food_options)
+        food_name, steps = rng.choice(food_options)
         inventory.steps += steps
         return f"Vous trouvez {food_name} et récupérez {steps} pas."
 
@@ -73,8 +99,7 @@ def apply_room_effect(room, player, inventory, grid):
         if inventory.keys > 0:
             inventory.keys -= 1
             # Chest reward
-            import random
-            reward_type = random.choice(["gold", "food", "gems"])
+            reward_type = rng.choice(["gold", "food", "gems"])
             if reward_type == "gold":
                 inventory.gold += 5
                 return f"Vous ouvrez un coffre avec une clé et trouvez 5 pièces d'or."
@@ -86,8 +111,7 @@ def apply_room_effect(room, player, inventory, grid):
                 return f"Vous ouvrez un coffre avec une clé et trouvez 1 gemme."
         elif inventory.hammer:
             # With hammer, no key needed
-            import random
-            reward_type = random.choice(["gold", "food", "gems"])
+            reward_type = rng.choice(["gold", "food", "gems"])
             if reward_type == "gold":
                 inventory.gold += 5
                 return f"Vous brisez le coffre avec le marteau et trouvez 5 pièces d'or."
@@ -114,8 +138,7 @@ def apply_room_effect(room, player, inventory, grid):
         # Dig spot - requires shovel
         dig_spots = effect_data.get("dig_spots", 1)
         if inventory.shovel:
-            import random
-            reward_type = random.choice(["gold", "gems", "nothing"])
+            reward_type = rng.choice(["gold", "gems", "nothing"])
             if reward_type == "gold":
                 inventory.gold += 3
                 return f"Vous creusez avec la pelle et trouvez 3 pièces d'or."
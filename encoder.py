@@ -0,0 +1,139 @@
+# encoder.py
+"""
+Encodage de l'état de jeu en tableaux NumPy de forme fixe.
+
+Plateau: tableau (canaux, lignes, colonnes), un canal par
+    - type de salle (ROOM_TYPES)
+    - couleur (ROOM_COLORS)
+    - rareté (0..3)
+    - case découverte
+    - position du joueur, position du curseur
+Inventaire: vecteur (steps, gold, gems, keys, dice, shovel, hammer,
+picklock_kit, metal_detector, rabbit_foot).
+
+Les tableaux sont préalloués (ou fournis par l'appelant, par ex. une tranche
+d'un lot VectorMansionEnv) et mis à jour case par case: après une action on
+ne réécrit que la case posée et les positions qui ont changé, sans allocation.
+"""
+
+import numpy as np
+
+from grid import ROOM_COLORS
+from rooms_catalog import get_catalog
+
+ROOM_TYPES = (["start", "exit"] + sorted({room.room_type for room in get_catalog()} - {"start", "exit"})
+              + ["other"])
+COLORS = list(ROOM_COLORS)
+RARITIES = 4
+INVENTORY_FIELDS = ("steps", "gold", "gems", "keys", "dice",
+                    "shovel", "hammer", "picklock_kit", "metal_detector", "rabbit_foot")
+
+TYPE_OFFSET = 0
+COLOR_OFFSET = TYPE_OFFSET + len(ROOM_TYPES)
+RARITY_OFFSET = COLOR_OFFSET + len(COLORS)
+DISCOVERED_CH = RARITY_OFFSET + RARITIES
+PLAYER_CH = DISCOVERED_CH + 1
+CURSOR_CH = PLAYER_CH + 1
+N_CHANNELS = CURSOR_CH + 1
+
+_TYPE_INDEX = {name: i for i, name in enumerate(ROOM_TYPES)}
+_COLOR_INDEX = {name: i for i, name in enumerate(COLORS)}
+
+
+class ObservationEncoder:
+    """Plans du plateau + vecteur d'inventaire, tenus à jour de façon incrémentale."""
+
+    def __init__(self, rows: int, cols: int, board: np.ndarray | None = None,
+                 inventory: np.ndarray | None = None, dtype=np.float32):
+        self.rows = rows
+        self.cols = cols
+        self.board = board if board is not None else np.zeros((N_CHANNELS, rows, cols), dtype=dtype)
+        self.inventory = inventory if inventory is not None else np.zeros(len(INVENTORY_FIELDS), dtype=dtype)
+        # Ce qui est actuellement encodé (pour ne réécrire que les différences)
+        self._rooms = [[None] * cols for _ in range(rows)]
+        self._discovered = [[False] * cols for _ in range(rows)]
+        self._channels: dict = {}  # (type, couleur, rareté) -> (canal type, canal couleur, canal rareté)
+        self._player = None
+        self._cursor = None
+        self._grid_version = None
+
+    # --------------------
+    # Encodage complet
+    # --------------------
+    def encode(self, grid, player, inventory):
+        """Réécrit tout (début de partie, chargement)."""
+        self.board[:] = 0
+        self._rooms = [[None] * self.cols for _ in range(self.rows)]
+        self._discovered = [[False] * self.cols for _ in range(self.rows)]
+        self._player = self._cursor = None
+        for r in range(self.rows):
+            for c in range(self.cols):
+                self.set_cell(r, c, grid.grid[r][c], grid.discovered[r][c])
+        self._grid_version = grid.version
+        self.set_player(player.row, player.col)
+        self.set_cursor(player.sel_row, player.sel_col)
+        self.set_inventory(inventory)
+
+    def sync(self, grid, player, inventory):
+        """
+        Met à jour depuis l'état courant en ne touchant que ce qui a changé
+        (cases comparées seulement si Grid.version a bougé).
+        """
+        if grid.version != self._grid_version:
+            rooms, discovered = self._rooms, self._discovered
+            for r in range(self.rows):
+                grid_row, disc_row = grid.grid[r], grid.discovered[r]
+                for c in range(self.cols):
+                    if grid_row[c] is not rooms[r][c] or disc_row[c] != discovered[r][c]:
+                        self.set_cell(r, c, grid_row[c], disc_row[c])
+            self._grid_version = grid.version
+        self.set_player(player.row, player.col)
+        self.set_cursor(player.sel_row, player.sel_col)
+        self.set_inventory(inventory)
+
+    # --------------------
+    # Mises à jour élémentaires
+    # --------------------
+    def _room_channels(self, room) -> tuple:
+        """(canal type, canal couleur, canal rareté), calculé une fois par contenu de salle."""
+        # Clé par contenu, pas par objet: le cache reste borné quelles que soient les parties
+        key = (room.room_type, room.color_type, room.rarity)
+        entry = self._channels.get(key)
+        if entry is None:
+            entry = (TYPE_OFFSET + _TYPE_INDEX.get(room.room_type, _TYPE_INDEX["other"]),
+                     COLOR_OFFSET + _COLOR_INDEX.get(room.color_type, _COLOR_INDEX["neutral"]),
+                     RARITY_OFFSET + max(0, min(RARITIES - 1, room.rarity)))
+            self._channels[key] = entry
+        return entry
+
+    def set_cell(self, r: int, c: int, room, discovered: bool = True):
+        board = self.board
+        old = self._rooms[r][c]
+        if old is not room:
+            if old is not None:
+                t, col, rar = self._room_channels(old)
+                board[t, r, c] = board[col, r, c] = board[rar, r, c] = 0
+            if room is not None:
+                t, col, rar = self._room_channels(room)
+                board[t, r, c] = board[col, r, c] = board[rar, r, c] = 1
+            self._rooms[r][c] = room
+        if discovered != self._discovered[r][c]:
+            board[DISCOVERED_CH, r, c] = 1 if discovered else 0
+            self._discovered[r][c] = discovered
+
+    def set_player(self, r: int, c: int):
+        self._player = self._move_marker(PLAYER_CH, self._player, (r, c))
+
+    def set_cursor(self, r: int, c: int):
+        self._cursor = self._move_marker(CURSOR_CH, self._cursor, (r, c))
+
+    def _move_marker(self, channel: int, old, new):
+        if old != new:
+            if old is not None:
+                self.board[channel, old[0], old[1]] = 0
+            self.board[channel, new[0], new[1]] = 1
+        return new
+
+    def set_inventory(self, inv):
+        self.inventory[:] = (inv.steps, inv.gold, inv.gems, inv.keys, inv.dice,
+                             inv.shovel, inv.hammer, inv.picklock_kit, inv.metal_detector, inv.rabbit_foot)
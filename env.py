@@ -0,0 +1,236 @@
+# env.py
+"""
+Environnement de type Gym pour entraîner / évaluer des joueurs automatiques.
+
+Construit directement sur Grid, Inventory, Player, le catalogue de salles et
+apply_room_effect, sans pygame ni affichage. L'entrée dans une nouvelle salle
+(clé, gemmes) passe par effects.can_enter / pay_entry, comme la modale du jeu.
+
+Actions (Discrete(7)):
+    0-3: se déplacer vers la case voisine (haut, bas, gauche, droite).
+         Case découverte: on y entre (1 pas + effet de la salle).
+         Case inconnue: tirage de 3 salles, l'environnement attend un choix.
+    4-6: choisir la salle 0, 1 ou 2 du tirage en cours.
+Une action impossible (hors grille, choix sans tirage, pas assez de gemmes
+ou de clé...) ne change rien; action_mask() indique les actions valides.
+
+Récompense: +1 en atteignant l'Antichambre, -1 quand les pas tombent à 0.
+
+Observation: dict de tableaux NumPy préalloués, mis à jour en place
+    "board": plans (canaux, lignes, colonnes) de encoder.ObservationEncoder
+    "inventory": vecteur d'inventaire de l'encodeur
+    "choices": [tirage en cours (0/1), index catalogue + 1 des 3 salles proposées]
+
+VectorMansionEnv fait avancer K environnements en un appel et renvoie les
+mêmes clés en lots (K, ...), réécrits à chaque pas sans allocation.
+
+Mesure: python env.py --bench
+"""
+
+import random
+
+import numpy as np
+
+from constants import GRID_ROWS, GRID_COLS
+from grid import Grid
+from inventory import Inventory
+from player import Player
+from effects import apply_room_effect, can_enter, pay_entry
+from rooms_catalog import get_catalog, draw_room_choices
+from encoder import ObservationEncoder, N_CHANNELS, INVENTORY_FIELDS
+
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+N_ACTIONS = 7
+
+
+def observation_shapes(rows: int = GRID_ROWS, cols: int = GRID_COLS) -> dict:
+    return {"board": (N_CHANNELS, rows, cols), "inventory": (len(INVENTORY_FIELDS),), "choices": (4,)}
+
+
+class MansionEnv:
+    """Une partie, pilotée par reset(seed) / step(action)."""
+
+    def __init__(self, rows: int = GRID_ROWS, cols: int = GRID_COLS, max_actions: int = 1000,
+                 obs_out: dict | None = None):
+        self.rows = rows
+        self.cols = cols
+        self.max_actions = max_actions
+        if obs_out is None:
+            obs_out = {key: np.zeros(shape, dtype=np.float32)
+                       for key, shape in observation_shapes(rows, cols).items()}
+        self.obs = obs_out
+        self.encoder = ObservationEncoder(rows, cols, board=obs_out["board"], inventory=obs_out["inventory"])
+        self._choices_obs = obs_out["choices"]
+        self.rng = random.Random()
+        self.catalog = get_catalog()
+        self.catalog_codes = {id(room): i + 1 for i, room in enumerate(self.catalog)}
+        self.reset()
+
+    # --------------------
+    # API
+    # --------------------
+    def reset(self, seed: int | None = None) -> dict:
+        if seed is not None:
+            self.rng.seed(seed)
+        self.grid = Grid(rows=self.rows, cols=self.cols)
+        self.inventory = Inventory()
+        self.player = Player(start_row=self.rows - 1, start_col=0, inventory=self.inventory)
+        self.choices: list | None = None
+        self.choice_target: tuple | None = None
+        self.actions = 0
+        self.done = False
+
+        self.encoder.encode(self.grid, self.player, self.inventory)
+        self._choices_obs[:] = 0
+        return self.obs
+
+    def step(self, action: int):
+        """Retourne (observation, récompense, terminé, info)."""
+        if self.done:
+            return self.obs, 0.0, True, {"invalid": True}
+        self.actions += 1
+        valid = self._move(action) if action < 4 else self._choose(action - 4)
+
+        reward = 0.0
+        player = self.player
+        if self.grid.grid[player.row][player.col].room_type == "exit":
+            reward, self.done = 1.0, True
+        elif self.inventory.steps <= 0:
+            reward, self.done = -1.0, True
+        elif self.actions >= self.max_actions:
+            self.done = True
+        self._write_state()
+        return self.obs, reward, self.done, {"invalid": not valid}
+
+    def action_mask(self) -> list:
+        """Liste de 7 booléens: actions qui changent l'état."""
+        if self.done:
+            return [False] * N_ACTIONS
+        if self.choices is not None:
+            return [False] * 4 + [can_enter(room, self.inventory) for room in self.choices]
+        r, c = self.player.row, self.player.col
+        moves = [0 <= r + dr < self.rows and 0 <= c + dc < self.cols for dr, dc in MOVES]
+        return moves + [False] * 3
+
+    # --------------------
+    # Règles (mêmes que GameManager)
+    # --------------------
+    def _move(self, action: int) -> bool:
+        if self.choices is not None:
+            return False
+        dr, dc = MOVES[action]
+        r, c = self.player.row + dr, self.player.col + dc
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return False
+        if self.grid.discovered[r][c]:
+            self.player.move_to(r, c)
+            apply_room_effect(self.grid.grid[r][c], self.player, self.inventory, self.grid, self.rng)
+        else:
+            self.choices = draw_room_choices(self.catalog, self.rng)
+            self.choice_target = (r, c)
+        return True
+
+    def _choose(self, idx: int) -> bool:
+        if self.choices is None:
+            return False
+        room = self.choices[idx]
+        inventory = self.inventory
+        if not can_enter(room, inventory):
+            return False
+        pay_entry(room, inventory)
+        r, c = self.choice_target
+        self.grid.set_room(r, c, room)
+        self.encoder.set_cell(r, c, room)
+        self.player.move_to(r, c)
+        apply_room_effect(room, self.player, inventory, self.grid, self.rng)
+        self.choices = None
+        self.choice_target = None
+        return True
+
+    def _write_state(self):
+        """Mise à jour incrémentale: joueur (le curseur le suit), inventaire, tirage."""
+        encoder, player = self.encoder, self.player
+        encoder.set_player(player.row, player.col)
+        encoder.set_cursor(player.row, player.col)
+        encoder.set_inventory(self.inventory)
+        choices = self.choices
+        if choices is None:
+            if self._choices_obs[0]:
+                self._choices_obs[:] = 0
+        else:
+            codes = self.catalog_codes
+            self._choices_obs[:] = (1, codes[id(choices[0])], codes[id(choices[1])], codes[id(choices[2])])
+
+
+class VectorMansionEnv:
+    """
+    K environnements avancés ensemble. Les environnements terminés sont
+    remis à zéro automatiquement (l'observation renvoyée est alors celle de
+    la nouvelle partie, la récompense et done celles de la fin de partie).
+    """
+
+    def __init__(self, num_envs: int, seed: int | None = None, **env_kwargs):
+        self.num_envs = num_envs
+        shapes = observation_shapes(env_kwargs.get("rows", GRID_ROWS), env_kwargs.get("cols", GRID_COLS))
+        self.obs = {key: np.zeros((num_envs,) + shape, dtype=np.float32) for key, shape in shapes.items()}
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=np.bool_)
+        self.envs = [MansionEnv(obs_out={key: batch[i] for key, batch in self.obs.items()}, **env_kwargs)
+                     for i in range(num_envs)]
+        self.reset(seed)
+
+    def reset(self, seed: int | None = None) -> dict:
+        seeds = np.random.SeedSequence(seed).generate_state(self.num_envs).tolist()
+        for env, env_seed in zip(self.envs, seeds):
+            env.reset(env_seed)
+        return self.obs
+
+    def step(self, actions):
+        """actions: séquence de K entiers. Retourne (obs, rewards, dones, infos)."""
+        rewards, dones = self.rewards, self.dones
+        for i, (env, action) in enumerate(zip(self.envs, np.asarray(actions).tolist())):
+            _, reward, done, _ = env.step(action)
+            rewards[i] = reward
+            dones[i] = done
+            if done:
+                env.reset()
+        return self.obs, rewards, dones, {}
+
+    def action_masks(self) -> np.ndarray:
+        return np.array([env.action_mask() for env in self.envs], dtype=np.bool_)
+
+
+def _bench(num_envs: int = 64, steps: int = 2000, seed: int = 0):
+    import time
+
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, N_ACTIONS, size=(steps, num_envs))
+
+    env = MansionEnv()
+    env.reset(seed)
+    flat = actions[:, 0].tolist() * 20
+    start = time.perf_counter()
+    for action in flat:
+        if env.step(action)[2]:
+            env.reset()
+    single = len(flat) / (time.perf_counter() - start)
+
+    venv = VectorMansionEnv(num_envs, seed=seed)
+    start = time.perf_counter()
+    for row in actions:
+        venv.step(row)
+    vector = steps * num_envs / (time.perf_counter() - start)
+    print(f"MansionEnv: {single:,.0f} pas/s   VectorMansionEnv(K={num_envs}): {vector:,.0f} pas/s")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Environnement Blue Prince pour agents.")
+    parser.add_argument("--bench", action="store_true", help="mesurer le débit (pas par seconde)")
+    parser.add_argument("--envs", type=int, default=64)
+    args = parser.parse_args()
+    if args.bench:
+        _bench(num_envs=args.envs)
+    else:
+        parser.print_help()
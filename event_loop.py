@@ -0,0 +1,32 @@
+# event_loop.py
+"""Récupération des événements: polling plein régime ou attente bloquante au repos."""
+
+import pygame
+
+from constants import IDLE_WAIT_MS
+
+# Posté par un thread de travail quand son résultat est prêt: réveille la boucle au repos
+ADVICE_READY = pygame.event.custom_type()
+
+
+def post_wake(event_type: int):
+    """Poste un événement depuis n'importe quel thread (sans effet sans fenêtre: bench, env)."""
+    if pygame.display.get_init():
+        pygame.event.post(pygame.event.Event(event_type))
+
+
+def next_events(idle: bool, timeout_ms: int = IDLE_WAIT_MS) -> list:
+    """
+    Retourne les événements en attente.
+
+    idle=False: pygame.event.get() (non bloquant, boucle à FPS).
+    idle=True: bloque sur pygame.event.wait jusqu'au prochain événement ou au
+    timeout, puis vide la file. Le processus ne consomme rien pendant l'attente
+    et se réveille dès qu'une touche arrive (pas de latence ajoutée).
+    """
+    if not idle:
+        return pygame.event.get()
+    first = pygame.event.wait(timeout_ms)
+    if first.type == pygame.NOEVENT:
+        return []
+    return [first] + pygame.event.get()
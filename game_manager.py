@@ -1,36 +1,84 @@
 # game_manager.py
 """GameManager: orchestrates the game, events, update and draw calls."""
 
-import os
-import random
+from dataclasses import astuple
+from functools import partial
+
 import pygame
 
 from constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, GRID_ROWS, GRID_COLS,
-    FONT_DIR, AUDIO_DIR, FPS,
+    WINDOW_WIDTH, WINDOW_HEIGHT, GRID_ROWS, GRID_COLS, GRID_AREA_WIDTH,
     BLACK, WHITE, CURSOR_COLOR
 )
 from grid import Grid, Room
 from player import Player
 from inventory import Inventory
-from ui import draw_grid, draw_inventory, draw_message
-from effects import apply_room_effect
+from ui import draw_grid_highlights
+from compositor import LayerCompositor
+from effects import apply_room_effect, entry_requirement, pay_entry
+from rooms_catalog import get_catalog, draw_room_choices
+from zobrist import state_hash
+from advisor import RoomAdvisor
+from outcomes import room_outcomes
+from hints import HintEngine
+from app_context import AppContext, get_context
+from keymap import get_keymap
+from event_loop import ADVICE_READY, post_wake
+from log import get_logger
+from scheduler import GAME
+from sound_managener import play_effect
+
+NOTICE_SECONDS = 2.5  # game time a transient message stays up (notify)
+
+log = get_logger("input")
 
 
 class GameManager:
     """Main game class (GameManager)."""
 
-    def __init__(self, width: int | None = None, height: int | None = None):
-        pygame.init()
-        pygame.display.set_caption("Blue Prince - POO")
-
-        if width is None:
-            width = WINDOW_WIDTH
-        if height is None:
-            height = WINDOW_HEIGHT
-
-        self.screen = pygame.display.set_mode((width, height))
-        self.clock = pygame.time.Clock()
+    def __init__(self, width: int | None = None, height: int | None = None, context: AppContext | None = None):
+        # Window, fonts, images and audio live in the process-wide context (created once)
+        self.context = context if context is not None else get_context(width, height)
+        self.screen = self.context.screen
+        self.clock = self.context.clock
+        self.scheduler = self.context.scheduler
+        self.font = self.context.font
+        self.large_font = self.context.large_font
+
+        # Cached static layers (grid, inventory panel, modal backdrop)
+        self.layers = LayerCompositor()
+
+        # Win-probability estimates for the modal options, computed on a worker thread
+        # (which wakes the idle main loop up so the result gets drawn)
+        self.advisor = RoomAdvisor(on_ready=partial(post_wake, ADVICE_READY))
+
+        # Exit reachability hint, toggled with H (off again on each new game, see reset)
+        self.hints = HintEngine()
+
+        # Action -> handler per keymap context (dispatched by perform)
+        self.keymap = get_keymap()
+        self._handlers = {
+            "game": {
+                "cursor_up": partial(self._move_cursor, -1, 0),
+                "cursor_down": partial(self._move_cursor, 1, 0),
+                "cursor_left": partial(self._move_cursor, 0, -1),
+                "cursor_right": partial(self._move_cursor, 0, 1),
+                "enter_room": self._enter_room,
+                "toggle_hint": self._toggle_hint,
+                "recenter": self._recenter,
+            },
+            "modal": {
+                "choice_prev": self._choice_prev,
+                "choice_next": self._choice_next,
+                "choice_confirm": self._confirm_choice,
+                "choice_cancel": self._cancel_choice,
+            },
+        }
+
+        self.reset()
+
+    def reset(self):
+        """New game: only the model (Grid, Inventory, Player) and the game state are rebuilt."""
         self.running = True
 
         # Core model
@@ -43,155 +91,147 @@ class GameManager:
         self.player = Player(start_row=start_r, start_col=start_c, inventory=self.inventory)
         self.grid.discover(start_r, start_c)
 
-        # UI / fonts
-        font_path = os.path.join(FONT_DIR, "OpenSans-Regular.ttf")
-        if os.path.exists(font_path):
-            self.font = pygame.font.Font(font_path, 16)
-            self.large_font = pygame.font.Font(font_path, 20)
-        else:
-            self.font = pygame.font.SysFont("arial", 16)
-            self.large_font = pygame.font.SysFont("arial", 20, bold=True)
-
-        # Audio
-        try:
-            pygame.mixer.init()
-            music_path_mp3 = os.path.join(AUDIO_DIR, "main_theme.mp3")
-            music_path_wav = os.path.join(AUDIO_DIR, "main_theme.wav")
-            if os.path.exists(music_path_mp3):
-                pygame.mixer.music.load(music_path_mp3)
-                pygame.mixer.music.set_volume(0.5)
-                pygame.mixer.music.play(-1)
-            elif os.path.exists(music_path_wav):
-                pygame.mixer.music.load(music_path_wav)
-                pygame.mixer.music.set_volume(0.5)
-                pygame.mixer.music.play(-1)
-        except Exception:
-            pass  # audio not critical
-
         # State
-        self.message = "ZQSD pour deplacer le curseur. Espace pour entrer."
+        keys = self.keymap
+        cursor = "".join(keys.label_for(a, "game") for a in ("cursor_up", "cursor_left", "cursor_down", "cursor_right"))
+        self.message = f"{cursor} pour deplacer le curseur. {keys.label_for('enter_room', 'game')} pour entrer."
         self.in_modal = False
         self.modal_options: list[Room] = []
         self.selected_choice_idx = 0
         self.modal_target_pos: tuple | None = None
+        self.show_hint = False
+        self.advisor.cancel()
+        # Game-time timers belong to the game they were started in
+        self.scheduler.clear(GAME)
+        self._notice = None
+        self._notice_message = self._notice_previous = ""
+
+        # Optional replay.ReplayRecorder (BP_RECORD=1)
+        self.recorder = None
+
+    def notify(self, message: str, duration: float = NOTICE_SECONDS):
+        """Transient message: the previous one comes back after duration seconds of game time."""
+        if self._notice is not None:
+            self._notice.cancel()
+        if not self._showing_notice():
+            self._notice_previous = self.message
+        # else: a notice replacing a notice restores the message from before both
+        self.message = self._notice_message = message
+        self._notice = self.scheduler.after(duration, self._end_notice)
+
+    def _showing_notice(self) -> bool:
+        return self._notice is not None and self.message == self._notice_message
+
+    def _end_notice(self):
+        # Unless something else was written since
+        if self.message == self._notice_message:
+            self.message = self._notice_previous
+        self._notice = None
 
     # --------------------
-    # Event handling
+    # Input: keymap actions (keymap.py)
     # --------------------
+    def input_context(self) -> str:
+        """Keymap context of the game: the room choice modal or the grid."""
+        return "modal" if self.in_modal else "game"
+
     def handle_events_from_main(self, events):
         """
         Maneja eventos pasados desde main.py
-        Procesa movimiento del cursor y acciones del jugador
+        Cada KEYDOWN se traduce en acción por el keymap (un lookup) y se ejecuta con perform
         """
         for event in events:
-            if event.type == pygame.KEYDOWN:
-                # Modal open?
-                if self.in_modal:
-                    self._handle_modal_key(event.key)
-                    continue
-
-                # Cursor movement - ZQSD
-                if event.key == pygame.K_z:
-                    self.player.move_cursor(-1, 0, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved UP to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_s:
-                    self.player.move_cursor(1, 0, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved DOWN to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_q:
-                    self.player.move_cursor(0, -1, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved LEFT to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_d:
-                    self.player.move_cursor(0, 1, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved RIGHT to ({self.player.sel_row}, {self.player.sel_col})")
-                
-                # Arrow keys
-                elif event.key == pygame.K_UP:
-                    self.player.move_cursor(-1, 0, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved UP to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_DOWN:
-                    self.player.move_cursor(1, 0, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved DOWN to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_LEFT:
-                    self.player.move_cursor(0, -1, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved LEFT to ({self.player.sel_row}, {self.player.sel_col})")
-                elif event.key == pygame.K_RIGHT:
-                    self.player.move_cursor(0, 1, self.grid.rows, self.grid.cols)
-                    print(f"DEBUG: Cursor moved RIGHT to ({self.player.sel_row}, {self.player.sel_col})")
-
-                elif event.key == pygame.K_SPACE:
-                    print(f"DEBUG: SPACE pressed at cursor ({self.player.sel_row}, {self.player.sel_col})")
-                    sr, sc = self.player.sel_row, self.player.sel_col
-                    if self.player.can_move_to(sr, sc):
-                        if self.grid.is_discovered(sr, sc):
-                            self.player.move_to(sr, sc)
-                            room = self.grid.get_room(sr, sc)
-                            effect_msg = apply_room_effect(room, self.player, self.inventory, self.grid)
-                            self.message = f"{effect_msg} | Pas restants: {self.inventory.steps}"
-                            if room.room_type == "exit":
-                                self.message = "You Win! Appuyez sur ESC pour quitter."
-                                self.running = False
-                        else:
-                            self.open_door_modal(sr, sc)
-                    else:
-                        self.message = "La destination doit être adjacente au joueur."
-
-                elif event.key == pygame.K_RETURN:
-                    self.player.reset_cursor_to_player()
-                    self.message = "Curseur recentré."
-                    print(f"DEBUG: Cursor reset to player position ({self.player.row}, {self.player.col})")
-
-    def handle_events(self):
-        """Método original - NO USAR, solo para compatibilidad"""
-        pass
+            action = self.keymap.resolve_event((self.input_context(),), event)
+            if action is not None:
+                self.perform(action)
+
+    def perform(self, action: str) -> bool:
+        """
+        Applies an action of the current context without any pygame event (bots, replays).
+        Returns False if the action does nothing in that context (e.g. "cursor_up" in the modal).
+        """
+        handler = self._handlers[self.input_context()].get(action)
+        if handler is None:
+            return False
+        if self.recorder is not None:
+            self.recorder.record(action, self)
+        handler()
+        return True
+
+    def _move_cursor(self, dr: int, dc: int):
+        self.player.move_cursor(dr, dc, self.grid.rows, self.grid.cols)
+        log.debug("Cursor moved (%d, %d) to (%d, %d)", dr, dc, self.player.sel_row, self.player.sel_col)
+
+    def _enter_room(self):
+        log.debug("SPACE pressed at cursor (%d, %d)", self.player.sel_row, self.player.sel_col)
+        sr, sc = self.player.sel_row, self.player.sel_col
+        if self.player.can_move_to(sr, sc):
+            if self.grid.is_discovered(sr, sc):
+                self.player.move_to(sr, sc)
+                play_effect("step")
+                room = self.grid.get_room(sr, sc)
+                effect_msg = apply_room_effect(room, self.player, self.inventory, self.grid)
+                self.message = f"{effect_msg} | Pas restants: {self.inventory.steps}"
+                if room.room_type == "exit":
+                    self.message = f"You Win! Appuyez sur {self.keymap.label_for('quit_to_menu', 'end')} pour quitter."
+                    self.running = False
+            else:
+                self.open_door_modal(sr, sc)
+        else:
+            self.notify("La destination doit être adjacente au joueur.")
+
+    def _toggle_hint(self):
+        self.show_hint = not self.show_hint
+
+    def _recenter(self):
+        self.player.reset_cursor_to_player()
+        self.notify("Curseur recentré.")
+        log.debug("Cursor reset to player position (%d, %d)", self.player.row, self.player.col)
 
     # --------------------
     # Modal handling
     # --------------------
-    def _handle_modal_key(self, key):
-        """Handle key presses when modal is open"""
-        if key in (pygame.K_q, pygame.K_LEFT):
-            self.selected_choice_idx = max(0, self.selected_choice_idx - 1)
-        elif key in (pygame.K_d, pygame.K_RIGHT):
-            self.selected_choice_idx = min(len(self.modal_options) - 1, self.selected_choice_idx + 1)
-        elif key == pygame.K_RETURN or key == pygame.K_SPACE:
-            if not self.modal_options or self.modal_target_pos is None:
-                self.in_modal = False
-                return
-
-            choice = self.modal_options[self.selected_choice_idx]
-            
-            # Check if room requires key to enter
-            if choice.effect_data.get("requires_key_to_enter", False):
-                if self.inventory.keys > 0:
-                    self.inventory.keys -= 1
-                    self.message = f"Vous utilisez une clé pour entrer dans {choice.name}."
-                else:
-                    self.message = f"Vous avez besoin d'une clé pour entrer dans {choice.name}."
-                    return
-            
-            # Check gem cost
-            cost = choice.cost_gems
-            if cost > 0:
-                ok = self.inventory.use_gems(cost)
-                if not ok:
-                    self.message = f"Pas assez de gemmes pour choisir {choice.name}."
-                    return
-
-            tr, tc = self.modal_target_pos
-            self.grid.set_room(tr, tc, choice)
-            self.player.move_to(tr, tc)
-            effect_msg = apply_room_effect(choice, self.player, self.inventory, self.grid)
+    def _choice_prev(self):
+        self.selected_choice_idx = max(0, self.selected_choice_idx - 1)
 
-            self.in_modal = False
-            self.modal_options = []
-            self.selected_choice_idx = 0
-            self.modal_target_pos = None
-            self.message = f"{effect_msg} | Pas restants: {self.inventory.steps}"
+    def _choice_next(self):
+        self.selected_choice_idx = min(len(self.modal_options) - 1, self.selected_choice_idx + 1)
 
-        elif key == pygame.K_ESCAPE:
+    def _confirm_choice(self):
+        if not self.modal_options or self.modal_target_pos is None:
             self.in_modal = False
-            self.modal_options = []
-            self.message = "Choix annulé."
+            return
+
+        choice = self.modal_options[self.selected_choice_idx]
+
+        # Key and gem cost are both checked before anything is paid (same rules as env.py)
+        missing = entry_requirement(choice, self.inventory)
+        if missing == "key":
+            self.message = f"Vous avez besoin d'une clé pour entrer dans {choice.name}."
+            return
+        if missing == "gems":
+            self.message = f"Pas assez de gemmes pour choisir {choice.name}."
+            return
+        pay_entry(choice, self.inventory)
+
+        tr, tc = self.modal_target_pos
+        self.grid.set_room(tr, tc, choice)
+        self.player.move_to(tr, tc)
+        play_effect("door")
+        effect_msg = apply_room_effect(choice, self.player, self.inventory, self.grid)
+
+        self.in_modal = False
+        self.modal_options = []
+        self.selected_choice_idx = 0
+        self.modal_target_pos = None
+        self.advisor.cancel()
+        self.message = f"{effect_msg} | Pas restants: {self.inventory.steps}"
+
+    def _cancel_choice(self):
+        self.in_modal = False
+        self.modal_options = []
+        self.advisor.cancel()
+        self.message = "Choix annulé."
 
     # --------------------
     # Door / room generation
@@ -201,160 +241,123 @@ class GameManager:
         Opens modal to choose from 3 randomly drawn rooms.
         Only includes actual ROOMS, not items (items are inside rooms).
         """
-        # Catalog of actual ROOMS (not items/objects)
-        candidate_rooms = [
-            # Blue rooms (common, neutral)
-            Room("Couloir", image_name="Couloir.png", room_type="neutral", 
-                 cost_gems=0, color_type="blue", rarity=0),
-            Room("Salle Vide", image_name="room_default.png", room_type="neutral", 
-                 cost_gems=0, color_type="blue", rarity=0),
-            
-            # Green rooms (gardens - contain permanent items or dig spots)
-            Room("Bibliothèque", image_name="bibliotheque.png", room_type="bibliotheque", 
-                 cost_gems=1, color_type="green", rarity=1, 
-                 effect_data={"gems": 1}),
-            Room("Veranda", image_name="Veranda.png", room_type="veranda", 
-                 cost_gems=2, color_type="green", rarity=2,
-                 effect_data={"boost_green": True}),
-            
-            # Yellow rooms (workshops - contain keys)
-            Room("Atelier", image_name="atelier.png", room_type="atelier", 
-                 cost_gems=1, color_type="yellow", rarity=1,
-                 effect_data={"keys": 1}),
-            
-            # Violet rooms (bedrooms - contain food)
-            Room("Chambre", image_name="Chambre.png", room_type="bedroom", 
-                 cost_gems=1, color_type="violet", rarity=1,
-                 effect_data={"has_food": True}),
-            
-            # Orange rooms (corridors - many doors)
-            Room("Grand Couloir", image_name="room_default.png", room_type="corridor", 
-                 cost_gems=0, color_type="orange", rarity=0),
-            
-            # Red rooms (dangerous - traps)
-            Room("Salle Piégée", image_name="piege.png", room_type="piege", 
-                 cost_gems=0, color_type="red", rarity=1,
-                 effect_data={"trap_damage": 5}),
-            
-            # Special rooms with containers
-            Room("Salle Trésor", image_name="salle_tresor.png", room_type="tresor", 
-                 cost_gems=2, color_type="yellow", rarity=2,
-                 effect_data={"gold": 5}),
-            Room("Salle aux Coffres", image_name="coffre.png", room_type="coffre", 
-                 cost_gems=1, color_type="blue", rarity=1,
-                 effect_data={"chest_count": 1, "requires_key": True}),
-            Room("Vestiaire", image_name="casiers.png", room_type="casier", 
-                 cost_gems=1, color_type="blue", rarity=1,
-                 effect_data={"locker_count": 2, "requires_key": True}),
-            Room("Jardin", image_name="Jardin.png", room_type="creuser", 
-                 cost_gems=1, color_type="green", rarity=1,
-                 effect_data={"dig_spots": 1, "requires_shovel": True}),
-            
-            # Locked room (requires key to enter)
-            Room("Coffre-Fort", image_name="coffre.png", room_type="locked_room",
-                 cost_gems=2, color_type="yellow", rarity=2,
-                 effect_data={"gold": 10, "gems": 2, "requires_key_to_enter": True}),
-        ]
-
-        # Filter out exit room
-        candidate_rooms = [rm for rm in candidate_rooms if rm.room_type != "exit"]
-
-        # Select 3 rooms
-        if len(candidate_rooms) <= 3:
-            choices = candidate_rooms[:]
-        else:
-            # Draw according to rarity weights
-            weights = [rm.get_probability_weight() for rm in candidate_rooms]
-            choices = random.choices(candidate_rooms, weights=weights, k=3)
-
-        # Ensure at least one free room (cost_gems == 0)
-        if not any(rm.cost_gems == 0 for rm in choices):
-            free_rooms = [rm for rm in candidate_rooms if rm.cost_gems == 0]
-            if free_rooms:
-                choices[0] = random.choice(free_rooms)
+        choices = draw_room_choices(get_catalog())
 
         self.in_modal = True
         self.modal_options = choices
         self.modal_target_pos = (r, c)
         self.selected_choice_idx = 0
-        self.message = "Choisissez une salle avec Q/D et validez avec Entrée."
+        self.advisor.request(self.grid, self.player, self.inventory, choices, (r, c))
+        keys = self.keymap
+        self.message = (f"Choisissez une salle avec {keys.label_for('choice_prev', 'modal')}/"
+                        f"{keys.label_for('choice_next', 'modal')} et validez avec "
+                        f"{keys.label_for('choice_confirm', 'modal')}.")
 
     # --------------------
-    # Update / Draw / Loop
+    # Update / Draw (the loop is scenes.App.run)
     # --------------------
     def update(self):
         if self.inventory.is_dead():
-            self.message = "Vous n'avez plus de pas. Partie terminée. Appuyez sur ESC."
+            self.message = (f"Vous n'avez plus de pas. Partie terminée. "
+                            f"Appuyez sur {self.keymap.label_for('quit_to_menu', 'end')}.")
             self.running = False
 
+    def state_hash(self) -> int:
+        """Empreinte 64 bits de la partie (grille, joueur, inventaire), en O(1)."""
+        return state_hash(self.grid, self.player, self.inventory)
+
+    def is_animating(self) -> bool:
+        """True while something changes on screen without input (the main loop then keeps its frame rate)."""
+        return self.in_modal and self.advisor.pending()
+
     def draw(self):
-        self.screen.fill(BLACK)
-        draw_grid(self.screen, self.grid, (self.player.row, self.player.col),
-                  (self.player.sel_row, self.player.sel_col))
-        draw_inventory(self.screen, self.inventory, self.font)
-        draw_message(self.screen, self.font, self.message)
+        # Static layers are cached and only re-rendered when the grid or inventory change
+        self.screen.blit(self.layers.grid_layer(self.grid), (0, 0))
+        self.screen.blit(self.layers.inventory_layer(self.inventory, self.font), (GRID_AREA_WIDTH, 0))
+        draw_grid_highlights(self.screen, self.grid, (self.player.row, self.player.col),
+                             (self.player.sel_row, self.player.sel_col))
+        msg = self.layers.text(self.font, self.message)
+        self.screen.blit(msg, msg.get_rect(center=(GRID_AREA_WIDTH // 2, WINDOW_HEIGHT - 20)))
+        if self.show_hint:
+            hint = self.hints.hint(self.grid, self.player, self.inventory)
+            hint_txt = self.layers.text(self.font, hint.describe(), CURSOR_COLOR, name="hint")
+            self.screen.blit(hint_txt, hint_txt.get_rect(center=(GRID_AREA_WIDTH // 2, WINDOW_HEIGHT - 44)))
         if self.in_modal and self.modal_options:
             self._draw_modal()
 
     def _draw_modal(self):
         """Draw modal with room name, color, and cost"""
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.layers.backdrop((WINDOW_WIDTH, WINDOW_HEIGHT), (0, 0, 0, 180)), (0, 0))
 
         w, h = 620, 280
         x = (WINDOW_WIDTH - w) // 2
         y = (WINDOW_HEIGHT - h) // 2
-        pygame.draw.rect(self.screen, WHITE, (x, y, w, h))
-        pygame.draw.rect(self.screen, BLACK, (x, y, w, h), 3)
+
+        # Advisor estimate per option (only the labels are computed each frame)
+        advice = self.advisor.advice()
+        if advice is None:
+            advice_labels = ("Analyse...",) * len(self.modal_options)
+        else:
+            advice_labels = tuple("Impossible" if rate is None else f"Victoire: {rate:.0%}"
+                                  for rate in advice.win_rates)
+
+        # The box is re-rendered only when the options, selection, advice or inventory change
+        key = (tuple(map(id, self.modal_options)), self.selected_choice_idx, advice_labels,
+               astuple(self.inventory), id(self.font))
+        box = self.layers.modal_layer(key, (w, h), partial(self._render_modal, advice_labels=advice_labels))
+        self.screen.blit(box, (x, y))
+
+    def _render_modal(self, surf: pygame.Surface, advice_labels: tuple):
+        w, h = surf.get_size()
+        surf.fill(WHITE)
+        pygame.draw.rect(surf, BLACK, (0, 0, w, h), 3)
 
         # Title
         title_txt = self.large_font.render("Choisissez une salle:", True, BLACK)
-        self.screen.blit(title_txt, (x + 20, y + 15))
+        surf.blit(title_txt, (20, 15))
 
         spacing = 20
         box_w = (w - 4 * spacing) // 3
         box_h = h - 100
-        bx = x + spacing
-        by = y + 60
+        bx = spacing
+        by = 60
 
         for idx, room in enumerate(self.modal_options):
             rect = pygame.Rect(bx + idx * (box_w + spacing), by, box_w, box_h)
             
             # Background with room color
-            pygame.draw.rect(self.screen, room.color, rect)
-            pygame.draw.rect(self.screen, BLACK, rect, 2)
+            pygame.draw.rect(surf, room.color, rect)
+            pygame.draw.rect(surf, BLACK, rect, 2)
             
             # Room name
             name_txt = self.font.render(room.name, True, BLACK)
-            self.screen.blit(name_txt, (rect.x + 6, rect.y + 6))
+            surf.blit(name_txt, (rect.x + 6, rect.y + 6))
             
             # Color type
             color_txt = self.font.render(f"({room.color_type})", True, BLACK)
-            self.screen.blit(color_txt, (rect.x + 6, rect.y + 26))
+            surf.blit(color_txt, (rect.x + 6, rect.y + 26))
             
             # Gem cost
             cost_txt = self.font.render(f"Cout: {room.cost_gems} gemmes", True, BLACK)
-            self.screen.blit(cost_txt, (rect.x + 6, rect.y + 46))
+            surf.blit(cost_txt, (rect.x + 6, rect.y + 46))
             
             # Rarity
             rarity_txt = self.font.render(f"Rarete: {room.rarity}/3", True, BLACK)
-            self.screen.blit(rarity_txt, (rect.x + 6, rect.y + 66))
+            surf.blit(rarity_txt, (rect.x + 6, rect.y + 66))
             
             # Key requirement indicator
             if room.effect_data.get("requires_key_to_enter", False):
                 key_txt = self.font.render("Cle requise!", True, (200, 0, 0))
-                self.screen.blit(key_txt, (rect.x + 6, rect.y + 86))
+                surf.blit(key_txt, (rect.x + 6, rect.y + 86))
+
+            # Advisor estimate
+            advice_txt = self.font.render(advice_labels[idx], True, BLACK)
+            surf.blit(advice_txt, (rect.x + 6, rect.y + 116))
+
+            # Exact expected effect (memoized per room and inventory profile)
+            expected_txt = self.font.render(room_outcomes(room, self.inventory).describe(), True, BLACK)
+            surf.blit(expected_txt, (rect.x + 6, rect.y + 136))
             
             # Highlight if selected
             if idx == self.selected_choice_idx:
-                pygame.draw.rect(self.screen, CURSOR_COLOR, rect, 5)
-
-    def run(self):
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        pygame.quit()
\ No newline at end of file
+                pygame.draw.rect(surf, CURSOR_COLOR, rect, 5)
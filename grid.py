@@ -1,9 +1,13 @@
+import itertools
 import os
-import random
-import pygame
 
-ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOM_DIR = os.path.join(ROOT_DIR, "rooms")
+import zobrist
+from constants import ROOM_IMG_DIR
+from app_context import images
+
+
+# Compteur global: deux grilles n'ont jamais la même version
+_versions = itertools.count(1)
 
 # Colors
 ROOM_COLORS = {
@@ -39,15 +43,29 @@ class Room:
         self.color_type = color_type
         self.rarity = rarity
 
-        self.image = None
-        if image_name:
-            full_path = os.path.join(ROOM_DIR, image_name)
-            if os.path.exists(full_path):
-                self.image = pygame.image.load(full_path).convert_alpha()
+        # Imagen cargada al primer acceso (ver image): crear una Room no toca el disco
+        self._image = None
+        self._image_loaded = False
 
         # Asignar color según color_type
         self.color = ROOM_COLORS.get(color_type, ROOM_COLORS["neutral"])
 
+    @property
+    def image(self):
+        """Superficie de la sala (o None), cargada la primera vez que se dibuja."""
+        if not self._image_loaded:
+            self._image_loaded = True
+            if self.image_name:
+                # Shared store: the entry/exit rooms of a new game reuse the loaded surfaces
+                self._image = images.load(os.path.join(ROOM_IMG_DIR, self.image_name))
+        return self._image
+
+    def image_at(self, size):
+        """Imagen escalada al tamaño de una celda (caché en memoria y en disco), o None."""
+        if not self.image_name:
+            return None
+        return images.load(os.path.join(ROOM_IMG_DIR, self.image_name), size)
+
     def get_probability_weight(self) -> float:
         """
         Calcula el peso de probabilidad según rareza.
@@ -74,6 +92,8 @@ class Grid:
         self.cols = cols
         self.grid = [[None for _ in range(cols)] for _ in range(rows)]
         self.discovered = [[False for _ in range(cols)] for _ in range(rows)]
+        # Change à chaque modification visible (sert à invalider les caches de rendu)
+        self.version = next(_versions)
 
         # Entree 
         self.start_pos = (rows - 1, 0)
@@ -100,6 +120,9 @@ class Grid:
         )
         self.discovered[exit_r][exit_c] = True
 
+        # Empreinte de Zobrist, tenue à jour par set_room / discover (voir zobrist.py)
+        self.zobrist = zobrist.grid_hash(self)
+
     # Getters
     def get_room(self, r, c):
         if 0 <= r < self.rows and 0 <= c < self.cols:
@@ -114,13 +137,24 @@ class Grid:
         """Coloca una room en la posición especificada"""
         if (r, c) == self.exit_pos:
             return False
+        self.zobrist ^= zobrist.room_key(r, c, self.grid[r][c]) ^ zobrist.room_key(r, c, room)
         self.grid[r][c] = room
-        self.discovered[r][c] = True
+        if not self.discovered[r][c]:
+            self.discovered[r][c] = True
+            self.zobrist ^= zobrist.discovered_key(r, c)
+        self.version = next(_versions)
         return True
 
     def discover(self, r, c):
-        if 0 <= r < self.rows and 0 <= c < self.cols:
+        if 0 <= r < self.rows and 0 <= c < self.cols and not self.discovered[r][c]:
             self.discovered[r][c] = True
+            self.zobrist ^= zobrist.discovered_key(r, c)
+            self.version = next(_versions)
+
+    def touch(self):
+        """Signale une modification faite directement sur grid/discovered."""
+        self.version = next(_versions)
+        self.zobrist = zobrist.grid_hash(self)
 
     def in_bounds(self, r, c):
         return 0 <= r < self.rows and 0 <= c < self.cols
\ No newline at end of file
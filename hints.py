@@ -0,0 +1,188 @@
+# hints.py
+"""
+Indice "la sortie est-elle encore atteignable ?".
+
+Recherche du plus court chemin (en déplacements) de la position du joueur à
+grid.exit_pos sur les états (case, pas, clés, gemmes):
+    - une case découverte applique l'effet de sa salle; on prend l'issue la
+      plus défavorable de outcomes.room_outcomes (moins de pas), pour qu'un
+      "atteignable" ne dépende pas de la chance
+    - une case inconnue compte comme la pire des salles gratuites du
+      catalogue (le tirage propose toujours au moins une salle gratuite, qui
+      peut être la Salle Piégée)
+    - chaque déplacement coûte un pas; un état à 0 pas est perdu.
+A* avec la distance de Manhattan; un état est élagué s'il est dominé (même
+case, clés, gemmes déjà atteints en au plus autant de déplacements avec au
+moins autant de pas) ou sans espoir (aucune salle ne rend de pas et il
+reste moins de pas que la distance).
+
+Mémoïsation:
+    - le modèle de chaque case (deltas avec et sans clé) n'est recalculé que
+      pour les cases dont la salle a changé depuis la dernière Grid.version vue;
+    - les résultats sont mis en cache par empreinte de Zobrist de l'état,
+      donc redessiner la même position ne relance pas la recherche.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+
+from inventory import Inventory
+from outcomes import FIELDS, room_outcomes
+from rooms_catalog import get_catalog
+from zobrist import state_hash
+
+CELL_OPEN, CELL_ROOM, CELL_EXIT = 0, 1, 2
+_NO_EFFECT = (0, 0, 0)
+# Plafonds des ressources dans la recherche (au-delà, les états sont confondus)
+STEPS_MARGIN = 30
+RESOURCE_CAP = 9
+CACHE_SIZE = 512
+
+_DELTA_FIELDS = tuple(FIELDS.index(name) for name in ("steps", "keys", "gems"))
+_WITH_KEY = Inventory(keys=1)
+_WITHOUT_KEY = Inventory(keys=0)
+
+
+@dataclass
+class Hint:
+    reachable: bool
+    moves: int = 0          # déplacements (donc pas dépensés) jusqu'à la sortie
+    steps_left: int = 0     # pas restants à l'arrivée, dans le pire cas
+    path: list = field(default_factory=list)  # cases traversées, sortie comprise
+
+    def describe(self) -> str:
+        if not self.reachable:
+            return "Sortie inatteignable"
+        return f"Sortie atteignable en {self.moves} pas"
+
+
+def worst_delta(room, inventory) -> tuple:
+    """(pas, clés, gemmes) de l'issue la moins favorable de la salle."""
+    worst = min(room_outcomes(room, inventory).outcomes,
+                key=lambda o: tuple(o.delta[i] for i in _DELTA_FIELDS))
+    return tuple(worst.delta[i] for i in _DELTA_FIELDS)
+
+
+_open_cell: tuple | None = None
+
+
+def open_cell_model() -> tuple:
+    """Modèle d'une case inconnue: pire issue des salles gratuites du catalogue (calculé une fois)."""
+    global _open_cell
+    if _open_cell is None:
+        free_rooms = [room for room in get_catalog() if room.cost_gems == 0]
+        if free_rooms:
+            _open_cell = (CELL_OPEN,
+                          min(worst_delta(room, _WITHOUT_KEY) for room in free_rooms),
+                          min(worst_delta(room, _WITH_KEY) for room in free_rooms))
+        else:
+            _open_cell = (CELL_OPEN, _NO_EFFECT, _NO_EFFECT)
+    return _open_cell
+
+
+class HintEngine:
+    """Cache du modèle de la grille + des réponses par état."""
+
+    def __init__(self):
+        self._grid = None
+        self._grid_version = None
+        self._rooms: list = []
+        self._cells: list = []      # [r][c] -> (type, delta sans clé, delta avec clé)
+        self._results: dict = {}
+        self.searches = 0           # recherches réellement lancées (debug)
+
+    def hint(self, grid, player, inventory) -> Hint:
+        key = state_hash(grid, player, inventory)
+        result = self._results.get(key)
+        if result is None:
+            self._sync(grid)
+            result = self._search(grid, player.row, player.col, inventory)
+            if len(self._results) >= CACHE_SIZE:
+                self._results.clear()
+            self._results[key] = result
+        return result
+
+    # --------------------
+    # Modèle des cases
+    # --------------------
+    def _sync(self, grid):
+        """Met à jour le modèle des seules cases modifiées depuis la dernière version."""
+        if grid is not self._grid:
+            self._grid = grid
+            self._grid_version = None
+            self._rooms = [[self] * grid.cols for _ in range(grid.rows)]  # sentinelle: tout à calculer
+            self._cells = [[None] * grid.cols for _ in range(grid.rows)]
+        if grid.version == self._grid_version:
+            return
+        for r in range(grid.rows):
+            for c in range(grid.cols):
+                room = grid.grid[r][c] if grid.discovered[r][c] else None
+                if room is not self._rooms[r][c]:
+                    self._rooms[r][c] = room
+                    self._cells[r][c] = self._cell_model(room)
+        self._grid_version = grid.version
+
+    @staticmethod
+    def _cell_model(room) -> tuple:
+        if room is None:
+            return open_cell_model()
+        if room.room_type == "exit":
+            return CELL_EXIT, _NO_EFFECT, _NO_EFFECT
+        return CELL_ROOM, worst_delta(room, _WITHOUT_KEY), worst_delta(room, _WITH_KEY)
+
+    # --------------------
+    # Recherche
+    # --------------------
+    def _search(self, grid, row: int, col: int, inventory) -> Hint:
+        self.searches += 1
+        rows, cols, cells = grid.rows, grid.cols, self._cells
+        exit_r, exit_c = grid.exit_pos
+        if (row, col) == (exit_r, exit_c):
+            return Hint(True, 0, inventory.steps, [])
+
+        steps_cap = inventory.steps + STEPS_MARGIN
+        # Borne: sans salle qui rend des pas, il faut au moins autant de pas que la distance
+        can_gain = any(cell[1][0] > 0 or cell[2][0] > 0 for line in cells for cell in line)
+
+        start = (row, col, inventory.steps, min(inventory.keys, RESOURCE_CAP), min(inventory.gems, RESOURCE_CAP))
+        frontier = {(row, col, start[3], start[4]): [(0, start[2])]}  # case+ressources -> [(déplacements, pas)]
+        # Entrées: (f, déplacements, n° d'ordre, état, chemin chaîné ((case), précédent))
+        order = itertools.count()
+        heap = [(abs(row - exit_r) + abs(col - exit_c), 0, next(order), start, None)]
+        while heap:
+            _, moves, _, state, trail = heapq.heappop(heap)
+            r, c, steps, keys, gems = state
+            if steps <= 0:
+                continue
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if not (0 <= nr < rows and 0 <= nc < cols):
+                    continue
+                kind, delta, delta_key = cells[nr][nc]
+                if kind == CELL_EXIT:
+                    return Hint(True, moves + 1, steps - 1, self._path(((nr, nc), trail)))
+                ds, dk, dg = delta_key if keys > 0 else delta
+                n_steps = min(steps - 1 + ds, steps_cap)
+                if n_steps <= 0:
+                    continue
+                distance = abs(nr - exit_r) + abs(nc - exit_c)
+                if not can_gain and n_steps < distance:
+                    continue
+                n_keys = max(0, min(keys + dk, RESOURCE_CAP))
+                n_gems = max(0, min(gems + dg, RESOURCE_CAP))
+                slot = (nr, nc, n_keys, n_gems)
+                seen = frontier.setdefault(slot, [])
+                if any(m <= moves + 1 and s >= n_steps for m, s in seen):
+                    continue
+                seen.append((moves + 1, n_steps))
+                child = (nr, nc, n_steps, n_keys, n_gems)
+                heapq.heappush(heap, (moves + 1 + distance, moves + 1, next(order), child, ((nr, nc), trail)))
+        return Hint(False)
+
+    @staticmethod
+    def _path(trail) -> list:
+        path = []
+        while trail is not None:
+            cell, trail = trail
+            path.append(cell)
+        return path[::-1]
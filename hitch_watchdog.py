@@ -0,0 +1,157 @@
+# hitch_watchdog.py
+"""
+Détection des frames lentes ("hitches").
+
+Un thread de surveillance vérifie que la boucle principale termine chaque
+frame en moins de WATCHDOG_MS. Sinon il relève la pile du thread principal
+pendant qu'il est bloqué, avec le dernier événement reçu et un résumé de
+l'état du jeu. Les N derniers incidents sont gardés en mémoire puis écrits
+dans hitches/hitches_<date>.jsonl à la fermeture.
+
+Activation: BP_WATCHDOG=1 (seuil par défaut) ou BP_WATCHDOG=<seuil en ms>.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import pygame
+
+from profiler import capture_stack
+
+_env = os.environ.get("BP_WATCHDOG", "")
+WATCHDOG_ENABLED = _env not in ("", "0")
+WATCHDOG_MS = float(_env) if _env.replace(".", "", 1).isdigit() and float(_env) > 1 else 50.0
+WATCHDOG_DIR = "hitches"
+MAX_INCIDENTS = 50
+
+
+def describe_event(event) -> str:
+    """Texte court pour un événement pygame ("KEYDOWN space", "QUIT"...)."""
+    name = pygame.event.event_name(event.type)
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return f"{name} {pygame.key.name(event.key)}"
+    return name
+
+
+class HitchWatchdog(threading.Thread):
+    """Thread qui relève la pile du thread principal quand une frame dépasse le seuil."""
+
+    enabled = True
+
+    def __init__(self, threshold_ms: float = WATCHDOG_MS, max_incidents: int = MAX_INCIDENTS,
+                 state_provider=None):
+        super().__init__(name="hitch-watchdog", daemon=True)
+        self.threshold = threshold_ms / 1000.0
+        self.incidents: deque = deque(maxlen=max_incidents)
+        self.state_provider = state_provider  # callable -> dict (résumé de l'état du jeu)
+        self.main_thread_id = threading.get_ident()
+        self.last_event = None
+        self._frame_started: float | None = None
+        self._pending: dict | None = None  # incident de la frame en cours
+        self._stop_event = threading.Event()
+
+    # --------------------
+    # Appelé par la boucle principale
+    # --------------------
+    def frame_start(self):
+        self._frame_started = time.perf_counter()
+
+    def frame_done(self):
+        """Fin de frame (ou attente d'input): la boucle n'est plus surveillée."""
+        started = self._frame_started
+        self._frame_started = None
+        pending = self._pending
+        if pending is not None and started is not None:
+            pending["frame_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        self._pending = None
+
+    def note_event(self, event):
+        self.last_event = describe_event(event)
+
+    # --------------------
+    # Thread de surveillance
+    # --------------------
+    def run(self):
+        period = self.threshold / 4
+        while not self._stop_event.wait(period):
+            started = self._frame_started
+            if started is None or self._pending is not None:
+                continue
+            elapsed = time.perf_counter() - started
+            if elapsed < self.threshold:
+                continue
+            stack = capture_stack(self.main_thread_id)
+            incident = {
+                "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                "elapsed_ms": round(elapsed * 1000.0, 2),
+                "frame_ms": None,  # complété en fin de frame
+                "last_event": self.last_event,
+                "state": self._state_summary(),
+                "stack": [f"{os.path.basename(file)}:{line} {name}" for name, file, line in stack],
+            }
+            # Si la frame s'est terminée entre-temps, l'incident reste valide (frame_ms = None)
+            if self._frame_started == started:
+                self._pending = incident
+            self.incidents.append(incident)
+
+    def _state_summary(self) -> dict | None:
+        if self.state_provider is None:
+            return None
+        try:
+            return self.state_provider()
+        except Exception as e:  # l'état peut changer pendant la lecture
+            return {"error": repr(e)}
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def dump(self, directory: str = WATCHDOG_DIR) -> str | None:
+        """Écrit les incidents gardés en mémoire (JSON lines). Retourne le chemin."""
+        if not self.incidents:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"hitches_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for incident in list(self.incidents):
+                f.write(json.dumps(incident, ensure_ascii=False) + "\n")
+        return path
+
+
+class NullWatchdog:
+    """Remplaçant sans effet quand le watchdog est désactivé."""
+
+    enabled = False
+    incidents = ()
+
+    def start(self):
+        pass
+
+    def frame_start(self):
+        pass
+
+    def frame_done(self):
+        pass
+
+    def note_event(self, event):
+        pass
+
+    def stop(self):
+        pass
+
+    def dump(self, directory: str = WATCHDOG_DIR):
+        return None
+
+
+def create_watchdog(state_provider=None):
+    """HitchWatchdog démarré si BP_WATCHDOG est défini, sinon NullWatchdog."""
+    if not WATCHDOG_ENABLED:
+        return NullWatchdog()
+    watchdog = HitchWatchdog(state_provider=state_provider)
+    watchdog.start()
+    return watchdog
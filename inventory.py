@@ -1,7 +1,9 @@
 # inventory.py
 """Inventory management: consumables and permanents."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import zobrist
 
 @dataclass
 class Inventory:
@@ -14,6 +16,9 @@ class Inventory:
         - keys: clefs
         - dice: dés
     Permanents: booleans representant objets trouvés.
+
+    L'attribut `zobrist` (hors champs) est l'empreinte du contenu, mise à jour
+    à chaque affectation d'un champ, y compris `inv.keys -= 1` (voir zobrist.py).
     """
     steps: int = 70
     gold: int = 0
@@ -27,6 +32,15 @@ class Inventory:
     metal_detector: bool = False
     rabbit_foot: bool = False
 
+    def __setattr__(self, name, value):
+        d = self.__dict__
+        if name in _FIELDS:
+            h = d.get("zobrist", 0)
+            if name in d:
+                h ^= zobrist.field_key(name, d[name])
+            d["zobrist"] = h ^ zobrist.field_key(name, value)
+        d[name] = value
+
     def decrement_steps(self, n: int = 1):
         """Retire des pas (pas négatifs ignorés)."""
         self.steps = max(0, self.steps - n)
@@ -66,3 +80,6 @@ class Inventory:
     def is_dead(self) -> bool:
         """Perdu si plus de pas."""
         return self.steps <= 0
+
+
+_FIELDS = frozenset(f.name for f in fields(Inventory))
@@ -0,0 +1,234 @@
+# keymap.py
+"""
+Table des touches: (contexte, touche, modificateurs) -> action.
+
+Le keymap décrit, pour chaque contexte, les touches de chaque action:
+    "game":  {"cursor_up": ["z", "up"], ...}
+    "play":  {"save": ["ctrl+s"], ...}
+Il est compilé une fois en un dict; resolve() fait au plus deux lookups par
+contexte actif (avec les modificateurs, puis sans), au lieu d'une chaîne de
+if/elif par écran.
+
+Contextes:
+    global  toujours actif (HUD, profilage)
+    menu    menu principal
+    play    partie en cours (pause, sauvegarde)
+    game    grille (curseur, entrer dans une salle)
+    modal   choix d'une salle
+    pause   jeu en pause
+    end     écran de victoire / game over
+    replay  visionneuse de replay.py
+
+Les touches se redéfinissent dans un fichier JSON de même forme (KEYMAP_PATH,
+variable BP_KEYMAP): seules les actions présentes sont remplacées.
+    {"game": {"cursor_up": ["w", "up"], "cursor_left": ["a", "left"]}}
+
+Les actions sont des noms; replay.py enregistre leur indice dans ACTIONS et
+les bots appellent directement GameManager.perform(action), sans événement.
+Les aides à l'écran (menu.py, messages du jeu) affichent Keymap.label_for(action):
+elles suivent les touches redéfinies.
+"""
+
+import json
+import os
+
+import pygame
+
+from constants import ROOT_DIR
+from log import get_logger
+
+KEYMAP_PATH = os.environ.get("BP_KEYMAP", os.path.join(ROOT_DIR, "keymap.json"))
+
+MOD_CTRL, MOD_SHIFT, MOD_ALT = 1, 2, 4
+_MOD_NAMES = {"ctrl": MOD_CTRL, "shift": MOD_SHIFT, "alt": MOD_ALT}
+# Noms affichés (les autres touches: en majuscules, "z" -> "Z", "f3" -> "F3")
+_KEY_LABELS = {
+    "escape": "Échap", "return": "Entrée", "space": "Espace", "tab": "Tab",
+    "up": "↑", "down": "↓", "left": "←", "right": "→",
+    "pageup": "Page↑", "pagedown": "Page↓", "home": "Début", "end": "Fin",
+    "ctrl": "Ctrl", "shift": "Maj", "alt": "Alt",
+}
+
+DEFAULT_KEYMAP = {
+    "global": {
+        "toggle_hud": ["f3"],
+        "profile_cprofile": ["f9"],
+        "profile_sampling": ["f10"],
+    },
+    "menu": {
+        "menu_up": ["up", "z"],
+        "menu_down": ["down", "s"],
+        "menu_select": ["return", "space"],
+    },
+    "play": {
+        "pause": ["p"],
+        "save": ["ctrl+s"],
+    },
+    "game": {
+        "cursor_up": ["z", "up"],
+        "cursor_down": ["s", "down"],
+        "cursor_left": ["q", "left"],
+        "cursor_right": ["d", "right"],
+        "enter_room": ["space"],
+        "toggle_hint": ["h"],
+        "recenter": ["return"],
+    },
+    "modal": {
+        "choice_prev": ["q", "left"],
+        "choice_next": ["d", "right"],
+        "choice_confirm": ["return", "space"],
+        "choice_cancel": ["escape"],
+    },
+    "pause": {
+        "pause": ["p"],
+        "save": ["ctrl+s"],
+        "quit_to_menu": ["escape"],
+    },
+    "end": {
+        "quit_to_menu": ["escape"],
+        "restart": ["r"],
+    },
+    "replay": {
+        "replay_quit": ["escape"],
+        "replay_play": ["space"],
+        "replay_next": ["right"],
+        "replay_prev": ["left"],
+        "replay_next_keyframe": ["pagedown"],
+        "replay_prev_keyframe": ["pageup"],
+        "replay_start": ["home"],
+        "replay_end": ["end"],
+    },
+}
+
+# L'indice d'une action est ce qu'enregistre replay.py: liste explicite, on ne fait
+# qu'ajouter à la fin (jamais insérer, retirer ni réordonner), quel que soit le contexte
+ACTIONS = (
+    "toggle_hud", "profile_cprofile", "profile_sampling",
+    "menu_up", "menu_down", "menu_select",
+    "pause", "save",
+    "cursor_up", "cursor_down", "cursor_left", "cursor_right", "enter_room", "toggle_hint", "recenter",
+    "choice_prev", "choice_next", "choice_confirm", "choice_cancel",
+    "quit_to_menu", "restart",
+    "replay_quit", "replay_play", "replay_next", "replay_prev",
+    "replay_next_keyframe", "replay_prev_keyframe", "replay_start", "replay_end",
+)
+ACTION_IDS = {action: i for i, action in enumerate(ACTIONS)}
+
+_unlisted = {action for bindings in DEFAULT_KEYMAP.values() for action in bindings} - set(ACTION_IDS)
+if _unlisted:
+    raise RuntimeError(f"actions absentes de keymap.ACTIONS: {sorted(_unlisted)}")
+
+log = get_logger("input")
+
+
+def event_mods(mod: int) -> int:
+    """Modificateurs pygame (KMOD_*) -> MOD_CTRL | MOD_SHIFT | MOD_ALT (verr. num/maj ignorés)."""
+    mods = 0
+    if mod & pygame.KMOD_CTRL:
+        mods |= MOD_CTRL
+    if mod & pygame.KMOD_SHIFT:
+        mods |= MOD_SHIFT
+    if mod & pygame.KMOD_ALT:
+        mods |= MOD_ALT
+    return mods
+
+
+def parse_binding(binding: str) -> tuple:
+    """ "ctrl+s" -> (pygame.K_s, MOD_CTRL). ValueError si la touche est inconnue."""
+    *mod_names, key_name = binding.lower().split("+")
+    mods = 0
+    for name in mod_names:
+        if name not in _MOD_NAMES:
+            raise ValueError(f"modificateur inconnu: {name!r} dans {binding!r}")
+        mods |= _MOD_NAMES[name]
+    # Constantes pygame: K_z, K_0, K_RETURN, K_F3... (sans pygame.key.key_code, qui exige pygame.init)
+    key = getattr(pygame, "K_" + (key_name if len(key_name) == 1 else key_name.upper()), None)
+    if not isinstance(key, int):
+        raise ValueError(f"touche inconnue: {key_name!r}")
+    return key, mods
+
+
+def binding_label(binding: str) -> str:
+    """ "ctrl+s" -> "Ctrl+S", "escape" -> "Échap"."""
+    return "+".join(_KEY_LABELS.get(part, part.upper()) for part in binding.lower().split("+"))
+
+
+class Keymap:
+    """Keymap compilé en dict (contexte, touche, modificateurs) -> action."""
+
+    def __init__(self, bindings: dict = DEFAULT_KEYMAP):
+        self.bindings = {context: dict(actions) for context, actions in bindings.items()}
+        self.table: dict[tuple, str] = {}
+        for context, actions in self.bindings.items():
+            for action, keys in actions.items():
+                for binding in keys:
+                    try:
+                        key, mods = parse_binding(binding)
+                    except ValueError as e:
+                        log.warning("Touche ignorée (%s.%s): %s", context, action, e)
+                        continue
+                    self.table[(context, key, mods)] = action
+
+    @classmethod
+    def load(cls, path: str = KEYMAP_PATH) -> "Keymap":
+        """Keymap par défaut, avec les actions redéfinies dans path (s'il existe)."""
+        bindings = {context: dict(actions) for context, actions in DEFAULT_KEYMAP.items()}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    overrides = json.load(f)
+                for context, actions in overrides.items():
+                    bindings.setdefault(context, {}).update(actions)
+                log.info("Keymap chargé: %s", path)
+            except (OSError, ValueError, AttributeError) as e:
+                log.error("Keymap invalide (%s): %s", path, e)
+        return cls(bindings)
+
+    def label_for(self, action: str, context: str | None = None) -> str:
+        """Première touche valide de action (dans context, sinon dans le premier contexte qui la lie)."""
+        for name, actions in self.bindings.items():
+            if context is not None and name != context:
+                continue
+            for binding in actions.get(action, ()):
+                try:
+                    parse_binding(binding)
+                except ValueError:
+                    continue
+                return binding_label(binding)
+        return "?"
+
+    def resolve(self, contexts: tuple, key: int, mod: int = 0) -> str | None:
+        """
+        Action de la touche dans le premier contexte qui la définit. Une touche
+        liée avec ses modificateurs exacts l'emporte (Ctrl+S: "save", pas
+        "cursor_down"); sinon les modificateurs sont ignorés (Maj+Z == Z).
+        """
+        table = self.table
+        mods = event_mods(mod)
+        if mods:
+            for context in contexts:
+                action = table.get((context, key, mods))
+                if action is not None:
+                    return action
+        for context in contexts:
+            action = table.get((context, key, 0))
+            if action is not None:
+                return action
+        return None
+
+    def resolve_event(self, contexts: tuple, event) -> str | None:
+        """Action d'un événement KEYDOWN (None pour les autres événements)."""
+        if event.type != pygame.KEYDOWN:
+            return None
+        return self.resolve(contexts, event.key, event.mod)
+
+
+_keymap: Keymap | None = None
+
+
+def get_keymap() -> Keymap:
+    """Keymap du processus (fichier de configuration lu au premier appel)."""
+    global _keymap
+    if _keymap is None:
+        _keymap = Keymap.load()
+    return _keymap
@@ -0,0 +1,170 @@
+# log.py
+"""
+Journal du jeu: niveaux, formatage paresseux, écriture en arrière-plan.
+
+    log = get_logger("save")
+    log.info("Partie sauvegardée: %s", filename)
+
+Un appel sous le niveau du sous-système ne coûte qu'une comparaison: le
+message n'est pas formaté. Sinon l'enregistrement (heure, niveau, nom,
+message, arguments) est ajouté à un buffer circulaire borné; un thread le
+vide toutes les FLUSH_INTERVAL secondes (tout de suite pour une erreur) et
+c'est lui qui formate et écrit. La boucle de jeu n'écrit jamais sur le
+terminal. Buffer plein: les plus anciens sont perdus (et comptés).
+
+Niveaux par sous-système, variable d'environnement BP_LOG:
+    BP_LOG=debug                 tout en debug
+    BP_LOG=input=debug,shop=off  clavier en debug, magasin muet, le reste en info
+Sous-systèmes: input, save, shop, audio, assets, cache, scenes.
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+DEBUG, INFO, WARNING, ERROR, OFF = 10, 20, 30, 40, 100
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+RING_SIZE = 4096
+FLUSH_INTERVAL = 0.25  # s
+
+
+def parse_levels(spec: str) -> tuple:
+    """ "input=debug,info" -> (niveau par défaut, {sous-système: niveau}). Entrées invalides ignorées."""
+    default, levels = INFO, {}
+    for part in spec.split(","):
+        name, _, level = part.strip().lower().rpartition("=")
+        if level not in LEVELS:
+            continue
+        if name:
+            levels[name] = LEVELS[level]
+        else:
+            default = LEVELS[level]
+    return default, levels
+
+
+class RingSink:
+    """Buffer circulaire d'enregistrements, vidé sur stream par un thread."""
+
+    def __init__(self, stream=None, size: int = RING_SIZE, interval: float = FLUSH_INTERVAL):
+        self.stream = stream  # None: sys.stdout au moment de l'écriture
+        self.interval = interval
+        self.dropped = 0
+        self._records = deque(maxlen=size)
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def emit(self, level: int, name: str, message: str, args: tuple):
+        # deque.append est atomique: appelable depuis n'importe quel thread
+        if len(self._records) == self._records.maxlen:
+            self.dropped += 1
+        self._records.append((time.time(), level, name, message, args))
+        if self._thread is None:
+            self._start()
+        if level >= ERROR:
+            self._wake.set()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Formate et écrit tout ce qui est en attente."""
+        with self._write_lock:
+            lines = []
+            while self._records:
+                lines.append(format_record(self._records.popleft()))
+            if self.dropped:
+                lines.append(f"WARNING [log] {self.dropped} message(s) perdus (buffer plein)")
+                self.dropped = 0
+            if lines:
+                stream = self.stream or sys.stdout
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+
+
+def format_record(record: tuple) -> str:
+    created, level, name, message, args = record
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args!r}"
+    return f"{LEVEL_NAMES.get(level, level)} [{name}] {message}"
+
+
+class Logger:
+    """Journal d'un sous-système; ses méthodes ne font rien sous son niveau."""
+
+    __slots__ = ("name", "level")
+
+    def __init__(self, name: str, level: int):
+        self.name = name
+        self.level = level
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def debug(self, message: str, *args):
+        if self.level <= DEBUG:
+            _sink.emit(DEBUG, self.name, message, args)
+
+    def info(self, message: str, *args):
+        if self.level <= INFO:
+            _sink.emit(INFO, self.name, message, args)
+
+    def warning(self, message: str, *args):
+        if self.level <= WARNING:
+            _sink.emit(WARNING, self.name, message, args)
+
+    def error(self, message: str, *args):
+        if self.level <= ERROR:
+            _sink.emit(ERROR, self.name, message, args)
+
+
+_sink = RingSink()
+_default_level, _levels = parse_levels(os.environ.get("BP_LOG", ""))
+_loggers: dict[str, Logger] = {}
+
+
+def get_logger(name: str) -> Logger:
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = Logger(name, _levels.get(name, _default_level))
+    return logger
+
+
+def set_default_level(level: int):
+    """Niveau des sous-systèmes sans niveau propre dans BP_LOG (ou set_level)."""
+    global _default_level
+    _default_level = level
+    for name, logger in _loggers.items():
+        if name not in _levels:
+            logger.level = level
+
+
+def set_level(name: str, level: int):
+    """Change le niveau d'un sous-système (y compris pour les Logger déjà créés)."""
+    _levels[name] = level
+    get_logger(name).level = level
+
+
+def flush():
+    _sink.flush()
+
+
+# Ce qui reste dans le buffer est écrit à la sortie du programme
+atexit.register(flush)
@@ -3,81 +3,75 @@
 
 import pygame
 from typing import Tuple
-from constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+from keymap import get_keymap
 
 FONT_NAME = None  
 
-def show_main_menu(screen: pygame.Surface) -> str:
+MENU_OPTIONS = [("Nouvelle Partie", "new"), ("Charger Partie", "load"), ("Quitter", "quit")]
+
+
+def render_menu_background(size: Tuple[int, int]) -> pygame.Surface:
     """
-    Muestra un menú simple. Devuelve 'new', 'load' o 'quit'.
-    Bloqueante - espera la selección del usuario.
+    Fond du menu principal (titre, aides), rendu une fois par MenuScene (scenes.py).
+    Les options, qui changent avec la sélection, sont dessinées par draw_menu_options.
     """
-    clock = pygame.time.Clock()
-    w, h = screen.get_size()
+    w, h = size
+    surface = pygame.Surface(size)
     font = pygame.font.SysFont("arial", 32, bold=True)
-    small = pygame.font.SysFont("arial", 20)
     tiny = pygame.font.SysFont("arial", 16)
+
+    surface.fill((10, 10, 30))
+    
+    title = font.render(" BLUE PRINCE", True, (150, 200, 255))
+    surface.blit(title, ((w - title.get_width()) // 2, 80))
+    
+    subtitle = tiny.render("Projet POO 2025", True, (180, 180, 180))
+    surface.blit(subtitle, ((w - subtitle.get_width()) // 2, 130))
+    
+    keys = get_keymap()
+    navigate = f"{keys.label_for('menu_up', 'menu')}/{keys.label_for('menu_down', 'menu')}"
+    hint1 = tiny.render(f"{navigate} pour naviguer", True, (150, 150, 150))
+    hint2 = tiny.render(f"{keys.label_for('menu_select', 'menu')} pour sélectionner", True, (150, 150, 150))
+    surface.blit(hint1, ((w - hint1.get_width()) // 2, h - 80))
+    surface.blit(hint2, ((w - hint2.get_width()) // 2, h - 55))
     
-    selected = 0
-    options = ["Nouvelle Partie", "Charger Partie", "Quitter"]
-    running = True
-    
-    while running:
-        for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                return "quit"
-            if ev.type == pygame.KEYDOWN:
-                if ev.key in (pygame.K_UP, pygame.K_z):
-                    selected = (selected - 1) % len(options)
-                elif ev.key in (pygame.K_DOWN, pygame.K_s):
-                    selected = (selected + 1) % len(options)
-                elif ev.key == pygame.K_RETURN or ev.key == pygame.K_SPACE:
-                    if options[selected] == "Nouvelle Partie":
-                        return "new"
-                    elif options[selected] == "Charger Partie":
-                        return "load"
-                    elif options[selected] == "Quitter":
-                        return "quit"
-        
 
-        screen.fill((10, 10, 30))
-        
-        title = font.render(" BLUE PRINCE", True, (150, 200, 255))
-        screen.blit(title, ((w - title.get_width()) // 2, 80))
-        
-        subtitle = tiny.render("Projet POO 2025", True, (180, 180, 180))
-        screen.blit(subtitle, ((w - subtitle.get_width()) // 2, 130))
-        
-        for i, opt in enumerate(options):
-            if i == selected:
-                color = (255, 255, 100)
-                prefix = "▶ "
-            else:
-                color = (200, 200, 200)
-                prefix = "  "
-            
-            txt = small.render(prefix + opt, True, color)
-            screen.blit(txt, ((w - txt.get_width()) // 2, 220 + i * 50))
-        
-        hint1 = tiny.render("↑↓ ou Z/S pour naviguer", True, (150, 150, 150))
-        hint2 = tiny.render("Entrée pour sélectionner", True, (150, 150, 150))
-        screen.blit(hint1, ((w - hint1.get_width()) // 2, h - 80))
-        screen.blit(hint2, ((w - hint2.get_width()) // 2, h - 55))
-        
+    save_hint = tiny.render(f"{keys.label_for('save', 'play')} pour sauvegarder pendant le jeu", True, (100, 150, 100))
+    surface.blit(save_hint, ((w - save_hint.get_width()) // 2, h - 25))
+    return surface
 
-        save_hint = tiny.render("Ctrl+S pour sauvegarder pendant le jeu", True, (100, 150, 100))
-        screen.blit(save_hint, ((w - save_hint.get_width()) // 2, h - 25))
+
+def draw_menu_options(screen: pygame.Surface, font: pygame.font.Font, selected: int):
+    """Options du menu, la sélectionnée en jaune."""
+    w = screen.get_width()
+    for i, (opt, _) in enumerate(MENU_OPTIONS):
+        if i == selected:
+            color = (255, 255, 100)
+            prefix = "▶ "
+        else:
+            color = (200, 200, 200)
+            prefix = "  "
         
-        pygame.display.flip()
-        clock.tick(30)
+        txt = font.render(prefix + opt, True, color)
+        screen.blit(txt, ((w - txt.get_width()) // 2, 220 + i * 50))
+
 
+def draw_progress_bar(screen: pygame.Surface, font: pygame.font.Font, progress: float, y: int):
+    """Barre de chargement centrée (progress entre 0 et 1)."""
+    w = screen.get_width()
+    bar = pygame.Rect((w - 300) // 2, y, 300, 10)
+    pygame.draw.rect(screen, (60, 60, 90), bar)
+    pygame.draw.rect(screen, (150, 200, 255), (bar.x, bar.y, int(bar.width * progress), bar.height))
+    label = font.render(f"Chargement... {int(progress * 100)}%", True, (150, 150, 150))
+    screen.blit(label, ((w - label.get_width()) // 2, y + 14))
 
-def draw_pause_overlay(screen: pygame.Surface):
-    """Dibuja overlay de pausa (no bloqueante)."""
-    w, h = screen.get_size()
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 150))
-    screen.blit(overlay, (0, 0))
+
+def render_pause_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    """Overlay de pausa, renderizado una vez y luego solo copiado (PauseScene)."""
+    w, h = size
+    screen = pygame.Surface((w, h), pygame.SRCALPHA)
+    screen.fill((0, 0, 0, 150))
     
     font_large = pygame.font.SysFont("arial", 36, bold=True)
     font_small = pygame.font.SysFont("arial", 20)
@@ -85,24 +79,25 @@ def draw_pause_overlay(screen: pygame.Surface):
     title = font_large.render("⏸  PAUSE", True, (255, 255, 255))
     screen.blit(title, ((w - title.get_width()) // 2, h // 2 - 60))
     
-    hint1 = font_small.render("P - Reprendre", True, (200, 200, 200))
-    hint2 = font_small.render("Ctrl+S - Sauvegarder", True, (200, 200, 200))
-    hint3 = font_small.render("ESC - Quitter au menu", True, (200, 200, 200))
+    keys = get_keymap()
+    hint1 = font_small.render(f"{keys.label_for('pause', 'pause')} - Reprendre", True, (200, 200, 200))
+    hint2 = font_small.render(f"{keys.label_for('save', 'pause')} - Sauvegarder", True, (200, 200, 200))
+    hint3 = font_small.render(f"{keys.label_for('quit_to_menu', 'pause')} - Quitter au menu", True, (200, 200, 200))
     
     screen.blit(hint1, ((w - hint1.get_width()) // 2, h // 2))
     screen.blit(hint2, ((w - hint2.get_width()) // 2, h // 2 + 35))
     screen.blit(hint3, ((w - hint3.get_width()) // 2, h // 2 + 70))
+    return screen
 
 
-def show_victory_screen(screen: pygame.Surface, inventory):
+def render_victory_overlay(size: Tuple[int, int], inventory) -> pygame.Surface:
     """
     Écran de victoire lorsque vous atteignez la ligne d'arrivée.
-    Affiche les statistiques finales.
+    Affiche les statistiques finales (figées: rendu une fois par VictoryScene).
     """
-    w, h = screen.get_size()
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    screen.blit(overlay, (0, 0))
+    w, h = size
+    screen = pygame.Surface((w, h), pygame.SRCALPHA)
+    screen.fill((0, 0, 0, 200))
     
     font_huge = pygame.font.SysFont("arial", 56, bold=True)
     font_large = pygame.font.SysFont("arial", 28, bold=True)
@@ -161,32 +156,32 @@ def show_victory_screen(screen: pygame.Surface, inventory):
         screen.blit(txt, ((w - txt.get_width()) // 2, perms_y))
     
     hint_y = h - 80
-    hint1 = font_medium.render("ESC - Retour au menu", True, (200, 200, 200))
-    hint2 = font_medium.render("R - Rejouer", True, (200, 200, 200))
+    keys = get_keymap()
+    hint1 = font_medium.render(f"{keys.label_for('quit_to_menu', 'end')} - Retour au menu", True, (200, 200, 200))
+    hint2 = font_medium.render(f"{keys.label_for('restart', 'end')} - Rejouer", True, (200, 200, 200))
     
     screen.blit(hint1, ((w - hint1.get_width()) // 2, hint_y))
     screen.blit(hint2, ((w - hint2.get_width()) // 2, hint_y + 35))
+    return screen
 
 
-def show_game_over_screen(screen: pygame.Surface):
-    """Pantalla de derrota"""
-    w, h = screen.get_size()
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    screen.blit(overlay, (0, 0))
-    
-    font_huge = pygame.font.SysFont("arial", 56, bold=True)
-    font_large = pygame.font.SysFont("arial", 28)
-    font_medium = pygame.font.SysFont("arial", 22)
-    
-    title = font_huge.render(" GAME OVER ", True, (255, 80, 80))
-    screen.blit(title, ((w - title.get_width()) // 2, 180))
-    
-    subtitle = font_large.render("Vous n'avez plus de pas!", True, (255, 255, 255))
-    screen.blit(subtitle, ((w - subtitle.get_width()) // 2, 260))
-    
-    hint1 = font_medium.render("ESC - Retour au menu", True, (200, 200, 200))
-    hint2 = font_medium.render("R - Recommencer", True, (200, 200, 200))
-    
-    screen.blit(hint1, ((w - hint1.get_width()) // 2, 350))
-    screen.blit(hint2, ((w - hint2.get_width()) // 2, 390))
\ No newline at end of file
+def render_game_over_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    """Pantalla de derrota (renderizada una vez por GameOverScene)"""
+    w, h = size
+    screen = pygame.Surface((w, h), pygame.SRCALPHA)
+    screen.fill((0, 0, 0, 200))
+
+    font_large = pygame.font.SysFont("arial", 48, bold=True)
+    font_small = pygame.font.SysFont("arial", 24)
+
+    title = font_large.render("GAME OVER", True, (255, 50, 50))
+    subtitle = font_small.render("Vous n'avez plus de pas!", True, (255, 255, 255))
+    keys = get_keymap()
+    hint1 = font_small.render(f"{keys.label_for('quit_to_menu', 'end')} - Retour au menu", True, (200, 200, 200))
+    hint2 = font_small.render(f"{keys.label_for('restart', 'end')} - Recommencer", True, (200, 200, 200))
+
+    screen.blit(title, ((w - title.get_width()) // 2, 200))
+    screen.blit(subtitle, ((w - subtitle.get_width()) // 2, 270))
+    screen.blit(hint1, ((w - hint1.get_width()) // 2, 340))
+    screen.blit(hint2, ((w - hint2.get_width()) // 2, 380))
+    return screen
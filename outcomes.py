@@ -0,0 +1,136 @@
+# outcomes.py
+"""
+Distributions exactes des effets de salle.
+
+Au lieu d'estimer par échantillonnage, on énumère toutes les branches de
+apply_room_effect: le handler est exécuté avec un générateur "énumérateur"
+dont choice() parcourt chaque élément tour à tour (compteur kilométrique sur
+les appels successifs). Chaque exécution donne un delta d'inventaire, de
+probabilité le produit des 1/len(seq) rencontrés.
+
+Le résultat dépend de la salle (type + effect_data) et seulement des
+conditions d'inventaire que testent les handlers (clé disponible, objets
+permanents); il est mémoïsé sur cette clé, donc une requête coûte un
+accès dictionnaire après le premier calcul.
+"""
+
+from dataclasses import dataclass, fields, replace
+
+from inventory import Inventory
+from effects import apply_room_effect
+
+FIELDS = tuple(f.name for f in fields(Inventory))
+# Unités affichées dans la modale, par ordre de priorité
+LABELS = (("steps", "pas"), ("gold", "or"), ("gems", "gemme(s)"), ("keys", "clé(s)"))
+# Assez de pas pour qu'aucun plancher (decrement_steps) ne fausse les deltas
+_BASE_STEPS = 10_000
+
+
+@dataclass(frozen=True)
+class Outcome:
+    probability: float
+    delta: tuple  # variation de chaque champ de FIELDS (booléens comptés 0/1)
+    message: str
+
+
+class Distribution:
+    """Issues possibles d'une salle pour un profil d'inventaire donné."""
+
+    def __init__(self, outcomes: list):
+        self.outcomes = outcomes
+        self._expected = tuple(
+            sum(o.probability * o.delta[i] for o in outcomes) for i in range(len(FIELDS))
+        )
+
+    def expected(self, field: str) -> float:
+        """Variation moyenne d'un champ de l'inventaire."""
+        return self._expected[FIELDS.index(field)]
+
+    def expected_delta(self) -> dict:
+        return {name: value for name, value in zip(FIELDS, self._expected) if value}
+
+    def probability(self, predicate) -> float:
+        """Probabilité que predicate(delta: dict) soit vrai."""
+        return sum(o.probability for o in self.outcomes if predicate(dict(zip(FIELDS, o.delta))))
+
+    def describe(self) -> str:
+        """Résumé court pour la modale, ex. "Espéré: +3.2 pas"."""
+        for field, unit in LABELS:
+            value = self.expected(field)
+            if value:
+                return f"Espéré: {value:+.1f} {unit}"
+        gained = [name for name, value in self.expected_delta().items() if value > 0]
+        return f"Objet: {gained[0]}" if gained else "Aucun effet"
+
+
+class _EnumeratingRng:
+    """Remplace random: choice() suit un chemin d'indices imposé et note les largeurs."""
+
+    def __init__(self, path: list):
+        self.path = path
+        self.widths: list[int] = []
+
+    def choice(self, seq):
+        depth = len(self.widths)
+        self.widths.append(len(seq))
+        return seq[self.path[depth] if depth < len(self.path) else 0]
+
+    def __getattr__(self, name):
+        raise NotImplementedError(f"outcomes: rng.{name}() n'est pas énumérable, seul choice() l'est")
+
+
+def inventory_profile(inventory) -> tuple:
+    """Ce qui change le résultat des handlers: clé disponible et objets permanents."""
+    return (inventory.keys > 0, inventory.shovel, inventory.hammer, inventory.picklock_kit,
+            inventory.metal_detector, inventory.rabbit_foot)
+
+
+def room_key(room) -> tuple:
+    return room.room_type, room.name, repr(sorted(room.effect_data.items()))
+
+
+def enumerate_outcomes(room, profile: tuple) -> Distribution:
+    """Exécute le handler sur toutes les branches de hasard (sans cache)."""
+    has_key, shovel, hammer, picklock, detector, rabbit = profile
+    base = Inventory(steps=_BASE_STEPS, gold=0, gems=0, keys=1 if has_key else 0, dice=0,
+                     shovel=shovel, hammer=hammer, picklock_kit=picklock,
+                     metal_detector=detector, rabbit_foot=rabbit)
+    before = tuple(int(getattr(base, name)) for name in FIELDS)
+
+    outcomes = []
+    path: list[int] = []
+    while True:
+        inventory = replace(base)
+        rng = _EnumeratingRng(path)
+        message = apply_room_effect(room, None, inventory, None, rng)
+        widths = rng.widths
+        probability = 1.0
+        for width in widths:
+            probability /= width
+        delta = tuple(int(getattr(inventory, name)) - b for name, b in zip(FIELDS, before))
+        outcomes.append(Outcome(probability, delta, message))
+
+        # Branche suivante: incrémente le dernier indice qui n'est pas à son maximum
+        path = path + [0] * (len(widths) - len(path))
+        depth = len(widths) - 1
+        while depth >= 0 and path[depth] == widths[depth] - 1:
+            depth -= 1
+        if depth < 0:
+            return Distribution(outcomes)
+        path = path[:depth] + [path[depth] + 1]
+
+
+_cache: dict = {}
+
+
+def room_outcomes(room, inventory) -> Distribution:
+    """Distribution des effets de room pour cet inventaire (mémoïsée)."""
+    key = (room_key(room), inventory_profile(inventory))
+    dist = _cache.get(key)
+    if dist is None:
+        dist = _cache[key] = enumerate_outcomes(room, key[1])
+    return dist
+
+
+def expected_value(room, inventory, field: str = "steps") -> float:
+    return room_outcomes(room, inventory).expected(field)
@@ -1,7 +1,7 @@
 # player.py
 """Player class: position, movement, selection cursor and reference to inventory."""
 
-from typing import Tuple
+import zobrist
 
 class Player:
     """
@@ -11,6 +11,8 @@ class Player:
         row (int): ligne actuelle du joueur (0..rows-1).
         col (int): colonne actuelle du joueur (0..cols-1).
         inventory (Inventory): référence à l'objet Inventory (injecté).
+        zobrist (int): empreinte de la position (voir zobrist.py), à jour à chaque
+            changement de row / col.
     """
     def __init__(self, start_row: int = 4, start_col: int = 0, inventory=None):
         # par défaut on place l'entrée en bas gauche (modifiable)
@@ -21,6 +23,13 @@ class Player:
         self.sel_col = self.col
         self.inventory = inventory
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == "row" or name == "col":
+            d = self.__dict__
+            if "row" in d and "col" in d:
+                object.__setattr__(self, "zobrist", zobrist.position_key(d["row"], d["col"]))
+
     def move_cursor(self, drow: int, dcol: int, max_rows: int, max_cols: int):
         """Déplace le curseur de sélection (ZQSD)."""
         nr = max(0, min(max_rows - 1, self.sel_row + drow))
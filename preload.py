@@ -0,0 +1,117 @@
+# preload.py
+"""
+Préchargement des images au démarrage, pendant que le menu s'affiche.
+
+Lecture, décodage PNG et mise à l'échelle (ou relecture du cache disque,
+surface_cache.py) se font dans un pool de threads, un par cœur: pygame
+relâche le GIL pendant ces opérations. Seule la conversion au format de la
+fenêtre (convert_alpha) reste sur le thread principal, dans poll(), appelé
+une fois par image du menu: la fenêtre ne se fige jamais.
+
+L'initialisation audio (start_audio, déjà sur son propre thread) compte
+comme une tâche de plus dans la progression.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+import sound_managener
+from app_context import images
+from asset_manifest import find_asset, get_manifest
+from grid import Grid
+from rooms_catalog import get_catalog
+from surface_cache import display_format
+from ui import grid_cell_size, CONSUMABLE_ICONS, PERMANENT_ICONS, ICON_SIZE
+from constants import ICON_DIR, ROOM_IMG_DIR, GRID_ROWS, GRID_COLS
+from log import get_logger
+
+# Temps max passé à convertir des images par appel à poll() (ms)
+POLL_BUDGET_MS = 4.0
+
+log = get_logger("assets")
+
+
+def startup_jobs() -> list:
+    """(chemin, taille) des images dessinées dès la première partie: salles et icônes."""
+    grid = Grid(GRID_ROWS, GRID_COLS)
+    cell_size = grid_cell_size(grid)
+    rooms = [room for line in grid.grid for room in line if room is not None] + get_catalog()
+    jobs = [(os.path.join(ROOM_IMG_DIR, room.image_name), cell_size) for room in rooms if room.image_name]
+    jobs += [(os.path.join(ICON_DIR, icon_file), (ICON_SIZE, ICON_SIZE))
+             for _, _, icon_file in CONSUMABLE_ICONS + PERMANENT_ICONS]
+    return list(dict.fromkeys(jobs))
+
+
+def _decode(cache, path: str, size: tuple[int, int]) -> pygame.Surface:
+    """Exécuté sur un thread du pool: tout sauf la conversion au format de la fenêtre."""
+    return cache.load_raw(path, size)
+
+
+class AssetPreloader:
+    """Charge jobs dans store en arrière-plan; poll() termine le travail sur le thread principal."""
+
+    def __init__(self, jobs: list, store=images, workers: int | None = None, wait_audio: bool = True):
+        self.jobs = list(dict.fromkeys(jobs))
+        self.store = store
+        self.workers = workers or os.cpu_count() or 1
+        self.wait_audio = wait_audio
+        self._pending: dict = {}  # future -> (chemin, taille)
+        self.finished = 0
+        self.failed = 0
+        self.elapsed_ms: float | None = None
+        self._start = None
+
+    def start(self):
+        self._start = time.perf_counter()
+        get_manifest()  # construit ici, pas en concurrence dans les threads
+        jobs = []
+        for path, size in self.jobs:
+            if self.store.has(path, size):
+                continue
+            if find_asset(path) is None:  # signalé une fois, dès le démarrage
+                self.store.put(path, size, None)
+                continue
+            jobs.append((path, size))
+        self.finished = len(self.jobs) - len(jobs)
+        if jobs:
+            executor = ThreadPoolExecutor(max_workers=min(self.workers, len(jobs)), thread_name_prefix="preload")
+            for path, size in jobs:
+                self._pending[executor.submit(_decode, self.store.disk_cache, path, size)] = (path, size)
+            executor.shutdown(wait=False)  # les threads s'arrêtent une fois la file vidée
+        self.poll()
+
+    def poll(self, budget_ms: float = POLL_BUDGET_MS) -> bool:
+        """Convertit et range les images décodées (thread principal). True quand tout est prêt."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        for future in [f for f in self._pending if f.done()]:
+            path, size = self._pending.pop(future)
+            try:
+                surface = future.result()
+            except (pygame.error, OSError, ValueError) as e:
+                log.error("Preload failed: %s %s", path, e)
+                surface = None
+                self.failed += 1
+            self.store.put(path, size, None if surface is None else display_format(surface))
+            self.finished += 1
+            if time.perf_counter() > deadline:
+                break
+        if self.elapsed_ms is None and self.done:
+            self.elapsed_ms = (time.perf_counter() - self._start) * 1000.0
+        return self.done
+
+    @property
+    def done(self) -> bool:
+        return self._start is not None and not self._pending and self._audio_done()
+
+    def _audio_done(self) -> bool:
+        return not self.wait_audio or sound_managener.audio_ready()
+
+    def progress(self) -> float:
+        """Fraction terminée, entre 0 et 1 (l'audio compte pour une tâche)."""
+        total = len(self.jobs) + (1 if self.wait_audio else 0)
+        if total == 0:
+            return 1.0
+        return (self.finished + (1 if self.wait_audio and self._audio_done() else 0)) / total
@@ -0,0 +1,160 @@
+# profiler.py
+"""
+Capture de profils depuis le jeu, sans profileur externe.
+
+    - F9: démarre / arrête cProfile autour de la boucle principale
+      -> profiles/<etat>_<date>.pstats
+    - F10: démarre / arrête l'échantillonneur: un thread qui relève la pile
+      du thread principal via sys._current_frames toutes les quelques ms
+      -> profiles/<etat>_<date>.collapsed (format "flamegraph")
+         profiles/<etat>_<date>.speedscope.json
+
+<etat> est l'état du jeu au début de la capture (playing, modal, paused...).
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+PROFILE_DIR = "profiles"
+SAMPLE_INTERVAL_S = 0.005
+
+
+def capture_stack(thread_id: int) -> tuple:
+    """
+    Pile courante d'un thread, de la racine vers la frame active.
+    Chaque élément est un tuple (fonction, fichier, ligne de définition).
+    """
+    frame = sys._current_frames().get(thread_id)
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _capture_path(state: str, started: datetime, suffix: str, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{state}_{started.strftime('%Y%m%d_%H%M%S')}{suffix}")
+
+
+class SamplingProfiler(threading.Thread):
+    """Échantillonne la pile d'un thread à intervalle fixe et compte les piles identiques."""
+
+    def __init__(self, target_thread_id: int, interval: float = SAMPLE_INTERVAL_S):
+        super().__init__(name="sampling-profiler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        start = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            stack = capture_stack(self.target_thread_id)
+            if stack:
+                self.samples[stack] += 1
+        self.duration = time.perf_counter() - start
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path: str):
+        """Une ligne par pile: "f1;f2;f3 <nombre d'échantillons>"."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                names = ";".join(f"{name} ({os.path.basename(file)}:{line})" for name, file, line in stack)
+                f.write(f"{names} {count}\n")
+
+    def write_speedscope(self, path: str, name: str):
+        """Profil 'sampled' au format https://www.speedscope.app/file-format-schema.json."""
+        frames: list[dict] = []
+        frame_index: dict[tuple, int] = {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            indices = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                indices.append(frame_index[key])
+            samples.append(indices)
+            weights.append(count * self.interval)
+        doc = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "blue-prince profiler",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(doc, f)
+
+
+class ProfilerControls:
+    """Démarre / arrête les captures déclenchées par les touches de debug."""
+
+    def __init__(self, directory: str = PROFILE_DIR):
+        self.directory = directory
+        self._profile: cProfile.Profile | None = None
+        self._profile_meta: tuple[str, datetime] | None = None
+        self._sampler: SamplingProfiler | None = None
+        self._sampler_meta: tuple[str, datetime] | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None or self._sampler is not None
+
+    def toggle_cprofile(self, state: str) -> str:
+        """Démarre ou arrête cProfile (thread appelant). Retourne un message pour le joueur."""
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self._profile_meta = (state, datetime.now())
+            self._profile.enable()
+            return "cProfile: capture démarrée (F9 pour arrêter)."
+        self._profile.disable()
+        state, started = self._profile_meta
+        path = _capture_path(state, started, ".pstats", self.directory)
+        self._profile.dump_stats(path)
+        self._profile = None
+        return f"cProfile: {path}"
+
+    def toggle_sampling(self, state: str) -> str:
+        """Démarre ou arrête l'échantillonneur du thread appelant. Retourne un message."""
+        if self._sampler is None:
+            self._sampler = SamplingProfiler(threading.get_ident())
+            self._sampler_meta = (state, datetime.now())
+            self._sampler.start()
+            return "Echantillonnage: capture démarrée (F10 pour arrêter)."
+        self._sampler.stop()
+        state, started = self._sampler_meta
+        collapsed = _capture_path(state, started, ".collapsed", self.directory)
+        speedscope = _capture_path(state, started, ".speedscope.json", self.directory)
+        self._sampler.write_collapsed(collapsed)
+        self._sampler.write_speedscope(speedscope, f"Blue Prince - {state}")
+        self._sampler = None
+        return f"Echantillonnage: {collapsed}"
+
+    def stop_all(self, state: str = "exit"):
+        """Termine proprement les captures en cours (à la fermeture du jeu)."""
+        if self._profile is not None:
+            self.toggle_cprofile(state)
+        if self._sampler is not None:
+            self.toggle_sampling(state)
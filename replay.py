@@ -0,0 +1,392 @@
+# replay.py
+"""
+Enregistrement et relecture de parties.
+
+Le ReplayRecorder note les actions appliquées par GameManager.perform
+(horodatées, voir keymap.py) ainsi que la graine du générateur aléatoire,
+dans un format binaire compact:
+
+    en-tête  : b"BPRP" | version (u8) | graine (u64)
+    action   : 0x01 | t_ms (u32) | action (u16, indice dans keymap.ACTIONS)  -> 7 octets
+    keyframe : 0x02 | index (u32) | taille (u32) | état complet (JSON zlib)
+    fin      : 0xFF | nombre d'actions (u32) | empreinte de l'état final (20 octets, sha1)
+
+Les actions, et non les touches, sont enregistrées: un replay reste valable
+si le keymap change.
+
+Une keyframe (grille, inventaire, joueur, modale, état du générateur
+aléatoire) est écrite avant la première action puis toutes les
+KEYFRAME_INTERVAL actions: pour aller à l'action N, on restaure la
+keyframe précédente et on ne rejoue que les actions restantes, donc au plus
+KEYFRAME_INTERVAL - 1.
+
+La relecture ré-injecte les actions soit en temps réel (avec affichage),
+soit le plus vite possible sans affichage, puis vérifie que la grille,
+l'inventaire et la position du joueur finaux sont identiques.
+
+Usage:
+    python replay.py play replays/<fichier>.bprp            # temps réel, avec affichage
+    python replay.py play replays/<fichier>.bprp --fast     # sans affichage, vitesse max
+    python replay.py view replays/<fichier>.bprp            # navigation action par action
+    python replay.py info replays/<fichier>.bprp
+
+Enregistrement en jeu: BP_RECORD=1 python main.py
+"""
+
+import argparse
+import bisect
+import hashlib
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime
+
+import pygame
+
+from save_manager import serialize_state, restore_state, room_to_dict, room_from_dict
+from keymap import ACTIONS, ACTION_IDS, get_keymap
+
+REPLAY_DIR = "replays"
+REPLAY_ENABLED = os.environ.get("BP_RECORD", "") not in ("", "0")
+
+MAGIC = b"BPRP"
+VERSION = 3
+HEADER = struct.Struct("<4sBQ")
+ACTION_RECORD = struct.Struct("<BIH")
+KEYFRAME_RECORD = struct.Struct("<BII")
+END_RECORD = struct.Struct("<BI20s")
+TAG_ACTION = 0x01
+TAG_KEYFRAME = 0x02
+TAG_END = 0xFF
+KEYFRAME_INTERVAL = 32
+
+
+def state_digest(grid, inventory, player) -> bytes:
+    """Empreinte sha1 de l'état de jeu comparé en fin de relecture."""
+    h = hashlib.sha1()
+    for r in range(grid.rows):
+        for c in range(grid.cols):
+            room = grid.grid[r][c]
+            h.update(b"1" if grid.discovered[r][c] else b"0")
+            h.update(f"{room.name}|{room.room_type};".encode() if room is not None else b"-;")
+    h.update(repr((inventory.steps, inventory.gold, inventory.gems, inventory.keys, inventory.dice,
+                   inventory.shovel, inventory.hammer, inventory.picklock_kit,
+                   inventory.metal_detector, inventory.rabbit_foot)).encode())
+    h.update(f"{player.row},{player.col}".encode())
+    return h.digest()
+
+
+def new_seed() -> int:
+    return int.from_bytes(os.urandom(8), "little")
+
+
+def capture_keyframe(gm) -> bytes:
+    """État complet d'une partie (y compris le générateur aléatoire), compressé."""
+    version, internal, gauss = random.getstate()
+    snapshot = {
+        "state": serialize_state(gm.grid, gm.inventory, gm.player),
+        "cursor": [gm.player.sel_row, gm.player.sel_col],
+        "modal": {
+            "open": gm.in_modal,
+            "options": [room_to_dict(room) for room in gm.modal_options],
+            "selected": gm.selected_choice_idx,
+            "target": list(gm.modal_target_pos) if gm.modal_target_pos else None,
+        },
+        "message": gm.message,
+        "running": gm.running,
+        "rng": [version, list(internal), gauss],
+    }
+    return zlib.compress(json.dumps(snapshot, ensure_ascii=False).encode("utf-8"))
+
+
+def restore_keyframe(gm, payload: bytes):
+    """Remet la partie (et le générateur aléatoire) dans l'état d'une keyframe."""
+    snapshot = json.loads(zlib.decompress(payload).decode("utf-8"))
+    restore_state(snapshot["state"], gm.grid, gm.inventory, gm.player)
+    gm.player.sel_row, gm.player.sel_col = snapshot["cursor"]
+    modal = snapshot["modal"]
+    gm.in_modal = modal["open"]
+    gm.modal_options = [room_from_dict(d) for d in modal["options"]]
+    gm.selected_choice_idx = modal["selected"]
+    gm.modal_target_pos = tuple(modal["target"]) if modal["target"] else None
+    gm.message = snapshot["message"]
+    gm.running = snapshot["running"]
+    version, internal, gauss = snapshot["rng"]
+    random.setstate((version, tuple(internal), gauss))
+
+
+class ReplayRecorder:
+    """Accumule les actions d'une partie puis les écrit dans un fichier .bprp."""
+
+    def __init__(self, seed: int, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.seed = seed
+        self.keyframe_interval = keyframe_interval
+        self.count = 0
+        self._buffer = bytearray(HEADER.pack(MAGIC, VERSION, seed))
+        self._start = time.perf_counter()
+
+    def record(self, action: str, gm):
+        """Appelé par GameManager.perform pour chaque action, avant de l'appliquer."""
+        if self.count % self.keyframe_interval == 0:
+            payload = capture_keyframe(gm)
+            self._buffer += KEYFRAME_RECORD.pack(TAG_KEYFRAME, self.count, len(payload))
+            self._buffer += payload
+        t_ms = int((time.perf_counter() - self._start) * 1000.0)
+        self._buffer += ACTION_RECORD.pack(TAG_ACTION, t_ms, ACTION_IDS[action])
+        self.count += 1
+
+    def save(self, gm, directory: str = REPLAY_DIR) -> str:
+        """Écrit le fichier avec l'empreinte de l'état final. Retourne le chemin."""
+        if self.count == 0:
+            # Aucune action: la keyframe initiale reste nécessaire (partie chargée)
+            payload = capture_keyframe(gm)
+            self._buffer += KEYFRAME_RECORD.pack(TAG_KEYFRAME, 0, len(payload)) + payload
+        os.makedirs(directory, exist_ok=True)
+        digest = state_digest(gm.grid, gm.inventory, gm.player)
+        data = self._buffer + END_RECORD.pack(TAG_END, self.count, digest)
+        # Création exclusive: deux parties finies dans la même seconde (R, puis fermeture) ne s'écrasent pas
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        for n in itertools.count():
+            path = os.path.join(directory, f"{stamp}.bprp" if n == 0 else f"{stamp}_{n}.bprp")
+            try:
+                with open(path, "xb") as f:
+                    f.write(data)
+                return path
+            except FileExistsError:
+                continue
+
+
+class Replay:
+    """
+    Contenu d'un fichier .bprp: graine, actions [(t_ms, action)],
+    keyframes [(index, payload)] triées par index, et empreinte finale.
+    """
+
+    def __init__(self, seed: int, actions: list, final_digest: bytes | None, keyframes: list | None = None):
+        self.seed = seed
+        self.actions = actions
+        self.final_digest = final_digest
+        self.keyframes = keyframes or []
+        self._keyframe_indices = [index for index, _ in self.keyframes]
+
+    def keyframe_before(self, index: int):
+        """Dernière keyframe (index, payload) dont l'index est <= index, ou None."""
+        i = bisect.bisect_right(self._keyframe_indices, index) - 1
+        return self.keyframes[i] if i >= 0 else None
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: pas un replay Blue Prince (version {VERSION})")
+        actions, keyframes, digest = [], [], None
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset]
+            if tag == TAG_ACTION:
+                _, t_ms, action_id = ACTION_RECORD.unpack_from(data, offset)
+                if action_id >= len(ACTIONS):
+                    raise ValueError(f"{path}: action inconnue {action_id} à l'octet {offset}")
+                actions.append((t_ms, ACTIONS[action_id]))
+                offset += ACTION_RECORD.size
+            elif tag == TAG_KEYFRAME:
+                _, index, length = KEYFRAME_RECORD.unpack_from(data, offset)
+                offset += KEYFRAME_RECORD.size
+                keyframes.append((index, data[offset:offset + length]))
+                offset += length
+            elif tag == TAG_END:
+                _, count, digest = END_RECORD.unpack_from(data, offset)
+                if count != len(actions):
+                    raise ValueError(f"{path}: {len(actions)} actions lues, {count} attendues")
+                offset += END_RECORD.size
+            else:
+                raise ValueError(f"{path}: enregistrement inconnu 0x{tag:02x} à l'octet {offset}")
+        return cls(seed, actions, digest, keyframes)
+
+    @property
+    def duration_ms(self) -> int:
+        return self.actions[-1][0] if self.actions else 0
+
+
+class ReplaySession:
+    """Position courante dans un replay, avec retour arrière via les keyframes."""
+
+    def __init__(self, replay: Replay, gm):
+        self.replay = replay
+        self.gm = gm
+        self.position = 0  # nombre d'actions déjà appliquées
+        self._restore(0)
+
+    def _restore(self, index: int):
+        keyframe = self.replay.keyframe_before(index)
+        if keyframe is None:
+            # Pas de keyframe: partie neuve avec la graine enregistrée
+            random.seed(self.replay.seed)
+            self.position = 0
+        else:
+            restore_keyframe(self.gm, keyframe[1])
+            self.position = keyframe[0]
+
+    def step(self):
+        """Applique l'action suivante."""
+        _, action = self.replay.actions[self.position]
+        self.gm.perform(action)
+        self.gm.update()
+        self.position += 1
+
+    def seek(self, target: int):
+        """Va à la position target (0..len(actions)) en rejouant au plus un intervalle de keyframes."""
+        target = max(0, min(len(self.replay.actions), target))
+        keyframe = self.replay.keyframe_before(target)
+        start = keyframe[0] if keyframe else 0
+        if not (start <= self.position <= target):
+            self._restore(target)
+        while self.position < target:
+            self.step()
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.replay.actions)
+
+    def matches_final_state(self) -> bool:
+        if self.replay.final_digest is None:
+            return True
+        return state_digest(self.gm.grid, self.gm.inventory, self.gm.player) == self.replay.final_digest
+
+
+def play(replay: Replay, gm=None, realtime: bool = False, render: bool = False) -> bool:
+    """
+    Rejoue les actions sur une nouvelle partie. Retourne True si l'état final
+    correspond à l'empreinte enregistrée (ou s'il n'y en a pas).
+    """
+    from game_manager import GameManager
+
+    if gm is None:
+        gm = GameManager()
+    session = ReplaySession(replay, gm)
+    start = time.perf_counter()
+    while not session.finished:
+        if realtime:
+            delay = replay.actions[session.position][0] / 1000.0 - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            pygame.event.pump()
+        session.step()
+        if render:
+            gm.draw()
+            pygame.display.flip()
+    return session.matches_final_state()
+
+
+def view(replay: Replay):
+    """
+    Visionneuse: ←/→ une action, PageUp/PageDown un intervalle de keyframes,
+    Début/Fin, Espace lecture/pause, Échap pour quitter.
+    """
+    from game_manager import GameManager
+    from constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT
+
+    gm = GameManager()
+    session = ReplaySession(replay, gm)
+    keymap = get_keymap()
+    clock = pygame.time.Clock()
+    total = len(replay.actions)
+    playing = False
+    play_origin = 0.0  # instant (perf_counter) correspondant à t_ms = 0 pendant la lecture
+    seek_ms = 0.0
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                action = keymap.resolve_event(("replay",), event)
+                target = {
+                    "replay_next": session.position + 1,
+                    "replay_prev": session.position - 1,
+                    "replay_next_keyframe": session.position + KEYFRAME_INTERVAL,
+                    "replay_prev_keyframe": session.position - KEYFRAME_INTERVAL,
+                    "replay_start": 0,
+                    "replay_end": total,
+                }.get(action)
+                if action == "replay_quit":
+                    running = False
+                elif action == "replay_play":
+                    playing = not playing
+                    if playing and not session.finished:
+                        play_origin = time.perf_counter() - replay.actions[session.position][0] / 1000.0
+                if target is not None:
+                    playing = False
+                    t0 = time.perf_counter()
+                    session.seek(target)
+                    seek_ms = (time.perf_counter() - t0) * 1000.0
+
+        if playing:
+            now_ms = (time.perf_counter() - play_origin) * 1000.0
+            while not session.finished and replay.actions[session.position][0] <= now_ms:
+                session.step()
+            playing = not session.finished
+
+        gm.draw()
+        _draw_timeline(gm, session, total, seek_ms, WINDOW_WIDTH, WINDOW_HEIGHT)
+        pygame.display.flip()
+        clock.tick(FPS)
+    pygame.quit()
+
+
+def _draw_timeline(gm, session: ReplaySession, total: int, seek_ms: float, width: int, height: int):
+    """Barre de progression en haut de l'écran, avec les keyframes."""
+    bar = pygame.Rect(10, 6, width - 20, 8)
+    pygame.draw.rect(gm.screen, (40, 40, 40), bar)
+    if total:
+        for index, _ in session.replay.keyframes:
+            x = bar.x + bar.w * index // total
+            pygame.draw.line(gm.screen, (120, 120, 200), (x, bar.y), (x, bar.bottom))
+        filled = bar.w * session.position // total
+        pygame.draw.rect(gm.screen, (230, 200, 50), (bar.x, bar.y, filled, bar.h))
+    label = gm.font.render(f"{session.position}/{total}  (seek {seek_ms:.1f} ms)", True, (255, 255, 255))
+    gm.screen.blit(label, (bar.x, bar.bottom + 4))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Relecture des parties enregistrées (.bprp).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_play = sub.add_parser("play", help="rejouer une partie")
+    p_play.add_argument("path")
+    p_play.add_argument("--fast", action="store_true", help="sans affichage, vitesse maximale")
+    p_view = sub.add_parser("view", help="naviguer dans une partie (avant / arrière)")
+    p_view.add_argument("path")
+    p_info = sub.add_parser("info", help="afficher le contenu d'un replay")
+    p_info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    if args.command == "info":
+        print(f"graine: {replay.seed}  actions: {len(replay.actions)}  keyframes: {len(replay.keyframes)}  "
+              f"durée: {replay.duration_ms / 1000.0:.1f} s  "
+              f"empreinte: {replay.final_digest.hex() if replay.final_digest else '-'}")
+        return 0
+    if args.command == "view":
+        view(replay)
+        return 0
+
+    if args.fast:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    start = time.perf_counter()
+    ok = play(replay, realtime=not args.fast, render=not args.fast)
+    elapsed = time.perf_counter() - start
+    print(f"{len(replay.actions)} actions rejouées en {elapsed:.3f} s: "
+          f"{'état final identique' if ok else 'ETAT FINAL DIFFERENT'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# rooms_catalog.py
+"""
+Catalogue des salles pouvant être tirées à l'ouverture d'une porte,
+et tirage des 3 propositions selon la rareté.
+"""
+
+import itertools
+import random
+
+from grid import Room
+
+_catalog: list | None = None
+_cum_weights: list | None = None
+_free_rooms: list | None = None
+
+
+def build_catalog() -> list:
+    """Nouvelles instances de toutes les salles du catalogue (pas les objets: ils sont dans les salles)."""
+    # Catalog of actual ROOMS (not items/objects)
+    return [
+        # Blue rooms (common, neutral)
+        Room("Couloir", image_name="Couloir.png", room_type="neutral", 
+             cost_gems=0, color_type="blue", rarity=0),
+        Room("Salle Vide", image_name="room_default.png", room_type="neutral", 
+             cost_gems=0, color_type="blue", rarity=0),
+
+        # Green rooms (gardens - contain permanent items or dig spots)
+        Room("Bibliothèque", image_name="bibliotheque.png", room_type="bibliotheque", 
+             cost_gems=1, color_type="green", rarity=1, 
+             effect_data={"gems": 1}),
+        Room("Veranda", image_name="Veranda.png", room_type="veranda", 
+             cost_gems=2, color_type="green", rarity=2,
+             effect_data={"boost_green": True}),
+
+        # Yellow rooms (workshops - contain keys)
+        Room("Atelier", image_name="atelier.png", room_type="atelier", 
+             cost_gems=1, color_type="yellow", rarity=1,
+             effect_data={"keys": 1}),
+
+        # Violet rooms (bedrooms - contain food)
+        Room("Chambre", image_name="Chambre.png", room_type="bedroom", 
+             cost_gems=1, color_type="violet", rarity=1,
+             effect_data={"has_food": True}),
+
+        # Orange rooms (corridors - many doors)
+        Room("Grand Couloir", image_name="room_default.png", room_type="corridor", 
+             cost_gems=0, color_type="orange", rarity=0),
+
+        # Red rooms (dangerous - traps)
+        Room("Salle Piégée", image_name="piege.png", room_type="piege", 
+             cost_gems=0, color_type="red", rarity=1,
+             effect_data={"trap_damage": 5}),
+
+        # Special rooms with containers
+        Room("Salle Trésor", image_name="salle_tresor.png", room_type="tresor", 
+             cost_gems=2, color_type="yellow", rarity=2,
+             effect_data={"gold": 5}),
+        Room("Salle aux Coffres", image_name="coffre.png", room_type="coffre", 
+             cost_gems=1, color_type="blue", rarity=1,
+             effect_data={"chest_count": 1, "requires_key": True}),
+        Room("Vestiaire", image_name="casiers.png", room_type="casier", 
+             cost_gems=1, color_type="blue", rarity=1,
+             effect_data={"locker_count": 2, "requires_key": True}),
+        Room("Jardin", image_name="Jardin.png", room_type="creuser", 
+             cost_gems=1, color_type="green", rarity=1,
+             effect_data={"dig_spots": 1, "requires_shovel": True}),
+
+        # Locked room (requires key to enter)
+        Room("Coffre-Fort", image_name="coffre.png", room_type="locked_room",
+             cost_gems=2, color_type="yellow", rarity=2,
+             effect_data={"gold": 10, "gems": 2, "requires_key_to_enter": True}),
+    ]
+
+
+def get_catalog() -> list:
+    """
+    Catalogue partagé (construit une seule fois).
+    Les Room ne sont pas modifiées une fois posées: la même instance peut
+    occuper plusieurs cases.
+    """
+    global _catalog, _cum_weights, _free_rooms
+    if _catalog is None:
+        # Filter out exit room
+        _catalog = [rm for rm in build_catalog() if rm.room_type != "exit"]
+        _cum_weights = list(itertools.accumulate(rm.get_probability_weight() for rm in _catalog))
+        _free_rooms = [rm for rm in _catalog if rm.cost_gems == 0]
+    return _catalog
+
+
+def draw_room_choices(candidate_rooms: list, rng=random) -> list:
+    """
+    Tire 3 salles selon les poids de rareté, avec au moins une salle gratuite.
+    rng: module random (par défaut) ou une instance random.Random.
+    """
+    shared = candidate_rooms is _catalog
+
+    # Select 3 rooms
+    if len(candidate_rooms) <= 3:
+        choices = candidate_rooms[:]
+    else:
+        # Draw according to rarity weights
+        if shared:
+            cum_weights = _cum_weights
+        else:
+            cum_weights = list(itertools.accumulate(rm.get_probability_weight() for rm in candidate_rooms))
+        choices = rng.choices(candidate_rooms, cum_weights=cum_weights, k=3)
+
+    # Ensure at least one free room (cost_gems == 0)
+    if not any(rm.cost_gems == 0 for rm in choices):
+        free_rooms = _free_rooms if shared else [rm for rm in candidate_rooms if rm.cost_gems == 0]
+        if free_rooms:
+            choices[0] = rng.choice(free_rooms)
+    return choices
@@ -25,80 +25,112 @@ import os
 from typing import Any
 from datetime import datetime
 
+from log import get_logger
+
 SAVE_DIR = "saves"
 SAVE_FILE = os.path.join(SAVE_DIR, "save.json")
 
+log = get_logger("save")
 
-def save_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE) -> bool:
 
-    try:
-        # Crear carpeta saves/ si no existe
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        
-        # Construir estructura de datos
-        data = {}
-        
-        # ========================================
-        # 1. SERIALIZAR GRID (todas las rooms)
-        # ========================================
-        cells = []
-        for r in range(grid.rows):
-            row = []
-            for c in range(grid.cols):
-                room = grid.get_room(r, c)
-                is_discovered = grid.is_discovered(r, c)
-                
-                if room is None:
-                    # Casilla vacía (no room aún)
-                    row.append({
-                        "exists": False,
-                        "discovered": is_discovered
-                    })
-                else:
-                    # Serializar room completa
-                    row.append({
-                        "exists": True,
-                        "discovered": is_discovered,
-                        "name": room.name,
-                        "image_name": room.image_name,
-                        "room_type": room.room_type,
-                        "cost_gems": room.cost_gems,
-                        "effect_data": room.effect_data,
-                        "color_type": room.color_type,
-                        "rarity": room.rarity,
-                    })
-            cells.append(row)
-        
-        data["grid"] = {
-            "rows": grid.rows,
-            "cols": grid.cols,
-            "cells": cells
-        }
-        
+def room_to_dict(room: Any) -> dict:
+    """Propiedades de una room, en el formato del archivo de guardado."""
+    return {
+        "name": room.name,
+        "image_name": room.image_name,
+        "room_type": room.room_type,
+        "cost_gems": room.cost_gems,
+        "effect_data": room.effect_data,
+        "color_type": room.color_type,
+        "rarity": room.rarity,
+    }
+
 
-        data["inventory"] = {
+def room_from_dict(cell: dict) -> Any:
+    """Reconstruye una Room a partir de room_to_dict (o de una celda guardada)."""
+    from grid import Room
+    return Room(
+        name=cell.get("name", "Unknown"),
+        image_name=cell.get("image_name"),
+        room_type=cell.get("room_type", "normal"),
+        cost_gems=cell.get("cost_gems", 0),
+        effect_data=cell.get("effect_data", {}),
+        color_type=cell.get("color_type", "neutral"),
+        rarity=cell.get("rarity", 0)
+    )
 
-            "steps": inventory.steps,
-            "gems": inventory.gems,
-            "keys": inventory.keys,
-            "dice": inventory.dice,
-            "gold": inventory.gold,
+
+def serialize_state(grid: Any, inventory: Any, player: Any) -> dict:
+    """
+    Estado completo (grid, inventario, jugador) como dict JSON.
+    Usado por save_game y por los keyframes de los replays.
+    """
+    data = {}
+
+    # ========================================
+    # 1. SERIALIZAR GRID (todas las rooms)
+    # ========================================
+    cells = []
+    for r in range(grid.rows):
+        row = []
+        for c in range(grid.cols):
+            room = grid.get_room(r, c)
+            is_discovered = grid.is_discovered(r, c)
             
+            if room is None:
+                # Casilla vacía (no room aún)
+                row.append({
+                    "exists": False,
+                    "discovered": is_discovered
+                })
+            else:
+                # Serializar room completa
+                cell = {"exists": True, "discovered": is_discovered}
+                cell.update(room_to_dict(room))
+                row.append(cell)
+        cells.append(row)
+    
+    data["grid"] = {
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "cells": cells
+    }
+    
 
-            "permanents": {
-                "shovel": inventory.shovel,
-                "hammer": inventory.hammer,
-                "picklock_kit": inventory.picklock_kit,
-                "metal_detector": inventory.metal_detector,
-                "rabbit_foot": inventory.rabbit_foot,
-            }
-        }
+    data["inventory"] = {
+
+        "steps": inventory.steps,
+        "gems": inventory.gems,
+        "keys": inventory.keys,
+        "dice": inventory.dice,
+        "gold": inventory.gold,
         
 
-        data["player"] = {
-            "row": player.row,
-            "col": player.col
+        "permanents": {
+            "shovel": inventory.shovel,
+            "hammer": inventory.hammer,
+            "picklock_kit": inventory.picklock_kit,
+            "metal_detector": inventory.metal_detector,
+            "rabbit_foot": inventory.rabbit_foot,
         }
+    }
+    
+
+    data["player"] = {
+        "row": player.row,
+        "col": player.col
+    }
+    return data
+
+
+def save_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE) -> bool:
+
+    try:
+        # Crear carpeta saves/ si no existe
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        
+        # Construir estructura de datos
+        data = serialize_state(grid, inventory, player)
         
 
         data["metadata"] = {
@@ -110,14 +142,49 @@ def save_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE)
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
-        print(f"Partie sauvegardée: {filename}")
+        log.info("Partie sauvegardée: %s", filename)
         return True
         
     except Exception as e:
-        print(f"Erreur lors de la sauvegarde: {e}")
+        log.error("Erreur lors de la sauvegarde: %s", e)
         return False
 
 
+def restore_state(data: dict, grid: Any, inventory: Any, player: Any):
+    """Aplica un dict de serialize_state sobre los objetos existentes."""
+    grid_data = data.get("grid", {})
+    cells = grid_data.get("cells", [])
+
+    for r, row in enumerate(cells):
+        for c, cell in enumerate(row):
+            if cell.get("exists"):
+                grid.grid[r][c] = room_from_dict(cell)
+            else:
+                grid.grid[r][c] = None
+            grid.discovered[r][c] = cell.get("discovered", False)
+    if hasattr(grid, "touch"):
+        grid.touch()
+
+    inv_data = data.get("inventory", {})
+    inventory.steps = inv_data.get("steps", 70)
+    inventory.gems = inv_data.get("gems", 2)
+    inventory.keys = inv_data.get("keys", 0)
+    inventory.dice = inv_data.get("dice", 0)
+    inventory.gold = inv_data.get("gold", 0)
+
+    perms = inv_data.get("permanents", {})
+    inventory.shovel = perms.get("shovel", False)
+    inventory.hammer = perms.get("hammer", False)
+    inventory.picklock_kit = perms.get("picklock_kit", False)
+    inventory.metal_detector = perms.get("metal_detector", False)
+    inventory.rabbit_foot = perms.get("rabbit_foot", False)
+
+    player_data = data.get("player", {})
+    player.row = player_data.get("row", grid.rows - 1)
+    player.col = player_data.get("col", 0)
+    player.reset_cursor_to_player()
+
+
 def load_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE) -> bool:
     """
     Carga una partida guardada desde JSON.
@@ -132,7 +199,7 @@ def load_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE)
         True si se cargó exitosamente, False si no existe o hay error
     """
     if not os.path.exists(filename):
-        print(f" Aucune sauvegarde trouvée: {filename}")
+        log.info("Aucune sauvegarde trouvée: %s", filename)
         return False
     
     try:
@@ -141,60 +208,17 @@ def load_game(grid: Any, inventory: Any, player: Any, filename: str = SAVE_FILE)
             data = json.load(f)
         
 
-        grid_data = data.get("grid", {})
-        cells = grid_data.get("cells", [])
-        
-        for r, row in enumerate(cells):
-            for c, cell in enumerate(row):
-                if cell.get("exists"):
-
-                    from grid import Room
-                    room = Room(
-                        name=cell.get("name", "Unknown"),
-                        image_name=cell.get("image_name"),
-                        room_type=cell.get("room_type", "normal"),
-                        cost_gems=cell.get("cost_gems", 0),
-                        effect_data=cell.get("effect_data", {}),
-                        color_type=cell.get("color_type", "neutral"),
-                        rarity=cell.get("rarity", 0)
-                    )
-                    grid.grid[r][c] = room
-                else:
-                    grid.grid[r][c] = None
-                
-
-                grid.discovered[r][c] = cell.get("discovered", False)
-        
-
-        inv_data = data.get("inventory", {})
-        inventory.steps = inv_data.get("steps", 70)
-        inventory.gems = inv_data.get("gems", 2)
-        inventory.keys = inv_data.get("keys", 0)
-        inventory.dice = inv_data.get("dice", 0)
-        inventory.gold = inv_data.get("gold", 0)
-        
-        perms = inv_data.get("permanents", {})
-        inventory.shovel = perms.get("shovel", False)
-        inventory.hammer = perms.get("hammer", False)
-        inventory.picklock_kit = perms.get("picklock_kit", False)
-        inventory.metal_detector = perms.get("metal_detector", False)
-        inventory.rabbit_foot = perms.get("rabbit_foot", False)
-        
-
-        player_data = data.get("player", {})
-        player.row = player_data.get("row", grid.rows - 1)
-        player.col = player_data.get("col", 0)
-        player.reset_cursor_to_player()
+        restore_state(data, grid, inventory, player)
         
 
         metadata = data.get("metadata", {})
         save_date = metadata.get("save_date", "Unknown")
-        print(f" Partie chargée (sauvegardée le: {save_date})")
+        log.info("Partie chargée (sauvegardée le: %s)", save_date)
         
         return True
         
     except Exception as e:
-        print(f" Erreur lors du chargement: {e}")
+        log.error("Erreur lors du chargement: %s", e)
         return False
 
 
@@ -0,0 +1,449 @@
+# scenes.py
+"""
+Scenes (menu, game, pause, victory, game over) on a stack, driven by one loop.
+
+App.run():
+    - events -> keymap actions (contexts of the top scene) -> Scene.on_action
+    - game logic at a fixed timestep (UPDATE_HZ), whatever the frame rate:
+      Scene.update(STEP) runs as many times as the elapsed time requires
+    - rendering only when something changed or animates, at most FPS, from
+      the topmost opaque scene upwards (the game stays visible under pause)
+    - timers (scheduler.py): wall-time ones every turn, game-time ones with
+      the game's fixed steps; while idle the loop wakes up at the next one
+Overlays (pause, victory, game over) are rendered once into a surface when
+their scene is entered, then only blitted.
+
+Only the top scene updates: the game is frozen under the pause overlay.
+"""
+
+import math
+import random
+import time
+
+import pygame
+
+from constants import FPS, IDLE_WAIT_MS
+from event_loop import next_events
+from game_manager import GameManager
+from keymap import get_keymap
+from log import get_logger
+from menu import (MENU_OPTIONS, render_menu_background, draw_menu_options, draw_progress_bar,
+                  render_pause_overlay, render_victory_overlay, render_game_over_overlay)
+from save_manager import save_game, load_game
+from telemetry import create_telemetry, StartupTimer, EVENTS, UPDATE, DRAW, OVERLAYS, FLIP
+from profiler import ProfilerControls
+from hitch_watchdog import create_watchdog
+from replay import REPLAY_ENABLED, ReplayRecorder, new_seed
+from scheduler import GAME, WALL
+from sound_managener import play_effect, PRIORITY_END
+
+UPDATE_HZ = 60
+STEP = 1.0 / UPDATE_HZ
+MAX_CATCH_UP = 0.25  # s of logic replayed at most after a long frame or an idle wait
+
+log = get_logger("scenes")
+
+
+class Scene:
+    """Entry of the App stack. Subclasses override what they need."""
+
+    name = "scene"
+    contexts: tuple = ("global",)
+    opaque = True  # False: the scenes below are drawn first
+    game_time = False  # True: its updates advance the scheduler's game clock
+
+    def __init__(self, app: "App"):
+        self.app = app
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def on_action(self, action: str):
+        pass
+
+    def update(self, dt: float):
+        pass
+
+    def draw(self, screen: pygame.Surface):
+        pass
+
+    def is_animating(self) -> bool:
+        """True while the scene changes on screen without input (the loop keeps its frame rate)."""
+        return False
+
+
+class MenuScene(Scene):
+    name = "menu"
+    contexts = ("global", "menu")
+
+    def enter(self):
+        self.selected = 0
+        self.background = render_menu_background(self.app.screen.get_size())
+        self.font = pygame.font.SysFont("arial", 20)
+        self.tiny = pygame.font.SysFont("arial", 16)
+
+    def on_action(self, action: str):
+        if action == "menu_up":
+            self.selected = (self.selected - 1) % len(MENU_OPTIONS)
+        elif action == "menu_down":
+            self.selected = (self.selected + 1) % len(MENU_OPTIONS)
+        elif action == "menu_select":
+            choice = MENU_OPTIONS[self.selected][1]
+            if choice == "quit":
+                self.app.running = False
+            else:
+                self.app.start_game(load=choice == "load")
+
+    def is_animating(self) -> bool:
+        return self.app.preloader is not None and not self.app.preloader.done
+
+    def draw(self, screen: pygame.Surface):
+        screen.blit(self.background, (0, 0))
+        draw_menu_options(screen, self.font, self.selected)
+        preloader = self.app.preloader
+        if preloader is not None and not preloader.done:
+            draw_progress_bar(screen, self.tiny, preloader.progress(), screen.get_height() - 130)
+
+
+class GameScene(Scene):
+    """The grid and its modal: actions go to GameManager.perform."""
+
+    game_time = True
+
+    @property
+    def name(self) -> str:
+        return "modal" if self.app.gm.in_modal else "playing"
+
+    @property
+    def contexts(self) -> tuple:
+        return ("global", "play", self.app.gm.input_context())
+
+    def on_action(self, action: str):
+        gm = self.app.gm
+        if action == "pause":
+            self.app.push(PauseScene(self.app))
+        elif action == "save":
+            self.app.save()
+        elif gm.perform(action):
+            # The end-of-game check must not wait for the next fixed step: the loop may go idle first
+            gm.update()
+            self._check_end()
+
+    def update(self, dt: float):
+        gm = self.app.gm
+        if self.app.scheduler.advance(dt):
+            self.app.dirty = True  # a timer may have changed the message
+        gm.update()
+        self._check_end()
+
+    def _check_end(self):
+        gm = self.app.gm
+        if self.app.top is not self:
+            return
+        current_room = gm.grid.get_room(gm.player.row, gm.player.col)
+        if current_room and current_room.room_type == "exit":
+            self.app.push(VictoryScene(self.app))
+        elif gm.inventory.is_dead():
+            self.app.push(GameOverScene(self.app))
+
+    def is_animating(self) -> bool:
+        return self.app.gm.is_animating()
+
+    def draw(self, screen: pygame.Surface):
+        self.app.gm.draw()
+
+
+class OverlayScene(Scene):
+    """Translucent screen over the game, rendered once in enter()."""
+
+    opaque = False
+
+    def enter(self):
+        self.overlay = self.render(self.app.screen.get_size())
+
+    def render(self, size) -> pygame.Surface:
+        raise NotImplementedError
+
+    def draw(self, screen: pygame.Surface):
+        screen.blit(self.overlay, (0, 0))
+
+
+class PauseScene(OverlayScene):
+    name = "paused"
+    contexts = ("global", "pause")
+
+    def render(self, size) -> pygame.Surface:
+        return render_pause_overlay(size)
+
+    def on_action(self, action: str):
+        if action == "pause":
+            self.app.pop()
+        elif action == "save":
+            self.app.save()
+            self.app.dirty = True
+        elif action == "quit_to_menu":
+            self.app.show_menu()
+
+
+class EndScene(OverlayScene):
+    contexts = ("global", "end")
+
+    def on_action(self, action: str):
+        if action == "quit_to_menu":
+            self.app.show_menu()
+        elif action == "restart":
+            self.app.restart()
+
+
+class VictoryScene(EndScene):
+    name = "victory"
+
+    def enter(self):
+        super().enter()
+        play_effect("victory", PRIORITY_END)
+
+    def render(self, size) -> pygame.Surface:
+        return render_victory_overlay(size, self.app.gm.inventory)
+
+
+class GameOverScene(EndScene):
+    name = "game_over"
+
+    def enter(self):
+        super().enter()
+        play_effect("game_over", PRIORITY_END)
+
+    def render(self, size) -> pygame.Surface:
+        return render_game_over_overlay(size)
+
+
+class App:
+    """Scene stack + the single main loop, with the per-process instrumentation."""
+
+    def __init__(self, context, preloader=None):
+        self.context = context
+        self.screen = context.screen
+        self.clock = context.clock
+        self.preloader = preloader
+        self.scheduler = context.scheduler
+        self.keymap = get_keymap()
+        self.scenes: list[Scene] = []
+        self.gm: GameManager | None = None
+        self.running = True
+        self.dirty = True  # the screen must be redrawn
+
+        self.telemetry = create_telemetry()
+        self.startup = StartupTimer()
+        self.profiler = ProfilerControls()
+        self.watchdog = create_watchdog(self.state_summary)
+
+    # --------------------
+    # Stack
+    # --------------------
+    @property
+    def top(self) -> Scene:
+        return self.scenes[-1]
+
+    def push(self, scene: Scene):
+        self.scenes.append(scene)
+        scene.enter()
+        self.dirty = True
+
+    def pop(self) -> Scene:
+        scene = self.scenes.pop()
+        scene.exit()
+        self.dirty = True
+        return scene
+
+    def switch(self, scene: Scene):
+        """Replaces the whole stack with scene."""
+        while self.scenes:
+            self.pop()
+        self.push(scene)
+
+    # --------------------
+    # Transitions
+    # --------------------
+    def start_game(self, load: bool = False):
+        self.startup.start()
+        if self.gm is None:
+            self.gm = GameManager(context=self.context)
+        else:
+            self.gm.reset()
+
+        if load:
+            if load_game(self.gm.grid, self.gm.inventory, self.gm.player):
+                self.gm.message = "Partie chargée avec succès!"
+            else:
+                self.gm.message = "Aucune sauvegarde trouvée. Nouvelle partie."
+        start_recording(self.gm)
+        self.switch(GameScene(self))
+
+    def restart(self):
+        finish_recording(self.gm)
+        self.startup.start()
+        self.gm.reset()
+        start_recording(self.gm)
+        self.switch(GameScene(self))
+
+    def show_menu(self):
+        finish_recording(self.gm)
+        self.switch(MenuScene(self))
+
+    def save(self):
+        save_game(self.gm.grid, self.gm.inventory, self.gm.player)
+        self.gm.notify("Partie sauvegardée!")
+
+    # --------------------
+    # Loop
+    # --------------------
+    def run(self):
+        if not self.scenes:
+            self.push(MenuScene(self))
+        if self.preloader is not None and not self.preloader.done:
+            # Once per update step, whatever the scene (a game may start before the preload ends)
+            self._preload_timer = self.scheduler.every(STEP, self._poll_preloader, clock=WALL, delay=0)
+        telemetry, watchdog = self.telemetry, self.watchdog
+        lag = 0.0
+        previous = time.perf_counter()
+
+        while self.running and self.scenes:
+            # Obtain events (block while idle: nothing animating, nothing to redraw)
+            animating = self.top.is_animating()
+            watchdog.frame_done()
+            events = next_events(idle=not (self.dirty or animating), timeout_ms=self._idle_timeout())
+            watchdog.frame_start()
+            if events:
+                self.dirty = True
+            telemetry.begin_frame()
+
+            for event in events:
+                watchdog.note_event(event)
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                action = self.keymap.resolve_event(self.top.contexts, event)
+                if action is not None and not self._global_action(action):
+                    self.top.on_action(action)
+            if self.scheduler.run_wall():
+                self.dirty = True
+            telemetry.mark(EVENTS)
+
+            # Fixed-timestep logic: the same number of updates per second at any frame rate
+            now = time.perf_counter()
+            lag = min(lag + now - previous, MAX_CATCH_UP)
+            previous = now
+            while lag >= STEP and self.running and self.scenes:
+                self.top.update(STEP)
+                lag -= STEP
+            telemetry.mark(UPDATE)
+
+            if not self.running or not self.scenes:
+                break
+            if not (self.dirty or self.top.is_animating()):
+                continue
+            self.draw()
+
+        finish_recording(self.gm)
+        self.profiler.stop_all()
+        watchdog.stop()
+
+    def draw(self):
+        telemetry = self.telemetry
+        # Only what the topmost opaque scene and the overlays above it show
+        first = max(i for i, scene in enumerate(self.scenes) if scene.opaque or i == 0)
+        self.scenes[first].draw(self.screen)
+        telemetry.mark(DRAW)
+        for scene in self.scenes[first + 1:]:
+            scene.draw(self.screen)
+        telemetry.draw_hud(self.screen, self.context.font)
+        telemetry.mark(OVERLAYS)
+
+        pygame.display.flip()
+        self.startup.first_frame()
+        telemetry.mark(FLIP)
+        telemetry.end_frame()
+        self.watchdog.frame_done()
+        self.dirty = False
+        self.clock.tick(FPS)
+
+    def _idle_timeout(self) -> int:
+        """ms the idle loop may sleep: until the next timer due, at most IDLE_WAIT_MS."""
+        delays = [self.scheduler.next_delay(WALL)]
+        if self.top.game_time:
+            delay = self.scheduler.next_delay(GAME)
+            # An idle wait counts for at most MAX_CATCH_UP of game time: wake up often enough to keep up
+            delays.append(None if delay is None else min(delay, MAX_CATCH_UP))
+        delays = [delay for delay in delays if delay is not None]
+        if not delays:
+            return IDLE_WAIT_MS
+        return max(1, min(IDLE_WAIT_MS, math.ceil(min(delays) * 1000)))  # 0 would mean "no timeout"
+
+    def _poll_preloader(self):
+        self.preloader.poll()
+        if self.preloader.done:
+            self._preload_timer.cancel()
+        if self.scenes and isinstance(self.top, MenuScene):
+            self.dirty = True  # the progress bar moves (and the last frame clears it)
+
+    def _global_action(self, action: str) -> bool:
+        """Actions of the "global" context (any scene). Returns True if handled."""
+        if action == "toggle_hud":
+            # Frame-time HUD (BP_TELEMETRY=1)
+            self.telemetry.toggle_hud()
+        elif action == "profile_cprofile":
+            # Profiling captures, named after the current state
+            self._notify(self.profiler.toggle_cprofile(self.state_name()))
+        elif action == "profile_sampling":
+            self._notify(self.profiler.toggle_sampling(self.state_name()))
+        else:
+            return False
+        return True
+
+    def _notify(self, message: str):
+        if self.gm is not None:
+            self.gm.notify(message)
+        log.info("%s", message)
+
+    # --------------------
+    # State
+    # --------------------
+    def state_name(self) -> str:
+        """Short name of the current state (used to name profiling captures)."""
+        return self.top.name if self.scenes else "menu"
+
+    def state_summary(self) -> dict:
+        """Small snapshot of the game for hitch reports."""
+        state = self.state_name()
+        gm = self.gm
+        if gm is None or state == "menu":
+            return {"state": state}
+        return {
+            "state": state,
+            "player": (gm.player.row, gm.player.col),
+            "cursor": (gm.player.sel_row, gm.player.sel_col),
+            "steps": gm.inventory.steps,
+            "grid_version": gm.grid.version,
+        }
+
+
+def start_recording(gm):
+    """
+    Seed the RNG and attach a replay recorder (BP_RECORD=1).
+    The first keyframe holds the starting state, so loaded games can be replayed too.
+    """
+    if REPLAY_ENABLED:
+        seed = new_seed()
+        random.seed(seed)
+        gm.recorder = ReplayRecorder(seed)
+
+
+def finish_recording(gm):
+    """Write the replay of a finished game, if it was recorded."""
+    if gm is not None and gm.recorder is not None:
+        path = gm.recorder.save(gm)
+        gm.recorder = None
+        log.info("Replay: %s", path)
@@ -0,0 +1,147 @@
+# scheduler.py
+"""
+Minuteries: travail à faire plus tard, sans sonder chaque sous-système à
+chaque update.
+
+    timer = scheduler.after(2.0, callback)               # une fois, dans 2 s
+    timer = scheduler.every(0.5, callback, clock=WALL)   # toutes les 0.5 s
+    timer.cancel()
+
+Deux horloges:
+    GAME  temps de jeu, avancé par advance(dt) à chaque pas fixe de la
+          scène de jeu (scenes.py): il s'arrête en pause et au menu.
+    WALL  temps réel (time.perf_counter), consulté par run_wall() à chaque
+          tour de boucle, quel que soit l'écran.
+
+Chaque horloge a son tas (heapq) de (échéance, n°, Timer): un tour ne
+regarde que le sommet, et chaque minuterie échue coûte O(log n). Une
+minuterie annulée reste dans le tas et est ignorée quand elle en sort (le
+tas est reconstruit s'il contient surtout des annulées).
+
+Les callbacks du temps de jeu ne modifient pas le modèle (grille,
+inventaire, joueur): un replay ne rejoue que les actions, pas le temps.
+"""
+
+import heapq
+import itertools
+import time
+
+GAME, WALL = "game", "wall"
+
+
+class Timer:
+    """Une minuterie; interval est None pour une minuterie à un coup."""
+
+    __slots__ = ("due", "interval", "callback", "clock", "cancelled", "_scheduler")
+
+    def __init__(self, scheduler: "Scheduler", due: float, interval: float | None, callback, clock: str):
+        self._scheduler = scheduler
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.clock = clock
+        self.cancelled = False
+
+    def cancel(self):
+        """Sans effet si la minuterie est déjà annulée ou terminée."""
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._cancelled[self.clock] += 1
+
+
+class Scheduler:
+    """Minuteries en temps de jeu et en temps réel."""
+
+    def __init__(self, wall_clock=time.perf_counter):
+        self.wall_clock = wall_clock
+        self.game_time = 0.0
+        self._heaps: dict[str, list] = {GAME: [], WALL: []}
+        self._cancelled = {GAME: 0, WALL: 0}  # annulées encore dans chaque tas
+        self._seq = itertools.count()  # départage les échéances égales (ordre d'ajout)
+
+    def now(self, clock: str = GAME) -> float:
+        return self.game_time if clock == GAME else self.wall_clock()
+
+    def after(self, delay: float, callback, clock: str = GAME) -> Timer:
+        """Appelle callback() une fois, dans delay secondes de clock."""
+        return self._push(Timer(self, self.now(clock) + delay, None, callback, clock))
+
+    def every(self, interval: float, callback, clock: str = GAME, delay: float | None = None) -> Timer:
+        """Appelle callback() toutes les interval secondes (la première fois après delay, par défaut interval)."""
+        if interval <= 0:
+            raise ValueError(f"intervalle invalide: {interval!r}")
+        first = interval if delay is None else delay
+        return self._push(Timer(self, self.now(clock) + first, interval, callback, clock))
+
+    def _push(self, timer: Timer) -> Timer:
+        heapq.heappush(self._heaps[timer.clock], (timer.due, next(self._seq), timer))
+        return timer
+
+    def clear(self, clock: str | None = None):
+        """Annule les minuteries de clock (toutes si None)."""
+        for name in (GAME, WALL) if clock is None else (clock,):
+            heap = self._heaps[name]
+            for _, _, timer in heap:
+                timer.cancelled = True
+            heap.clear()  # en place: appelable depuis un callback
+            self._cancelled[name] = 0
+
+    # --------------------
+    # Avance des horloges (scenes.App.run)
+    # --------------------
+    def advance(self, dt: float) -> int:
+        """Avance le temps de jeu de dt et exécute ce qui est échu. Retourne le nombre de callbacks appelés."""
+        self.game_time += dt
+        return self._run(GAME, self.game_time)
+
+    def run_wall(self) -> int:
+        """Exécute les minuteries en temps réel échues."""
+        return self._run(WALL, self.wall_clock())
+
+    def _run(self, clock: str, now: float) -> int:
+        heap = self._heaps[clock]
+        fired = 0
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                self._cancelled[clock] -= 1
+                continue
+            if timer.interval is None:
+                timer.cancelled = True  # terminée (cancel() ne fait plus rien)
+            else:
+                # Échéances régulières sans dérive; après un long arrêt, pas de rafale de rattrapage
+                timer.due += timer.interval
+                if timer.due <= now:
+                    timer.due = now + timer.interval
+                self._push(timer)
+            timer.callback()
+            fired += 1
+        self._compact(clock)
+        return fired
+
+    def _compact(self, clock: str):
+        heap = self._heaps[clock]
+        if len(heap) > 64 and self._cancelled[clock] * 2 > len(heap):
+            heap[:] = [entry for entry in heap if not entry[2].cancelled]
+            heapq.heapify(heap)
+            self._cancelled[clock] = 0
+
+    # --------------------
+    # Attente au repos
+    # --------------------
+    def next_delay(self, clock: str) -> float | None:
+        """
+        Secondes de clock avant la prochaine échéance (None s'il n'y en a
+        pas), pour que la boucle au repos se réveille à temps.
+        """
+        heap = self._heaps[clock]
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled[clock] -= 1
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.now(clock))
+
+    def __len__(self) -> int:
+        """Nombre de minuteries actives."""
+        return sum(len(heap) - self._cancelled[clock] for clock, heap in self._heaps.items())
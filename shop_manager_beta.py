@@ -9,6 +9,10 @@ Ce module gère toutes les interactions avec les magasins du jeu,
 permettant au joueur d'échanger des pièces d'or contre des objets utiles.
 """
 
+from log import get_logger
+
+log = get_logger("shop")
+
 class ShopManager:
     """
     Gère les interactions avec les magasins et les échanges commerciaux.
@@ -130,7 +134,7 @@ class ShopManager:
         """
         # Vérification préalable de la possibilité d'achat
         if not self.can_buy(item_name):
-            print("💰 Pas assez de pièces pour cet achat!")
+            log.info("💰 Pas assez de pièces pour cet achat!")
             return False
         
         # Récupération des informations de l'objet
@@ -147,13 +151,13 @@ class ShopManager:
         if success:
             # Affichage du message de confirmation
             item_display_name = self._get_item_display_name(item_name)
-            print(f"{emoji} {item_display_name} acheté pour {price} pièces d'or!")
-            print(f"💰 Portefeuille restant: {self.player.inventory.coins.quantity} pièces")
+            log.info("%s %s acheté pour %d pièces d'or!", emoji, item_display_name, price)
+            log.info("💰 Portefeuille restant: %d pièces", self.player.inventory.coins.quantity)
             return True
         else:
             # En cas d'erreur, remboursement des pièces
             self.player.inventory.coins.add(price)
-            print("❌ Erreur lors de l'achat - Transaction annulée")
+            log.error("❌ Erreur lors de l'achat - Transaction annulée")
             return False
     
     def _give_purchased_item(self, item_name: str, item_info: dict) -> bool:
@@ -182,7 +186,7 @@ class ShopManager:
                 self.player.inventory.add_item('food_apple', 3)
             return True
         except Exception as e:
-            print(f"❌ Erreur lors de l'ajout de l'objet: {e}")
+            log.error("❌ Erreur lors de l'ajout de l'objet: %s", e)
             return False
     
     def _get_item_display_name(self, item_name: str) -> str:
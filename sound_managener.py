@@ -1,45 +1,232 @@
-
 # Mohand
 # sound_manager.py
 """
- - assets/sounds/music/<name>.mp3 (o .ogg)
- - assets/sounds/effects/<name>.wav
+ - <MUSIC_DIR>/<name>.mp3 (o .ogg)
+ - <SFX_DIR>/<name>.wav (.ogg, .mp3)
+Répertoires: ceux de constants.py.
+
+Effets joués par le jeu (play_effect, absents = ignorés):
+    step       entrée dans une salle déjà découverte
+    door       nouvelle salle posée depuis la modale
+    victory    écran de victoire (priorité haute)
+    game_over  écran de game over (priorité haute)
+
+Les effets sont chargés une seule fois dans un SoundBank (init_sound) et joués
+sur un petit groupe de canaux réservés: un son plus prioritaire peut voler le
+canal du son le moins prioritaire (le plus ancien s'il y en a plusieurs); à
+priorité égale ou inférieure, le nouveau son est abandonné.
+SoundBank.stats() donne la latence de play() et les compteurs.
+
+start_audio() fait tout cela (mixer, SoundBank, musique) une seule fois par
+processus, sur un thread: le jeu démarre sans attendre le périphérique audio,
+et la musique commence dès qu'il est prêt.
 """
 
 import os
+import threading
+import time
+from collections import deque
+
 import pygame
 
-MUSIC_DIR = os.path.join("assets", "sounds", "music")
-EFFECTS_DIR = os.path.join("assets", "sounds", "effects")
+from constants import AUDIO_DIR, MUSIC_DIR, SFX_DIR
+from telemetry import percentile
+from asset_manifest import asset_exists, find_asset, open_asset, list_assets
+from log import get_logger
+
+SFX_EXTENSIONS = (".wav", ".ogg", ".mp3")
+SFX_CHANNELS = 6
+MAIN_THEME_PATHS = (os.path.join(AUDIO_DIR, "main_theme.mp3"), os.path.join(AUDIO_DIR, "main_theme.wav"))
+LATENCY_SAMPLES = 256
+
+log = get_logger("audio")
+
+
+class SoundBank:
+    """Effets préchargés + pool de canaux réservés avec priorités."""
+
+    def __init__(self, directory: str = SFX_DIR, channels: int = SFX_CHANNELS):
+        self.directory = directory
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        # Les canaux 0..n-1 sont réservés: Sound.play() ailleurs ne les prend jamais
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels + 8))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._voices = [(0, 0.0)] * channels  # (priorité, début) du son de chaque canal
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.counters = {"played": 0, "stolen": 0, "dropped": 0, "missing": 0}
+        self.missing: set = set()  # effets absents déjà signalés
+
+    def load(self) -> int:
+        """Décode tous les effets du répertoire. Retourne le nombre de sons chargés."""
+        paths = list_assets(self.directory)
+        if not paths:
+            log.warning("Effects directory not found: %s", self.directory)
+            return 0
+        for path in paths:
+            filename = os.path.basename(path)
+            name, ext = os.path.splitext(filename)
+            if ext.lower() not in SFX_EXTENSIONS:
+                continue
+            try:
+                with open_asset(path) as f:
+                    sound = pygame.mixer.Sound(file=f)
+            except Exception as e:
+                log.error("Error loading effect: %s %s", filename, e)
+                continue
+            # Accessible par "door" comme par "door.wav"
+            self.sounds[name] = self.sounds[filename] = sound
+        return self.loaded()
+
+    def loaded(self) -> int:
+        return len({id(s) for s in self.sounds.values()})
+
+    def play(self, name: str, priority: int = 0, volume: float = 1.0):
+        """Joue un effet préchargé. Retourne le canal utilisé, ou None."""
+        start = time.perf_counter()
+        sound = self.sounds.get(name)
+        if sound is None:
+            # (sans aucun effet chargé, le répertoire absent a déjà été signalé)
+            if name not in self.missing and self.sounds:
+                self.missing.add(name)
+                log.warning("Missing effect: %s", name)
+            self.counters["missing"] += 1
+            return None
+
+        index = self._pick_channel(priority)
+        if index is None:
+            self.counters["dropped"] += 1
+            return None
+        channel = self.channels[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        self._voices[index] = (priority, start)
+        self.counters["played"] += 1
+        self.latencies.append((time.perf_counter() - start) * 1000.0)
+        return channel
+
+    def _pick_channel(self, priority: int) -> int | None:
+        """Canal libre, sinon vol de la voix la moins prioritaire (< priority), la plus ancienne."""
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            if self._voices[i][0] < priority and (victim is None or self._voices[i] < self._voices[victim]):
+                victim = i
+        if victim is not None:
+            self.channels[victim].stop()
+            self.counters["stolen"] += 1
+        return victim
+
+    def stop_all(self):
+        for channel in self.channels:
+            channel.stop()
+
+    def stats(self) -> dict:
+        """Latence de play() en ms (p50, p95, max) et compteurs."""
+        samples = sorted(self.latencies)
+        latency = {"p50": percentile(samples, 50), "p95": percentile(samples, 95),
+                   "max": samples[-1]} if samples else {}
+        return {"latency_ms": latency, **self.counters, "loaded": self.loaded()}
+
+
+_bank: SoundBank | None = None
+_music_file = None  # the mixer streams music from this file object: keep it open
+_audio_lock = threading.Lock()
+_audio_thread: threading.Thread | None = None
+_audio_ready = threading.Event()
+audio_init_ms: float | None = None  # durée de l'initialisation en arrière-plan
+
 
 def init_sound():
+    global _bank
     try:
-        pygame.mixer.init()
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        if _bank is None:
+            _bank = SoundBank()
+            _bank.load()
     except Exception as e:
-        print("Audio init failed:", e)
+        log.error("Audio init failed: %s", e)
+
+
+def start_audio(music_paths: list | tuple = MAIN_THEME_PATHS):
+    """
+    Lance init_sound() puis la première musique existante de music_paths sur un
+    thread. Les appels suivants (nouvelle partie, "R") ne font rien.
+    """
+    global _audio_thread
+    with _audio_lock:
+        if _audio_thread is not None:
+            return
+        _audio_thread = threading.Thread(target=_init_audio, args=(tuple(music_paths),),
+                                         name="audio-init", daemon=True)
+        _audio_thread.start()
+
+
+def _init_audio(music_paths: tuple):
+    global audio_init_ms
+    start = time.perf_counter()
+    init_sound()
+    if pygame.mixer.get_init():
+        for path in music_paths:
+            if asset_exists(path):
+                _load_music(path, loop=True)
+                break
+    audio_init_ms = (time.perf_counter() - start) * 1000.0
+    _audio_ready.set()
+
+
+def audio_ready() -> bool:
+    return _audio_ready.is_set()
+
+
+def wait_audio(timeout: float | None = None) -> bool:
+    return _audio_ready.wait(timeout)
+
+
+def get_bank() -> SoundBank | None:
+    return _bank
+
 
 def play_music(filename: str, loop: bool = True):
     path = os.path.join(MUSIC_DIR, filename)
-    if not os.path.exists(path):
-        print("Music file not found:", path)
+    if find_asset(path) is None:
         return
+    _load_music(path, loop)
+
+
+def _load_music(path: str, loop: bool):
+    global _music_file
+    music_file = None
     try:
-        pygame.mixer.music.load(path)
+        # The mixer streams from the old file: close it only once the music is unloaded
+        pygame.mixer.music.stop()
+        pygame.mixer.music.unload()
+        if _music_file is not None:
+            _music_file.close()
+            _music_file = None
+        music_file = open_asset(path)
+        pygame.mixer.music.load(music_file, os.path.basename(path))
+        _music_file, music_file = music_file, None
         pygame.mixer.music.set_volume(0.5)
         pygame.mixer.music.play(-1 if loop else 0)
     except Exception as e:
-        print("Error playing music:", e)
+        log.error("Error playing music: %s", e)
+    finally:
+        if music_file is not None:
+            music_file.close()  # opened but not loaded
+
 
 def stop_music():
     pygame.mixer.music.stop()
 
-def play_effect(filename: str):
-    path = os.path.join(EFFECTS_DIR, filename)
-    if not os.path.exists(path):
-        print("Effect file not found:", path)
-        return
-    try:
-        s = pygame.mixer.Sound(path)
-        s.play()
-    except Exception as e:
-        print("Error playing effect:", e)
+
+PRIORITY_GAME, PRIORITY_END = 0, 1
+
+
+def play_effect(filename: str, priority: int = PRIORITY_GAME):
+    """Joue un effet du SoundBank (sans accès disque); silencieux si l'audio n'est pas prêt."""
+    if _bank is None:
+        return None
+    return _bank.play(filename, priority)
@@ -0,0 +1,122 @@
+# surface_cache.py
+"""
+Cache disque des images déjà décodées et mises à l'échelle.
+
+Une entrée est un fichier de pixels bruts (RGBA) nommé d'après
+(chemin de la source, hash de son contenu, taille cible, format de pixels):
+    <nom>-<hash du chemin>-<blake2b de la source>-<largeur>x<hauteur>-RGBA.raw
+Le hash du chemin distingue rooms/x.png de icons/x.png.
+Au lancement suivant, l'image est relue par mmap + pygame.image.frombuffer,
+sans décodage PNG ni transform.scale. Si la source change, son hash change:
+l'entrée n'est plus trouvée, elle est recalculée et l'ancienne supprimée.
+"""
+
+import hashlib
+import mmap
+import os
+
+import pygame
+
+from constants import ROOT_DIR
+from asset_manifest import get_manifest, open_asset
+from log import get_logger
+
+SURFACE_CACHE_DIR = os.environ.get("BP_SURFACE_CACHE", os.path.join(ROOT_DIR, ".cache", "surfaces"))
+PIXEL_FORMAT = "RGBA"
+
+log = get_logger("cache")
+
+
+def source_hash(path: str) -> str:
+    """Hash du contenu de la source (fichier ou entrée du paquet d'assets)."""
+    with open_asset(path) as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+class SurfaceCache:
+    """Images mises à l'échelle, conservées d'un lancement à l'autre."""
+
+    def __init__(self, directory: str = SURFACE_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, path: str, digest: str, size: tuple[int, int]) -> str:
+        return os.path.join(self.directory, _prefix(path) + digest + _suffix(size))
+
+    def load(self, path: str, size: tuple[int, int]) -> pygame.Surface:
+        """Image path à la taille size (la source doit exister)."""
+        return self._load(path, size, display_format)
+
+    def load_raw(self, path: str, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Comme load, sans la conversion au format de la fenêtre: utilisable depuis
+        un thread (preload.py); convert_alpha reste à faire sur le thread principal.
+        """
+        return self._load(path, size, pygame.Surface.copy)
+
+    def _load(self, path: str, size: tuple[int, int], finish) -> pygame.Surface:
+        entry = self._entry(path, source_hash(path), size)
+        if os.path.exists(entry):
+            surface = self._read(entry, size, finish)
+            if surface is not None:
+                self.hits += 1
+                return surface
+
+        self.misses += 1
+        with open_asset(path) as f:
+            surface = pygame.transform.scale(pygame.image.load(f, os.path.basename(path)), size)
+        self._write(entry, surface, _prefix(path), _suffix(size))
+        return finish(surface)
+
+    @staticmethod
+    def _read(entry: str, size: tuple[int, int], finish) -> pygame.Surface | None:
+        with open(entry, "rb") as f:
+            if os.fstat(f.fileno()).st_size != size[0] * size[1] * len(PIXEL_FORMAT):
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pixels:
+                # frombuffer partage la projection: finish en fait une copie avant fermeture
+                return finish(pygame.image.frombuffer(pixels, size, PIXEL_FORMAT))
+
+    def _write(self, entry: str, surface: pygame.Surface, prefix: str, suffix: str):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = entry + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(pygame.image.tobytes(surface, PIXEL_FORMAT))
+            os.replace(tmp, entry)
+            self._prune(entry, prefix, suffix)
+        except OSError as e:
+            log.warning("Surface cache write failed: %s", e)
+
+    def _prune(self, entry: str, prefix: str, suffix: str):
+        """Supprime les entrées de la même image et taille faites à partir d'une ancienne source."""
+        current = os.path.basename(entry)
+        for name in os.listdir(self.directory):
+            if name == current or not (name.startswith(prefix) and name.endswith(suffix)):
+                continue
+            # même chemin (préfixe exact) et même taille: seul le hash du contenu peut différer
+            digest = name[len(prefix):len(name) - len(suffix)]
+            if len(digest) == _DIGEST_CHARS and "-" not in digest:
+                os.remove(os.path.join(self.directory, name))
+
+
+_DIGEST_CHARS = 16  # blake2b(digest_size=8) en hexadécimal
+
+
+def _prefix(path: str) -> str:
+    """<nom>-<hash du chemin logique>-: propre à une source, même si son nom de fichier est partagé."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    key = hashlib.blake2b(get_manifest().name(path).encode("utf-8"), digest_size=4).hexdigest()
+    return f"{stem}-{key}-"
+
+
+def _suffix(size: tuple[int, int]) -> str:
+    return f"-{size[0]}x{size[1]}-{PIXEL_FORMAT}.raw"
+
+
+def display_format(surface: pygame.Surface) -> pygame.Surface:
+    """convert_alpha si une fenêtre existe (sinon simple copie, indépendante du buffer)."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface.copy()
@@ -0,0 +1,213 @@
+# telemetry.py
+"""
+Mesure du temps de frame, découpé par phase.
+
+Les durées sont stockées dans un buffer circulaire préalloué (aucune
+allocation par frame). Les percentiles (p50/p95/p99) et le nombre de
+"hitches" (frames plus longues que HITCH_MS) sont calculés à la demande,
+pour le HUD (F3) et pour l'export CSV à la fermeture.
+
+Activation: variable d'environnement BP_TELEMETRY=1. Désactivée, la boucle
+utilise NullTelemetry dont les méthodes ne font rien.
+"""
+
+import csv
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+
+import pygame
+
+TELEMETRY_ENABLED = os.environ.get("BP_TELEMETRY", "") not in ("", "0")
+TELEMETRY_DIR = "telemetry"
+HITCH_MS = 50.0
+
+PHASES = ("events", "update", "draw", "overlays", "flip")
+EVENTS, UPDATE, DRAW, OVERLAYS, FLIP = range(len(PHASES))
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Percentile par rang le plus proche sur une liste déjà triée."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class FrameTelemetry:
+    """Buffer circulaire des durées de frame (secondes) par phase."""
+
+    enabled = True
+
+    def __init__(self, capacity: int = 1024, hitch_ms: float = HITCH_MS):
+        self.capacity = capacity
+        self.hitch_s = hitch_ms / 1000.0
+        self.phases = [[0.0] * capacity for _ in PHASES]
+        self.totals = [0.0] * capacity
+        self.index = 0       # prochaine case à écrire
+        self.frames = 0      # frames enregistrées depuis le début
+        self.hitches = 0     # frames > hitch_ms depuis le début
+        self.show_hud = False
+        self._t0 = 0.0
+        self._last = 0.0
+        self._hud_surface = None
+        self._hud_refresh_at = 0.0
+
+    # --------------------
+    # Hot path (appelé à chaque frame)
+    # --------------------
+    def begin_frame(self):
+        self._t0 = self._last = time.perf_counter()
+
+    def mark(self, phase: int):
+        """Clôt la phase en cours (EVENTS, UPDATE, ...)."""
+        now = time.perf_counter()
+        self.phases[phase][self.index] = now - self._last
+        self._last = now
+
+    def end_frame(self):
+        total = time.perf_counter() - self._t0
+        i = self.index
+        self.totals[i] = total
+        if total > self.hitch_s:
+            self.hitches += 1
+        self.index = (i + 1) % self.capacity
+        self.frames += 1
+
+    # --------------------
+    # Statistiques
+    # --------------------
+    def _recent(self, values: list) -> list:
+        n = min(self.frames, self.capacity)
+        if self.frames <= self.capacity:
+            return values[:n]
+        return values[self.index:] + values[:self.index]
+
+    def stats(self) -> dict:
+        """{nom: (p50, p95, p99)} en millisecondes, pour chaque phase et 'frame'."""
+        result = {}
+        for name, values in zip(PHASES + ("frame",), self.phases + [self.totals]):
+            s = sorted(self._recent(values))
+            result[name] = tuple(percentile(s, p) * 1000.0 for p in (50, 95, 99))
+        return result
+
+    def summary(self) -> str:
+        p50, p95, p99 = self.stats()["frame"]
+        return (f"{self.frames} frames, p50 {p50:.2f} ms, p95 {p95:.2f} ms, "
+                f"p99 {p99:.2f} ms, {self.hitches} hitch(es) > {self.hitch_s * 1000:.0f} ms")
+
+    # --------------------
+    # HUD
+    # --------------------
+    def toggle_hud(self):
+        self.show_hud = not self.show_hud
+        self._hud_refresh_at = 0.0
+
+    def draw_hud(self, surface: pygame.Surface, font: pygame.font.Font):
+        """Affiche les percentiles en haut à gauche (re-rendu au plus deux fois par seconde)."""
+        if not self.show_hud:
+            return
+        now = time.perf_counter()
+        if self._hud_surface is None or now >= self._hud_refresh_at:
+            self._hud_surface = self._render_hud(font)
+            self._hud_refresh_at = now + 0.5
+        surface.blit(self._hud_surface, (8, 8))
+
+    def _render_hud(self, font: pygame.font.Font) -> pygame.Surface:
+        stats = self.stats()
+        lines = [f"{'':9}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name in ("frame",) + PHASES:
+            p50, p95, p99 = stats[name]
+            lines.append(f"{name:9}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        lines.append(f"hitches: {self.hitches} / {self.frames}")
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        w = max(r.get_width() for r in rendered) + 12
+        h = sum(r.get_height() for r in rendered) + 8
+        hud = pygame.Surface((w, h), pygame.SRCALPHA)
+        hud.fill((0, 0, 0, 170))
+        y = 4
+        for r in rendered:
+            hud.blit(r, (6, y))
+            y += r.get_height()
+        return hud
+
+    # --------------------
+    # Export
+    # --------------------
+    def dump_csv(self, directory: str = TELEMETRY_DIR) -> str | None:
+        """Écrit les frames du buffer (ms) dans un CSV horodaté. Retourne le chemin."""
+        if self.frames == 0:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"frames_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+        columns = [self._recent(values) for values in self.phases + [self.totals]]
+        first = self.frames - len(columns[0])
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + tuple(f"{p}_ms" for p in PHASES) + ("total_ms",))
+            for i, row in enumerate(zip(*columns)):
+                writer.writerow([first + i] + [f"{v * 1000.0:.3f}" for v in row])
+        return path
+
+
+class StartupTimer:
+    """
+    Temps entre le lancement d'une partie et sa première frame affichée.
+    La première partie du processus est "cold" (caches et modules à
+    initialiser), les suivantes "warm".
+    """
+
+    def __init__(self):
+        self._origin = None
+        self._kind = "cold"
+        self.samples: dict[str, list] = {"cold": [], "warm": []}
+
+    def start(self):
+        """Appelé quand une partie est demandée (menu, "R")."""
+        self._kind = "warm" if self.samples["cold"] else "cold"
+        self._origin = time.perf_counter()
+
+    def first_frame(self):
+        """Appelé après chaque flip; seul le premier après start() compte."""
+        if self._origin is not None:
+            self.samples[self._kind].append((time.perf_counter() - self._origin) * 1000.0)
+            self._origin = None
+
+    def summary(self) -> str:
+        parts = []
+        for kind, values in self.samples.items():
+            if values:
+                parts.append(f"{kind} {statistics.median(values):.0f} ms (n={len(values)})")
+        return "start-to-first-frame: " + (", ".join(parts) if parts else "-")
+
+
+class NullTelemetry:
+    """Remplaçant sans effet quand la télémétrie est désactivée."""
+
+    enabled = False
+    show_hud = False
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase: int):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def toggle_hud(self):
+        pass
+
+    def draw_hud(self, surface, font):
+        pass
+
+    def dump_csv(self, directory: str = TELEMETRY_DIR):
+        return None
+
+
+def create_telemetry():
+    """FrameTelemetry si BP_TELEMETRY est défini, sinon NullTelemetry."""
+    return FrameTelemetry() if TELEMETRY_ENABLED else NullTelemetry()
@@ -6,15 +6,43 @@ import os
 from typing import Tuple
 from constants import *
 from grid import Grid, Room
+from app_context import images
 
 FONT_SIZE = 18
+ICON_SIZE = 24
+
+# (libellé, champ de Inventory, icône)
+CONSUMABLE_ICONS = [
+    ("Pas", "steps", "steps.png"),
+    ("Gemmes", "gems", "gem.png"),
+    ("Clés", "keys", "key.png"),
+    ("Dés", "dice", "dice.png"),
+    ("Pièces", "gold", "gold.png"),
+]
+PERMANENT_ICONS = [
+    ("Pelle", "shovel", "pelle.png"),
+    ("Marteau", "hammer", "marteau.png"),
+    ("Kit crochetage", "picklock_kit", "picklock.png"),
+    ("Detecteur", "metal_detector", "detecteur.png"),
+    ("Patte lapin", "rabbit_foot", "pattelapin.png"),
+]
+
+def grid_cell_size(grid: Grid) -> Tuple[int, int]:
+    """Taille (largeur, hauteur) d'une case de la grille à l'écran."""
+    return GRID_AREA_WIDTH // grid.cols, GRID_AREA_HEIGHT // grid.rows
+
 
 def draw_grid(surface: pygame.Surface, grid: Grid, player_pos: Tuple[int,int], cursor_pos: Tuple[int,int]):
     """Dessine la grille et les salles."""
+    draw_grid_cells(surface, grid)
+    draw_grid_highlights(surface, grid, player_pos, cursor_pos)
+
+
+def draw_grid_cells(surface: pygame.Surface, grid: Grid):
+    """Dessine la partie statique de la grille: fond, salles et lignes."""
     area_w = GRID_AREA_WIDTH
     area_h = GRID_AREA_HEIGHT
-    cell_w = area_w // grid.cols
-    cell_h = area_h // grid.rows
+    cell_w, cell_h = grid_cell_size(grid)
 
     # Background
     grid_rect = pygame.Rect(0, 0, area_w, area_h)
@@ -30,13 +58,18 @@ def draw_grid(surface: pygame.Surface, grid: Grid, player_pos: Tuple[int,int], c
             if room is None:
                 pygame.draw.rect(surface, UNKNOWN_ROOM_COLOR, cell_rect)
             else:
-                if hasattr(room, "image") and room.image:
-                    img = pygame.transform.scale(room.image, (cell_w, cell_h))
+                img = room.image_at((cell_w, cell_h)) if hasattr(room, "image_at") else None
+                if img is not None:
                     surface.blit(img, (x, y))
                 else:
                     pygame.draw.rect(surface, room.color, cell_rect)
             pygame.draw.rect(surface, GRID_LINE_COLOR, cell_rect, 1)
 
+
+def draw_grid_highlights(surface: pygame.Surface, grid: Grid, player_pos: Tuple[int,int], cursor_pos: Tuple[int,int]):
+    """Dessine les cadres du joueur et du curseur (partie dynamique de la grille)."""
+    cell_w, cell_h = grid_cell_size(grid)
+
     # Player highlight
     pr, pc = player_pos
     prow = pygame.Rect(pc * cell_w, pr * cell_h, cell_w, cell_h)
@@ -48,9 +81,8 @@ def draw_grid(surface: pygame.Surface, grid: Grid, player_pos: Tuple[int,int], c
     pygame.draw.rect(surface, CURSOR_COLOR, crect, 3)
 
 
-def draw_inventory(surface: pygame.Surface, inventory, font: pygame.font.Font):
-    """Dessine le panneau d'inventaire avec icônes."""
-    x0 = GRID_AREA_WIDTH
+def draw_inventory(surface: pygame.Surface, inventory, font: pygame.font.Font, x0: int = GRID_AREA_WIDTH):
+    """Dessine le panneau d'inventaire avec icônes (x0: bord gauche du panneau)."""
     panel = pygame.Rect(x0, 0, PANEL_WIDTH, WINDOW_HEIGHT)
     pygame.draw.rect(surface, GRAY, panel)
 
@@ -61,19 +93,11 @@ def draw_inventory(surface: pygame.Surface, inventory, font: pygame.font.Font):
     y += 30
 
     # Consumables
-    consumables = [
-        ("Pas", inventory.steps, "steps.png"),
-        ("Gemmes", inventory.gems, "gem.png"),
-        ("Clés", inventory.keys, "key.png"),
-        ("Dés", inventory.dice, "dice.png"),
-        ("Pièces", inventory.gold, "gold.png"),
-    ]
-    icon_size = 24
-    for name, count, icon_file in consumables:
-        icon_path = os.path.join(ICON_DIR, icon_file)
-        if os.path.exists(icon_path):
-            icon_img = pygame.image.load(icon_path).convert_alpha()
-            icon_img = pygame.transform.scale(icon_img, (icon_size, icon_size))
+    icon_size = ICON_SIZE
+    for name, field, icon_file in CONSUMABLE_ICONS:
+        count = getattr(inventory, field)
+        icon_img = images.load(os.path.join(ICON_DIR, icon_file), (icon_size, icon_size))
+        if icon_img is not None:
             surface.blit(icon_img, (x0 + margin, y))
         s = font.render(f"{name}: {count}", True, BLACK)
         surface.blit(s, (x0 + margin + icon_size + 6, y + 2))
@@ -84,22 +108,14 @@ def draw_inventory(surface: pygame.Surface, inventory, font: pygame.font.Font):
     surface.blit(perm_title, (x0 + margin, y))
     y += 22
 
-    permanents = [
-        ("Pelle", inventory.shovel, "pelle.png"),
-        ("Marteau", inventory.hammer, "marteau.png"),
-        ("Kit crochetage", inventory.picklock_kit, "picklock.png"),
-        ("Detecteur", inventory.metal_detector, "detecteur.png"),
-        ("Patte lapin", inventory.rabbit_foot, "pattelapin.png"),
-    ]
-    for name, have, icon_file in permanents:
+    for name, field, icon_file in PERMANENT_ICONS:
+        have = getattr(inventory, field)
         icon_path = os.path.join(ICON_DIR, icon_file)
-        if os.path.exists(icon_path):
-            icon_img = pygame.image.load(icon_path).convert_alpha()
-            icon_img = pygame.transform.scale(icon_img, (icon_size, icon_size))
+        icon_img = images.load(icon_path, (icon_size, icon_size))
+        if icon_img is not None:
             surface.blit(icon_img, (x0 + margin, y))
         else:
             pygame.draw.rect(surface, DARK_GRAY, (x0 + margin, y, icon_size, icon_size))
-            print(f"Icon not found: {icon_path}")
         s = font.render(f"{name}: {'✓' if have else 'x'}", True, BLACK)
         surface.blit(s, (x0 + margin + icon_size + 6, y + 2))
         y += icon_size + 6
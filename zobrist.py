@@ -0,0 +1,60 @@
+# zobrist.py
+"""
+Hachage de Zobrist de l'état de jeu (64 bits).
+
+Chaque élément d'état a une clé aléatoire fixe; l'empreinte d'un objet est
+le XOR des clés de ce qu'il contient:
+    - Grid: (case, nom de la salle) pour chaque salle posée, (case) pour
+      chaque case découverte
+    - Player: (ligne, colonne)
+    - Inventory: (champ, valeur) pour chaque champ
+Grid.set_room / discover, Player (row, col) et les champs de l'Inventory
+mettent à jour leur attribut `zobrist` en O(1) à chaque modification (XOR de
+l'ancienne clé puis de la nouvelle); state_hash() les combine. Deux états
+égaux ont donc la même empreinte, quel que soit le chemin pour y arriver.
+
+Les clés sont dérivées de blake2b: stables d'un processus à l'autre (on peut
+les stocker sur disque), contrairement à hash() sur les str.
+"""
+
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def key(*parts) -> int:
+    """Clé 64 bits déterministe; le premier élément ("room", "player"...) sépare les domaines."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8, person=b"bp-zobrist").digest()
+    return int.from_bytes(digest, "little")
+
+
+def room_key(r: int, c: int, room) -> int:
+    return key("room", r, c, room.name) if room is not None else 0
+
+
+def discovered_key(r: int, c: int) -> int:
+    return key("discovered", r, c)
+
+
+def position_key(r: int, c: int) -> int:
+    return key("player", r, c)
+
+
+def field_key(name: str, value) -> int:
+    return key("inventory", name, int(value))
+
+
+def grid_hash(grid) -> int:
+    """Empreinte complète d'une grille (recalcul, utilisé après une modification directe)."""
+    h = 0
+    for r in range(grid.rows):
+        for c in range(grid.cols):
+            h ^= room_key(r, c, grid.grid[r][c])
+            if grid.discovered[r][c]:
+                h ^= discovered_key(r, c)
+    return h
+
+
+def state_hash(grid, player, inventory) -> int:
+    """Empreinte de la partie, en O(1)."""
+    return grid.zobrist ^ player.zobrist ^ inventory.zobrist